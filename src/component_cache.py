@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import shutil
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from .model import ModelBuffers
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ".cache/components"
+DEFAULT_CACHE_MB = 256.0
+
+_SOURCE_VERSIONS: Dict[Callable[..., Any], str] = {}
+
+
+def _package_modules(name: str) -> List[str]:
+    """``name`` plus every module of this package it imports from, transitively."""
+    package = __name__.rpartition(".")[0] + "."
+    found: List[str] = []
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        module = sys.modules.get(current)
+        if current in found or module is None:
+            continue
+        found.append(current)
+        for value in vars(module).values():
+            source = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+            if isinstance(source, str) and source.startswith(package) and source not in found:
+                pending.append(source)
+    return sorted(found)
+
+
+def source_version(builder: Callable[..., Any]) -> str:
+    """Hash of ``builder``'s source and every package module its module imports from.
+
+    Builders share helpers across modules (plan, terrain, predicates,
+    triangulate...), so an edit to any of them changes every component's
+    source version.  Fixed at first use per process.
+    """
+    version = _SOURCE_VERSIONS.get(builder)
+    if version is None:
+        digest = hashlib.sha256(inspect.getsource(builder).encode("utf-8"))
+        for name in _package_modules(builder.__module__):
+            path = getattr(sys.modules.get(name), "__file__", None)
+            if path:
+                digest.update(Path(path).read_bytes())
+        version = _SOURCE_VERSIONS[builder] = digest.hexdigest()
+    return version
+
+
+def _reads_digest(reads: Mapping[str, Any], missing: List[str]) -> str:
+    payload = json.dumps([sorted(reads.items()), sorted(missing)], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ComponentCache:
+    """Content-addressed on-disk store of model component buffers.
+
+    Each entry is a directory ``<component>-<source>-<plan>-<reads>`` holding
+    ``meta.json`` (the config reads it depends on and its bucket list) and one
+    ``.npy`` file per vertex/face array, which ``load`` memory-maps.  A hit
+    touches ``meta.json``; ``evict`` drops least recently used entries until
+    the directory is under ``max_bytes``.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ComponentCache | None":
+        """Cache configured by ``component_cache_dir`` / ``component_cache_mb``; None when disabled."""
+        location = str(config.get("component_cache_dir", DEFAULT_CACHE_DIR) or "")
+        size_mb = float(config.get("component_cache_mb", DEFAULT_CACHE_MB))
+        if not location or size_mb <= 0.0:
+            return None
+        root = Path(location)
+        if not root.is_absolute():
+            root = PROJECT_ROOT / root
+        return cls(root, int(size_mb * 1024 * 1024))
+
+    def _prefix(self, name: str, builder: Callable[..., Any], plan_fingerprint: str) -> str:
+        return f"{name}-{source_version(builder)[:16]}-{plan_fingerprint[:16]}-"
+
+    def load(
+        self,
+        name: str,
+        builder: Callable[..., Any],
+        plan_fingerprint: str,
+        matches: Callable[[Dict[str, Any], List[str]], bool],
+    ) -> Tuple[Dict[str, Any], List[str], ModelBuffers] | None:
+        """A stored entry whose reads satisfy ``matches(reads, missing)``, memory-mapped."""
+        if not self.root.is_dir():
+            return None
+        for entry in sorted(self.root.glob(self._prefix(name, builder, plan_fingerprint) + "*")):
+            meta_path = entry / "meta.json"
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                if not matches(meta["reads"], meta["missing"]):
+                    continue
+                buffers: ModelBuffers = [
+                    (
+                        component,
+                        material,
+                        np.load(entry / f"{index}.vertices.npy", mmap_mode="r"),
+                        np.load(entry / f"{index}.faces.npy", mmap_mode="r"),
+                    )
+                    for index, (component, material) in enumerate(meta["buckets"])
+                ]
+                os.utime(meta_path)
+            except (OSError, ValueError, KeyError):
+                # Entries appear complete (os.replace), so this one was evicted
+                # meanwhile or damaged on disk: drop it so a store rewrites it.
+                shutil.rmtree(entry, ignore_errors=True)
+                continue
+            return meta["reads"], meta["missing"], buffers
+        return None
+
+    def store(
+        self,
+        name: str,
+        builder: Callable[..., Any],
+        plan_fingerprint: str,
+        reads: Mapping[str, Any],
+        missing: List[str],
+        buffers: ModelBuffers,
+    ) -> None:
+        entry = self.root / (self._prefix(name, builder, plan_fingerprint) + _reads_digest(reads, missing)[:16])
+        if entry.exists():
+            return
+        staging = self.root / f".{entry.name}.{os.getpid()}"
+        try:
+            staging.mkdir(parents=True, exist_ok=True)
+            for index, (_component, _material, vertices, faces) in enumerate(buffers):
+                np.save(staging / f"{index}.vertices.npy", np.ascontiguousarray(vertices))
+                np.save(staging / f"{index}.faces.npy", np.ascontiguousarray(faces))
+            meta = {
+                "component": name,
+                "reads": dict(reads),
+                "missing": list(missing),
+                "buckets": [[component, material] for component, material, _v, _f in buffers],
+            }
+            (staging / "meta.json").write_text(json.dumps(meta, default=str), encoding="utf-8")
+            os.replace(staging, entry)
+        except OSError:
+            pass  # another process stored it first, or the disk is read-only
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def evict(self) -> List[str]:
+        """Remove least recently used entries beyond ``max_bytes``; returns their names."""
+        if not self.root.is_dir():
+            return []
+        entries = []
+        total = 0
+        for entry in self.root.iterdir():
+            meta_path = entry / "meta.json"
+            if entry.name.startswith(".") or not meta_path.exists():
+                continue
+            size = sum(path.stat().st_size for path in entry.iterdir())
+            entries.append((meta_path.stat().st_mtime, entry, size))
+            total += size
+        removed: List[str] = []
+        for _mtime, entry, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed.append(entry.name)
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -4,13 +4,15 @@ import json
 import math
 from pathlib import Path
 import struct
-from typing import Callable, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 import numpy as np
 from shapely.geometry import Point, Polygon
 
-from .model import ModelData, Triangle3D
+from .meshopt import decode_filter_oct, encode_filter_oct, encode_index_buffer, encode_vertex_buffer
+from .model import MeshBuffer, ModelData, Triangle3D
 from .plan import PlanGeometry
+from .vertex_cache import optimize_vertex_cache
 
 Point2D = Tuple[float, float]
 Point3D = Tuple[float, float, float]
@@ -52,16 +54,89 @@ MATERIALS: Dict[str, Dict[str, object]] = {
 }
 
 
-def _face_normal(a: Point3D, b: Point3D, c: Point3D) -> Point3D:
-    ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
-    vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
-    nx = uy * vz - uz * vy
-    ny = uz * vx - ux * vz
-    nz = ux * vy - uy * vx
-    mag = math.sqrt(nx * nx + ny * ny + nz * nz)
-    if mag == 0:
-        return (0.0, 0.0, 1.0)
-    return nx / mag, ny / mag, nz / mag
+# Welded GLB vertices are shared by faces whose normals match to this per axis.
+WELD_NORMAL_TOLERANCE = 1e-5
+# Most vertices a primitive can have with UNSIGNED_SHORT indices (65535 is reserved).
+UINT16_VERTEX_LIMIT = 65535
+# Quantized positions use signed shorts in -QUANTIZED_RANGE..QUANTIZED_RANGE.
+QUANTIZED_RANGE = 32767
+
+
+def face_normals(tris: np.ndarray) -> np.ndarray:
+    """Unit normals of ``(N, 3, 3)`` triangles; degenerate faces get ``(0, 0, 1)``."""
+    n = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    mag = np.sqrt(n[:, 0] * n[:, 0] + n[:, 1] * n[:, 1] + n[:, 2] * n[:, 2])
+    degenerate = mag == 0.0
+    n /= np.where(degenerate, 1.0, mag)[:, None]
+    n[degenerate] = (0.0, 0.0, 1.0)
+    return n
+
+
+def flat_shaded_vertices(
+    faces: np.ndarray, normals: np.ndarray, tolerance: float = WELD_NORMAL_TOLERANCE
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Weld the corners of ``(m, 3)`` faces that share a vertex and a face normal.
+
+    Crease-aware: a vertex is split once per distinct (quantized) normal among
+    its faces, so every face stays flat-shaded while coplanar neighbours share
+    corners.  Returns ``(source, vertex_normals, faces)`` where ``source[i]``
+    is the input vertex behind output vertex ``i``, in first-use order.
+    """
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    quantized = np.rint(normals / tolerance).astype(np.int64) + (1 << 20)
+    packed = (quantized[:, 0] << 42) | (quantized[:, 1] << 21) | quantized[:, 2]
+    normal_keys, normal_id = np.unique(packed, return_inverse=True)
+    corner_keys = faces * normal_keys.shape[0] + normal_id.reshape(-1, 1)
+    _keys, first, inverse = np.unique(corner_keys.ravel(), return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    remap = np.empty(order.shape[0], dtype=np.int64)
+    remap[order] = np.arange(order.shape[0])
+    corners = first[order]
+    return faces.ravel()[corners], normals[corners // 3], remap[inverse.reshape(-1)].reshape(-1, 3)
+
+
+def position_quantizer(points: np.ndarray) -> Tuple[np.ndarray, float]:
+    """``(offset, step)`` so that ``offset + step * q`` with int16 ``q`` covers ``points``.
+
+    One step for all three axes: a uniform node scale leaves normals unskewed.
+    """
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    step = max(float((hi - lo).max()) / (2 * QUANTIZED_RANGE), 1e-12)
+    return (lo + hi) * 0.5, step
+
+
+def quantize_positions(points: np.ndarray, offset: np.ndarray, step: float) -> np.ndarray:
+    """``(n, 4)`` int16 rows (xyz, padding) for a stride-8 KHR_mesh_quantization buffer."""
+    out = np.zeros((points.shape[0], 4), dtype=np.int16)
+    out[:, :3] = np.clip(np.rint((points - offset) / step), -QUANTIZED_RANGE, QUANTIZED_RANGE)
+    return out
+
+
+def reversed_faces(quantized: np.ndarray, normals: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Mask of ``(m, 3)`` ``faces`` whose winding turns against their vertex ``normals`` once quantized.
+
+    Rounding to the int16 grid can fold a sliver triangle over, so it would
+    render inside out under the normal it is shipped with.
+    """
+    corners = quantized[:, :3].astype(np.float64)[faces]
+    winding = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    return np.einsum("ij,ij->i", winding, normals[faces[:, 0]]) < 0.0
+
+
+def quantize_normals(normals: np.ndarray) -> np.ndarray:
+    """``(n, 4)`` normalized int8 rows (xyz, padding) for a stride-4 buffer."""
+    out = np.zeros((normals.shape[0], 4), dtype=np.int8)
+    out[:, :3] = np.clip(np.rint(normals * 127.0), -127, 127)
+    return out
+
+
+def _indexed_triangles(triangles) -> Tuple[np.ndarray, np.ndarray]:
+    """``(vertices, faces)`` of a bucket; other triangle sequences get 3 vertices per face."""
+    if isinstance(triangles, MeshBuffer):
+        return np.asarray(triangles.vertices, dtype=np.float64), np.asarray(triangles.faces, dtype=np.int64)
+    tris = np.asarray(triangles.array, dtype=np.float64).reshape(-1, 3, 3)
+    return tris.reshape(-1, 3), np.arange(tris.shape[0] * 3, dtype=np.int64).reshape(-1, 3)
 
 
 def write_svg(
@@ -75,9 +150,9 @@ def write_svg(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     all_points: List[Point2D] = (
-        plan.master_triangle
-        + plan.hex_vertices
-        + (plan.courtyard_polygon if include_courtyard else [])
+        list(plan.master_triangle)
+        + list(plan.hex_vertices)
+        + (list(plan.courtyard_polygon) if include_courtyard else [])
         + [pt for wing in plan.wing_polygons.values() for pt in wing]
     )
     min_x = min(p[0] for p in all_points)
@@ -166,21 +241,21 @@ def write_svg(
             f"  <text x=\"{lx:.2f}\" y=\"{ly - 6:.2f}\" text-anchor=\"middle\" style=\"font-family:Arial,sans-serif;font-size:12px;fill:{color};paint-order:stroke;stroke:#ffffff;stroke-width:3px\">{label}</text>"
         )
 
-    hex_centroid = Polygon(plan.hex_vertices).centroid
+    hex_centroid = plan.centroid("atrium")
     hex_c = (hex_centroid.x, hex_centroid.y)
     for i in range(len(plan.hex_vertices)):
         p0 = plan.hex_vertices[i]
         p1 = plan.hex_vertices[(i + 1) % len(plan.hex_vertices)]
         _draw_dimension(p0, p1, hex_c, 3.0, f"{_distance(p0, p1):.1f} ft", color="#4b5f72")
 
-    tri_centroid = Polygon(plan.master_triangle).centroid
+    tri_centroid = plan.centroid("master_triangle")
     tri_c = (tri_centroid.x, tri_centroid.y)
     for i in range(len(plan.master_triangle)):
         p0 = plan.master_triangle[i]
         p1 = plan.master_triangle[(i + 1) % len(plan.master_triangle)]
         _draw_dimension(p0, p1, tri_c, 4.0, f"{_distance(p0, p1):.1f} ft", color="#2a5727")
 
-    triangle_boundary = Polygon(plan.master_triangle).boundary
+    triangle_boundary = plan.polygon("master_triangle").boundary
     for i, hv in enumerate(plan.hex_vertices):
         s = triangle_boundary.project(Point(hv))
         np = triangle_boundary.interpolate(s)
@@ -195,8 +270,8 @@ def write_svg(
         ax, ay = label_point(plan.wing_polygons["A"])
         bx, by = label_point(plan.wing_polygons["B"])
         cx, cy = label_point(plan.wing_polygons["C"])
-        atrium_centroid = Polygon(plan.hex_vertices).centroid
-        triangle_centroid = Polygon(plan.master_triangle).centroid
+        atrium_centroid = plan.centroid("atrium")
+        triangle_centroid = plan.centroid("master_triangle")
         hx, hy = tx((atrium_centroid.x, atrium_centroid.y))
         txp, typ = tx((triangle_centroid.x, triangle_centroid.y))
 
@@ -224,10 +299,10 @@ def write_svg(
             qx, qy = label_point(plan.courtyard_polygon)
             lines.append(f"  <text x=\"{qx:.2f}\" y=\"{qy:.2f}\" style=\"{style}\" text-anchor=\"middle\">Courtyard</text>")
 
-        area_atrium = Polygon(plan.hex_vertices).area
-        area_triangle = Polygon(plan.master_triangle).area
-        area_wings = {name: Polygon(poly).area for name, poly in plan.wing_polygons.items()}
-        area_courtyard = Polygon(plan.courtyard_polygon).area if include_courtyard else 0.0
+        area_atrium = plan.atrium_polygon.area
+        area_triangle = plan.polygon("master_triangle").area
+        area_wings = {name: plan.polygon(f"wing_{name}").area for name in plan.wing_polygons}
+        area_courtyard = plan.polygon("courtyard").area if include_courtyard else 0.0
         if metrics is not None and isinstance(metrics.get("areas"), dict):
             areas = metrics["areas"]
             area_atrium = float(areas.get("atrium", area_atrium))
@@ -295,20 +370,54 @@ def write_svg(
     output_path.write_text("\n".join(lines), encoding="utf-8")
 
 
-def _rotate_x(point: Point3D, degrees: float) -> Point3D:
-    if abs(degrees) < 1e-9:
-        return point
-    r = math.radians(degrees)
-    c = math.cos(r)
-    s = math.sin(r)
-    x, y, z = point
-    return (x, y * c - z * s, y * s + z * c)
+def glb_transform(rotate_x_deg: float = 0.0, scale: float = 1.0) -> np.ndarray:
+    """3x3 matrix rotating about x by ``rotate_x_deg`` and then scaling by ``scale``."""
+    r = math.radians(rotate_x_deg)
+    c, s = (math.cos(r), math.sin(r)) if abs(rotate_x_deg) >= 1e-9 else (1.0, 0.0)
+    return scale * np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
 
 
-def write_glb(model: ModelData, output_path: Path, rotate_x_deg: float = 0.0, feet_to_meters: bool = True) -> None:
-    """Export model as GLB. If feet_to_meters is True, scale all geometry by 0.3048."""
+def write_glb(
+    model: ModelData,
+    output_path: Path,
+    rotate_x_deg: float = 0.0,
+    feet_to_meters: bool = True,
+    weld: bool = False,
+    optimize_cache: bool = False,
+    quantize: bool = False,
+    quantize_tolerance: float | None = None,
+    compress: bool = False,
+) -> Dict[str, Any]:
+    """Export model as GLB. If feet_to_meters is True, scale all geometry by 0.3048.
+
+    Each (component, material) bucket becomes one flat-shaded primitive.  By
+    default every face gets its own 3 vertices; ``weld`` shares vertices
+    between faces with the same normal (``flat_shaded_vertices``), uses
+    UNSIGNED_SHORT indices when a primitive has few enough vertices and, with
+    ``optimize_cache``, orders faces for the GPU vertex cache.
+
+    ``quantize`` stores positions as int16 with a per-node translation and
+    uniform scale, and normals as normalized int8 (``KHR_mesh_quantization``).
+    Components whose worst position error in feet is above
+    ``quantize_tolerance``, or with any face that quantization would turn
+    inside out (``reversed_faces``), stay float32.  Returns ``{"quantized":
+    {component: error_ft}, "float32": {component: error_ft}, "flipped":
+    {component: faces}, "max_error_ft": ...}``, or an empty report when not
+    quantizing.
+
+    ``compress`` (implies ``quantize``) packs each kind of array (positions,
+    normals, indices by size) into one buffer view stored with
+    ``EXT_meshopt_compression`` (``src/meshopt.py``): the attribute codec for
+    vertex streams, octahedral-filtered normals, the triangle codec for
+    indices.  The views also point into a fallback buffer that has no data,
+    so the extension is required.  The report then gains ``"meshopt":
+    {"bytes": ..., "fallback_bytes": ...}``.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    _scale = 0.3048 if feet_to_meters else 1.0
+    quantize = quantize or compress
+    unit = 0.3048 if feet_to_meters else 1.0
+    transform = glb_transform(rotate_x_deg, unit)
+    diagonal = not np.any(transform - np.diag(transform.diagonal()))
 
     component_map = model.triangles_by_component or {}
     if not component_map:
@@ -325,104 +434,222 @@ def write_glb(model: ModelData, output_path: Path, rotate_x_deg: float = 0.0, fe
 
     material_to_index = {name: i for i, name in enumerate(material_order)}
 
-    binary = bytearray()
+    # The BIN chunk is only laid out here (arrays and their 4-byte aligned
+    # offsets); it is streamed to the file after the JSON chunk.
+    segments: List[Any] = []
+    binary_length = 0
     buffer_views: List[Dict[str, object]] = []
     accessors: List[Dict[str, object]] = []
     meshes: List[Dict[str, object]] = []
     nodes: List[Dict[str, object]] = []
 
-    def append_blob(data: bytes, target: int | None = None) -> int:
-        offset = len(binary)
-        binary.extend(data)
-        while len(binary) % 4:
-            binary.append(0)
+    # With ``compress``, arrays of one (target, element size, filter) share a
+    # buffer view, encoded once by ``write_meshopt_views``.
+    pools: Dict[Tuple[int | None, int, str | None], Tuple[int, List[np.ndarray], List[np.ndarray]]] = {}
+
+    def append_blob(
+        array: np.ndarray,
+        target: int | None = None,
+        stride: int | None = None,
+        encoded: np.ndarray | None = None,
+        filter_name: str | None = None,
+    ) -> Tuple[int, int]:
+        """``(buffer view, byte offset)`` of ``array`` once appended.
+
+        When compressing, ``encoded`` is what the meshopt stream carries if it
+        differs from ``array`` (the input of ``filter_name``).
+        """
+        if compress:
+            key = (target, array.itemsize * (array.shape[1] if array.ndim > 1 else 1), filter_name)
+            if key not in pools:
+                buffer_views.append({})
+                pools[key] = (len(buffer_views) - 1, [], [])
+            view, arrays, sources = pools[key]
+            offset = sum(part.nbytes for part in arrays)
+            arrays.append(array)
+            sources.append(array if encoded is None else encoded)
+            return view, offset
+
         view: Dict[str, object] = {
             "buffer": 0,
-            "byteOffset": offset,
-            "byteLength": len(data),
+            "byteOffset": append_segment(array),
+            "byteLength": array.nbytes,
         }
         if target is not None:
             view["target"] = target
+        if stride is not None:
+            view["byteStride"] = stride
         buffer_views.append(view)
-        return len(buffer_views) - 1
+        return len(buffer_views) - 1, 0
+
+    def append_segment(data: Any) -> int:
+        """Offset in the BIN chunk of ``data`` (an array or bytes) once appended."""
+        nonlocal binary_length
+        offset = binary_length
+        if isinstance(data, np.ndarray):
+            data = np.ascontiguousarray(data)
+        segments.append(data)
+        binary_length += (memoryview(data).nbytes + 3) & ~3
+        return offset
+
+    def write_meshopt_views() -> int:
+        """Encode the pooled views into the BIN chunk; returns the fallback buffer's length."""
+        fallback_length = 0
+        for (target, element, filter_name), (view, arrays, sources) in pools.items():
+            length = sum(part.nbytes for part in arrays)
+            source = np.concatenate(sources)
+            if target == 34963:
+                packed = encode_index_buffer(source)
+                extension: Dict[str, object] = {"mode": "TRIANGLES"}
+            else:
+                packed = encode_vertex_buffer(source.view(np.uint8).reshape(source.shape[0], element))
+                extension = {"mode": "ATTRIBUTES"}
+            if filter_name is not None:
+                extension["filter"] = filter_name
+            buffer_views[view] = {"buffer": 1, "byteOffset": fallback_length, "byteLength": length}
+            if target is not None:
+                buffer_views[view]["target"] = target
+            if target != 34963:
+                buffer_views[view]["byteStride"] = element
+            buffer_views[view]["extensions"] = {
+                "EXT_meshopt_compression": {
+                    "buffer": 0,
+                    "byteOffset": append_segment(packed),
+                    "byteLength": len(packed),
+                    "byteStride": element,
+                    "count": source.shape[0],
+                    **extension,
+                }
+            }
+            fallback_length += (length + 3) & ~3
+        return fallback_length
 
     def add_accessor(
-        buffer_view: int,
+        blob: Tuple[int, int],
         component_type: int,
         count: int,
         value_type: str,
         min_vals: List[float] | None = None,
         max_vals: List[float] | None = None,
+        normalized: bool = False,
     ) -> int:
         accessor: Dict[str, object] = {
-            "bufferView": buffer_view,
+            "bufferView": blob[0],
             "componentType": component_type,
             "count": count,
             "type": value_type,
         }
+        if blob[1]:
+            accessor["byteOffset"] = blob[1]
         if min_vals is not None:
             accessor["min"] = min_vals
         if max_vals is not None:
             accessor["max"] = max_vals
+        if normalized:
+            accessor["normalized"] = True
         accessors.append(accessor)
         return len(accessors) - 1
 
+    report: Dict[str, Any] = {"quantized": {}, "float32": {}, "flipped": {}} if quantize else {}
     sorted_components = sorted(component_map.keys())
     for component_name in sorted_components:
         comp_materials = component_map[component_name]
-        primitives: List[Dict[str, object]] = []
+        parts: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]] = []
 
         for material_name in material_order:
-            triangles = comp_materials.get(material_name, [])
-            if not triangles:
+            triangles = comp_materials.get(material_name)
+            if triangles is None or not len(triangles):
                 continue
 
-            positions: List[Point3D] = []
-            normals: List[Point3D] = []
-            indices: List[int] = []
-            cursor = 0
-
-            for tri in triangles:
-                a, b, c = tri
-                if rotate_x_deg:
-                    a = _rotate_x(a, rotate_x_deg)
-                    b = _rotate_x(b, rotate_x_deg)
-                    c = _rotate_x(c, rotate_x_deg)
-                if _scale != 1.0:
-                    a = (a[0] * _scale, a[1] * _scale, a[2] * _scale)
-                    b = (b[0] * _scale, b[1] * _scale, b[2] * _scale)
-                    c = (c[0] * _scale, c[1] * _scale, c[2] * _scale)
-                n = _face_normal(a, b, c)
-                positions.extend((a, b, c))
-                normals.extend((n, n, n))
-                indices.extend((cursor, cursor + 1, cursor + 2))
-                cursor += 3
-
-            pos_arr = np.asarray(positions, dtype=np.float32)
-            nrm_arr = np.asarray(normals, dtype=np.float32)
-            idx_arr = np.asarray(indices, dtype=np.uint32)
-
-            pos_view = append_blob(pos_arr.tobytes(), target=34962)
-            nrm_view = append_blob(nrm_arr.tobytes(), target=34962)
-            idx_view = append_blob(idx_arr.tobytes(), target=34963)
-
-            pos_accessor = add_accessor(
-                pos_view,
-                component_type=5126,
-                count=pos_arr.shape[0],
-                value_type="VEC3",
-                min_vals=[float(v) for v in np.min(pos_arr, axis=0)],
-                max_vals=[float(v) for v in np.max(pos_arr, axis=0)],
-            )
-            nrm_accessor = add_accessor(
-                nrm_view,
-                component_type=5126,
-                count=nrm_arr.shape[0],
-                value_type="VEC3",
-            )
+            vertices, faces = _indexed_triangles(triangles)
+            if diagonal:
+                # Plain scaling: skip the matmul's zero terms (they turn -0.0 into 0.0).
+                points = vertices * transform.diagonal()
+            else:
+                points = vertices @ transform.T
+            normals = face_normals(points[faces])
+            if weld:
+                source, vertex_normals, faces = flat_shaded_vertices(faces, normals)
+                if optimize_cache:
+                    faces, vertex_order = optimize_vertex_cache(faces, source.shape[0])
+                    source, vertex_normals = source[vertex_order], vertex_normals[vertex_order]
+                small = source.shape[0] <= UINT16_VERTEX_LIMIT
+                parts.append(
+                    (material_name, points[source], vertex_normals, faces.ravel().astype(np.uint16 if small else np.uint32))
+                )
+            else:
+                positions = points[faces].reshape(-1, 3)
+                parts.append(
+                    (material_name, positions, np.repeat(normals, 3, axis=0), np.arange(positions.shape[0], dtype=np.uint32))
+                )
+        if not parts:
+            continue
+
+        node: Dict[str, object] = {}
+        quantizer = None
+        if quantize:
+            offset, step = position_quantizer(np.concatenate([positions for _m, positions, _n, _i in parts]))
+            error = 0.0
+            flipped = 0
+            for _m, positions, normals, idx_arr in parts:
+                quantized = quantize_positions(positions, offset, step)
+                error = max(error, float(np.linalg.norm(offset + step * quantized[:, :3] - positions, axis=1).max()) / unit)
+                flipped += int(reversed_faces(quantized, normals, idx_arr.reshape(-1, 3).astype(np.int64)).sum())
+            if flipped:
+                report["flipped"][component_name] = flipped
+            if flipped or (quantize_tolerance is not None and error > quantize_tolerance):
+                report["float32"][component_name] = error
+            else:
+                report["quantized"][component_name] = error
+                quantizer = (offset, step)
+                node = {"translation": [float(v) for v in offset], "scale": [step] * 3}
+
+        primitives: List[Dict[str, object]] = []
+        for material_name, positions, normals, idx_arr in parts:
+            if quantizer is not None:
+                pos_arr = quantize_positions(positions, *quantizer)
+                pos_view = append_blob(pos_arr, target=34962, stride=8)
+                if compress:
+                    octahedral = encode_filter_oct(normals)
+                    nrm_view = append_blob(
+                        decode_filter_oct(octahedral), target=34962, stride=4, encoded=octahedral, filter_name="OCTAHEDRAL"
+                    )
+                else:
+                    nrm_view = append_blob(quantize_normals(normals), target=34962, stride=4)
+                pos_accessor = add_accessor(
+                    pos_view,
+                    component_type=5122,
+                    count=pos_arr.shape[0],
+                    value_type="VEC3",
+                    min_vals=[int(v) for v in np.min(pos_arr[:, :3], axis=0)],
+                    max_vals=[int(v) for v in np.max(pos_arr[:, :3], axis=0)],
+                )
+                nrm_accessor = add_accessor(
+                    nrm_view, component_type=5120, count=pos_arr.shape[0], value_type="VEC3", normalized=True
+                )
+            else:
+                pos_arr = positions.astype(np.float32)
+                nrm_arr = normals.astype(np.float32)
+                pos_view = append_blob(pos_arr, target=34962)
+                nrm_view = append_blob(nrm_arr, target=34962)
+                pos_accessor = add_accessor(
+                    pos_view,
+                    component_type=5126,
+                    count=pos_arr.shape[0],
+                    value_type="VEC3",
+                    min_vals=[float(v) for v in np.min(pos_arr, axis=0)],
+                    max_vals=[float(v) for v in np.max(pos_arr, axis=0)],
+                )
+                nrm_accessor = add_accessor(
+                    nrm_view,
+                    component_type=5126,
+                    count=nrm_arr.shape[0],
+                    value_type="VEC3",
+                )
+            idx_view = append_blob(idx_arr, target=34963)
             idx_accessor = add_accessor(
                 idx_view,
-                component_type=5125,
+                component_type=5123 if idx_arr.dtype == np.uint16 else 5125,
                 count=idx_arr.shape[0],
                 value_type="SCALAR",
             )
@@ -438,11 +665,11 @@ def write_glb(model: ModelData, output_path: Path, rotate_x_deg: float = 0.0, fe
                 }
             )
 
-        if primitives:
-            mesh_index = len(meshes)
-            meshes.append({"name": component_name, "primitives": primitives})
-            nodes.append({"mesh": mesh_index, "name": component_name})
+        mesh_index = len(meshes)
+        meshes.append({"name": component_name, "primitives": primitives})
+        nodes.append({"mesh": mesh_index, "name": component_name, **node})
 
+    fallback_length = write_meshopt_views() if compress else 0
     gltf = {
         "asset": {"version": "2.0", "generator": "exploded-hexagon-home/src.export.py"},
         "scene": 0,
@@ -450,24 +677,36 @@ def write_glb(model: ModelData, output_path: Path, rotate_x_deg: float = 0.0, fe
         "nodes": nodes,
         "meshes": meshes,
         "materials": [MATERIALS.get(name, MATERIALS["concrete"]) for name in material_order],
-        "buffers": [{"byteLength": len(binary)}],
+        "buffers": [{"byteLength": binary_length}],
         "bufferViews": buffer_views,
         "accessors": accessors,
     }
+    extensions = []
+    if report.get("quantized"):
+        extensions.append("KHR_mesh_quantization")
+        report["max_error_ft"] = max(report["quantized"].values())
+    if compress:
+        # The fallback buffer has no data, so loaders must decode the views.
+        gltf["buffers"].append({"byteLength": fallback_length, "extensions": {"EXT_meshopt_compression": {"fallback": True}}})
+        extensions.append("EXT_meshopt_compression")
+        report["meshopt"] = {"bytes": binary_length, "fallback_bytes": fallback_length}
+    if extensions:
+        gltf["extensionsUsed"] = extensions
+        gltf["extensionsRequired"] = list(extensions)
 
     json_chunk = json.dumps(gltf, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
     while len(json_chunk) % 4:
         json_chunk += b" "
 
-    bin_chunk = bytes(binary)
-    while len(bin_chunk) % 4:
-        bin_chunk += b"\x00"
-
-    total_len = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    total_len = 12 + 8 + len(json_chunk) + 8 + binary_length
     with output_path.open("wb") as fh:
         fh.write(struct.pack("<4sII", b"glTF", 2, total_len))
         fh.write(struct.pack("<I4s", len(json_chunk), b"JSON"))
         fh.write(json_chunk)
-        fh.write(struct.pack("<I4s", len(bin_chunk), b"BIN\x00"))
-        fh.write(bin_chunk)
+        fh.write(struct.pack("<I4s", binary_length, b"BIN\x00"))
+        # One write per array, straight from its memory; no joined BIN copy.
+        for segment in segments:
+            fh.write(segment)
+            fh.write(b"\x00" * (-memoryview(segment).nbytes % 4))
 
+    return report
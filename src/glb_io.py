@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import json
+import mmap
+from pathlib import Path
+import struct
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .export import MATERIALS, glb_transform
+from .meshopt import decode_filter_oct, decode_index_buffer, decode_vertex_buffer
+from .model import ModelData
+
+COMPONENT_DTYPES: Dict[int, type] = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+# Largest index value per index component type; glTF reserves it (primitive restart).
+RESERVED_INDEX = {5121: 0xFF, 5123: 0xFFFF, 5125: 0xFFFFFFFF}
+# Float accessor bounds may differ from the data by this much (relative).
+BOUNDS_TOLERANCE = 1e-6
+
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+_MESHOPT = "EXT_meshopt_compression"
+
+
+class GlbFile:
+    """A memory-mapped ``.glb``: its glTF JSON plus zero-copy accessor arrays.
+
+    ``accessor(i)`` is an ``np.ndarray`` over the mapped BIN chunk (read-only;
+    ``byteOffset`` and ``byteStride`` become the array's offset and strides).
+    Views compressed with ``EXT_meshopt_compression`` are decoded once and
+    cached instead.  Arrays keep the mapping alive, so drop them before
+    ``close``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = len(self._map)
+        self._decoded: Dict[int, bytes] = {}
+        try:
+            self.gltf, self.bin_offset, self.bin_length = self._parse()
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _parse(self) -> Tuple[Dict[str, Any], int, int]:
+        if self.size < 20:
+            raise ValueError(f"{self.path}: too short for a GLB header")
+        magic, version, length = struct.unpack_from("<4sII", self._map, 0)
+        if magic != b"glTF" or version != 2:
+            raise ValueError(f"{self.path}: not a glTF 2.0 binary")
+        if length > self.size:
+            raise ValueError(f"{self.path}: header length {length} exceeds file size {self.size}")
+        chunks: List[Tuple[int, int, int]] = []
+        offset = 12
+        while offset + 8 <= length:
+            chunk_length, chunk_type = struct.unpack_from("<II", self._map, offset)
+            if offset + 8 + chunk_length > length:
+                raise ValueError(f"{self.path}: chunk at byte {offset} runs past the end")
+            chunks.append((chunk_type, offset + 8, chunk_length))
+            offset += 8 + chunk_length
+        if not chunks or chunks[0][0] != _CHUNK_JSON:
+            raise ValueError(f"{self.path}: first chunk is not JSON")
+        _type, start, chunk_length = chunks[0]
+        gltf = json.loads(bytes(self._map[start : start + chunk_length]).decode("utf-8"))
+        binary = [chunk for chunk in chunks[1:] if chunk[0] == _CHUNK_BIN]
+        return gltf, (binary[0][1] if binary else 0), (binary[0][2] if binary else 0)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "GlbFile":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _view_bytes(self, index: int) -> Tuple[Any, int]:
+        """``(buffer, offset)`` holding the bytes of buffer view ``index``."""
+        view = self.gltf["bufferViews"][index]
+        extension = view.get("extensions", {}).get(_MESHOPT)
+        if extension is None:
+            if view["buffer"] != 0 or "uri" in self.gltf["buffers"][0]:
+                raise ValueError(f"bufferView {index}: only the GLB's own BIN chunk can be read")
+            return self._map, self.bin_offset + view.get("byteOffset", 0)
+        if index not in self._decoded:
+            start = self.bin_offset + extension.get("byteOffset", 0)
+            packed = self._map[start : start + extension["byteLength"]]
+            count, stride = extension["count"], extension["byteStride"]
+            if extension["mode"] == "TRIANGLES":
+                indices = decode_index_buffer(packed, count)
+                data = indices.astype(np.uint16 if stride == 2 else np.uint32).tobytes()
+            elif extension["mode"] == "ATTRIBUTES":
+                decoded = decode_vertex_buffer(packed, count, stride)
+                if extension.get("filter", "NONE") == "OCTAHEDRAL" and stride == 4:
+                    decoded = decode_filter_oct(decoded.view(np.int8))
+                elif extension.get("filter", "NONE") != "NONE":
+                    raise ValueError(f"bufferView {index}: meshopt filter {extension['filter']} is not supported")
+                data = decoded.tobytes()
+            else:
+                raise ValueError(f"bufferView {index}: meshopt mode {extension['mode']} is not supported")
+            self._decoded[index] = data
+        return self._decoded[index], 0
+
+    def accessor(self, index: int) -> np.ndarray:
+        """``(count, components)`` array of accessor ``index`` (``(count,)`` for scalars), raw values."""
+        accessor = self.gltf["accessors"][index]
+        if "sparse" in accessor:
+            raise ValueError(f"accessor {index}: sparse accessors are not supported")
+        dtype = np.dtype(COMPONENT_DTYPES[accessor["componentType"]])
+        width = TYPE_SIZES[accessor["type"]]
+        count = accessor["count"]
+        if "bufferView" not in accessor:
+            return np.zeros((count, width) if width > 1 else count, dtype=dtype)
+        view = self.gltf["bufferViews"][accessor["bufferView"]]
+        stride = view.get("byteStride", dtype.itemsize * width)
+        buffer, offset = self._view_bytes(accessor["bufferView"])
+        shape: Tuple[int, ...] = (count, width) if width > 1 else (count,)
+        strides: Tuple[int, ...] = (stride, dtype.itemsize) if width > 1 else (stride,)
+        return np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset + accessor.get("byteOffset", 0), strides=strides)
+
+    def accessor_float(self, index: int) -> np.ndarray:
+        """``accessor`` as float64, with normalized integers mapped to -1..1 / 0..1."""
+        values = self.accessor(index).astype(np.float64)
+        accessor = self.gltf["accessors"][index]
+        if accessor.get("normalized"):
+            info = np.iinfo(COMPONENT_DTYPES[accessor["componentType"]])
+            values = np.maximum(values / info.max, -1.0)
+        return values
+
+
+def read_glb(path: Path) -> GlbFile:
+    return GlbFile(path)
+
+
+def _accessor_fits(glb: GlbFile, index: int) -> List[str]:
+    gltf = glb.gltf
+    accessor = gltf["accessors"][index]
+    issues: List[str] = []
+    if "bufferView" not in accessor:
+        return issues
+    if accessor.get("componentType") not in COMPONENT_DTYPES or accessor.get("type") not in TYPE_SIZES:
+        return [f"accessor {index}: unknown componentType/type"]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    itemsize = np.dtype(COMPONENT_DTYPES[accessor["componentType"]]).itemsize
+    element = itemsize * TYPE_SIZES[accessor["type"]]
+    stride = view.get("byteStride", element)
+    offset = accessor.get("byteOffset", 0)
+    if (view.get("byteOffset", 0) + offset) % itemsize:
+        issues.append(f"accessor {index}: offset {view.get('byteOffset', 0) + offset} not aligned to {itemsize} bytes")
+    if stride % itemsize or stride < element:
+        issues.append(f"accessor {index}: byteStride {stride} does not fit {element}-byte elements")
+    if accessor["count"] and offset + stride * (accessor["count"] - 1) + element > view["byteLength"]:
+        issues.append(f"accessor {index}: runs past the end of bufferView {accessor['bufferView']}")
+    return issues
+
+
+def validate_glb(glb: GlbFile) -> List[str]:
+    """Problems found in ``glb``, as messages (empty when it is clean).
+
+    Checks chunk and buffer view bounds, accessor alignment and extent,
+    accessor ``min``/``max`` against the data (required on POSITION), equal
+    attribute counts per primitive and index ranges (in bounds, not the
+    reserved restart value, whole triangles).
+    """
+    gltf = glb.gltf
+    issues: List[str] = []
+    header_length = struct.unpack_from("<I", glb._map, 8)[0]
+    if header_length != glb.size:
+        issues.append(f"header length {header_length} != file size {glb.size}")
+    if glb.bin_length % 4:
+        issues.append(f"BIN chunk length {glb.bin_length} is not a multiple of 4")
+    buffers = gltf.get("buffers", [])
+    if buffers and buffers[0].get("byteLength", 0) > glb.bin_length and "uri" not in buffers[0]:
+        issues.append(f"buffer 0 byteLength {buffers[0]['byteLength']} exceeds the BIN chunk ({glb.bin_length})")
+
+    for index, view in enumerate(gltf.get("bufferViews", [])):
+        buffer = buffers[view["buffer"]] if view.get("buffer", -1) < len(buffers) else None
+        if buffer is None:
+            issues.append(f"bufferView {index}: unknown buffer {view.get('buffer')}")
+            continue
+        if view.get("byteOffset", 0) + view["byteLength"] > buffer["byteLength"]:
+            issues.append(f"bufferView {index}: runs past the end of buffer {view['buffer']}")
+        stride = view.get("byteStride")
+        if stride is not None and (stride % 4 or not 4 <= stride <= 252):
+            issues.append(f"bufferView {index}: byteStride {stride} must be a multiple of 4 in 4..252")
+        extension = view.get("extensions", {}).get(_MESHOPT)
+        if extension is not None and extension.get("byteOffset", 0) + extension["byteLength"] > buffers[extension["buffer"]]["byteLength"]:
+            issues.append(f"bufferView {index}: meshopt stream runs past the end of buffer {extension['buffer']}")
+
+    readable = set()
+    for index, accessor in enumerate(gltf.get("accessors", [])):
+        problems = _accessor_fits(glb, index)
+        issues.extend(problems)
+        if problems or "bufferView" not in accessor:
+            continue
+        try:
+            values = glb.accessor(index)
+        except ValueError as exc:
+            issues.append(f"accessor {index}: {exc}")
+            continue
+        readable.add(index)
+        if "min" not in accessor or "max" not in accessor or not accessor["count"]:
+            continue
+        data = values.reshape(accessor["count"], -1).astype(np.float64)
+        for name, stored, actual in (("min", accessor["min"], data.min(axis=0)), ("max", accessor["max"], data.max(axis=0))):
+            stored = np.asarray(stored, dtype=np.float64)
+            if accessor["componentType"] == 5126:
+                matches = np.allclose(stored, actual, rtol=BOUNDS_TOLERANCE, atol=BOUNDS_TOLERANCE)
+            else:
+                matches = np.array_equal(stored, actual)
+            if not matches:
+                issues.append(f"accessor {index}: {name} {stored.tolist()} != data {name} {actual.tolist()}")
+
+    for mesh_index, mesh in enumerate(gltf.get("meshes", [])):
+        for prim_index, primitive in enumerate(mesh.get("primitives", [])):
+            where = f"mesh {mesh_index} ({mesh.get('name', '')}) primitive {prim_index}"
+            attributes = primitive.get("attributes", {})
+            counts = {name: gltf["accessors"][index]["count"] for name, index in attributes.items()}
+            if len(set(counts.values())) > 1:
+                issues.append(f"{where}: attribute counts differ {counts}")
+            position = attributes.get("POSITION")
+            if position is not None and ("min" not in gltf["accessors"][position] or "max" not in gltf["accessors"][position]):
+                issues.append(f"{where}: POSITION accessor {position} has no min/max")
+            if "indices" not in primitive:
+                continue
+            index_accessor = gltf["accessors"][primitive["indices"]]
+            if index_accessor.get("componentType") not in RESERVED_INDEX or index_accessor.get("type") != "SCALAR":
+                issues.append(f"{where}: indices must be unsigned SCALAR")
+                continue
+            if primitive.get("mode", 4) == 4 and index_accessor["count"] % 3:
+                issues.append(f"{where}: {index_accessor['count']} indices is not whole triangles")
+            if primitive["indices"] not in readable or not index_accessor["count"]:
+                continue
+            indices = glb.accessor(primitive["indices"])
+            highest = int(indices.max())
+            if highest == RESERVED_INDEX[index_accessor["componentType"]]:
+                issues.append(f"{where}: index {highest} is the reserved primitive-restart value")
+            vertex_count = max(counts.values()) if counts else 0
+            if highest >= vertex_count:
+                issues.append(f"{where}: index {highest} out of range for {vertex_count} vertices")
+    return issues
+
+
+def _node_matrix(node: Dict[str, Any]) -> np.ndarray:
+    if "matrix" in node:
+        return np.asarray(node["matrix"], dtype=np.float64).reshape(4, 4).T
+    x, y, z, w = node.get("rotation", [0.0, 0.0, 0.0, 1.0])
+    rotation = np.array(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    )
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.asarray(node.get("scale", [1.0, 1.0, 1.0]), dtype=np.float64)
+    matrix[:3, 3] = node.get("translation", [0.0, 0.0, 0.0])
+    return matrix
+
+
+def _material_names(gltf: Dict[str, Any]) -> List[str]:
+    """Material names: the glTF name, else the ``MATERIALS`` entry it equals (as ``write_glb`` omits names)."""
+    names = []
+    for index, material in enumerate(gltf.get("materials", [])):
+        known = [name for name, value in MATERIALS.items() if value == material]
+        names.append(material.get("name") or (known[0] if known else f"material_{index}"))
+    return names
+
+
+def read_model(glb: GlbFile, rotate_x_deg: float = 0.0, feet_to_meters: bool = True) -> ModelData:
+    """Rebuild a ``ModelData`` (component = node name) from ``glb``'s triangle meshes.
+
+    Node transforms (including the quantization translation/scale) are
+    applied and then ``write_glb``'s ``rotate_x_deg``/``feet_to_meters``
+    transform is undone, so the result is in model feet.  Vertices are welded
+    again per bucket, so flat-shaded exports come back indexed.
+    """
+    gltf = glb.gltf
+    inverse = np.linalg.inv(glb_transform(rotate_x_deg, 0.3048 if feet_to_meters else 1.0))
+    materials = _material_names(gltf)
+    model = ModelData()
+    nodes = gltf.get("nodes", [])
+    scene = gltf.get("scenes", [{}])[gltf.get("scene", 0)] if gltf.get("scenes") else {"nodes": range(len(nodes))}
+    pending = [(index, np.eye(4)) for index in scene.get("nodes", [])]
+    while pending:
+        index, parent = pending.pop(0)
+        node = nodes[index]
+        world = parent @ _node_matrix(node)
+        pending.extend((child, world) for child in node.get("children", []))
+        if "mesh" not in node:
+            continue
+        mesh = gltf["meshes"][node["mesh"]]
+        component = node.get("name") or mesh.get("name") or f"node_{index}"
+        for primitive in mesh["primitives"]:
+            if primitive.get("mode", 4) != 4:
+                raise ValueError(f"{component}: only triangle-list primitives can be read")
+            points = glb.accessor_float(primitive["attributes"]["POSITION"])
+            points = points @ world[:3, :3].T + world[:3, 3]
+            if "indices" in primitive:
+                faces = glb.accessor(primitive["indices"]).astype(np.int64).reshape(-1, 3)
+            else:
+                faces = np.arange(points.shape[0], dtype=np.int64).reshape(-1, 3)
+            material = materials[primitive["material"]] if "material" in primitive else "default"
+            model.add_indexed(material, points @ inverse.T, faces, component=component)
+    return model
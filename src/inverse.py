@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .plan import build_plan_cached
+from .plan_batch import build_plans_batch
+from .validate import validate_geometry
+
+# Inputs build_plans_batch accepts; only these can be solved for.
+DESIGN_VARIABLES: Tuple[str, ...] = (
+    "s",
+    "d",
+    "triangle_clockwise_backoff_deg",
+    "triangle_plan_down_shift_ft",
+)
+DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "s": (1.0, 200.0),
+    "d": (0.0, 100.0),
+    "triangle_clockwise_backoff_deg": (-60.0, 60.0),
+    "triangle_plan_down_shift_ft": (-50.0, 50.0),
+}
+# Metrics PlanBatch.areas() provides; anything else (room areas, courtyard)
+# goes through build_plan + validate_geometry one row at a time.
+BATCH_METRICS: Tuple[str, ...] = ("atrium", "wing_A", "wing_B", "wing_C", "wings_total", "master_triangle")
+
+_DAMPING = (0.0, 1e-3, 1e-1, 1.0, 10.0)
+
+
+@dataclass
+class InverseDesignResult:
+    config: Dict[str, Any]
+    values: Dict[str, float]
+    residuals: Dict[str, float]
+    iterations: int
+    converged: bool
+    message: str = ""
+    metrics: Dict[str, object] = field(default_factory=dict)
+
+
+def _flat_metrics(metrics: Mapping[str, Any]) -> Dict[str, float]:
+    values = {key: float(value) for key, value in metrics["areas"].items()}
+    values.update({key: float(value) for key, value in metrics["triangle_room_areas"].items()})
+    return values
+
+
+def _evaluate(
+    base_config: Mapping[str, Any],
+    variables: Sequence[str],
+    points: np.ndarray,
+    metric_names: Sequence[str],
+) -> np.ndarray:
+    """Metric values for each row of ``points`` (``(m, len(variables))``); NaN where invalid."""
+    use_batch = all(name in BATCH_METRICS for name in metric_names) and (
+        str(base_config.get("triangle_rotation_solver", "analytic")) == "analytic"
+    )
+    if use_batch:
+        columns = {
+            name: (points[:, variables.index(name)] if name in variables else float(base_config.get(name, 0.0)))
+            for name in DESIGN_VARIABLES
+        }
+        areas = build_plans_batch(
+            columns["s"],
+            columns["d"],
+            columns["triangle_clockwise_backoff_deg"],
+            columns["triangle_plan_down_shift_ft"],
+        ).areas()
+        return np.stack([np.abs(areas[name]) for name in metric_names], axis=1)
+
+    out = np.full((points.shape[0], len(metric_names)), np.nan)
+    for row, point in enumerate(points):
+        config = dict(base_config)
+        config.update({name: float(value) for name, value in zip(variables, point)})
+        try:
+            values = _flat_metrics(validate_geometry(build_plan_cached(config), config))
+        except (AssertionError, ValueError):
+            continue
+        out[row] = [values[name] for name in metric_names]
+    return out
+
+
+def solve_for_targets(
+    base_config: Mapping[str, Any],
+    targets: Mapping[str, float],
+    variables: Sequence[str] = ("s", "d"),
+    bounds: Mapping[str, Tuple[float, float]] | None = None,
+    constraints: Mapping[str, Tuple[float | None, float | None]] | None = None,
+    tolerance: float = 0.01,
+    max_iterations: int = 50,
+) -> InverseDesignResult:
+    """Find design variables whose plan metrics hit ``targets`` (sq ft).
+
+    Damped Gauss-Newton: each iteration evaluates the current point and its
+    central finite-difference neighbours as one batch, then tries several
+    damping factors as a second batch and keeps the best.  Targets and
+    ``constraints`` (``{metric: (min, max)}``, checked on the result) may name
+    any key of ``validate_geometry``'s ``areas`` or ``triangle_room_areas``.
+    """
+    variables = list(variables)
+    unknown = [name for name in variables if name not in DESIGN_VARIABLES]
+    if unknown:
+        raise ValueError(f"Cannot solve for {unknown}; choose from {list(DESIGN_VARIABLES)}")
+    if not variables or not targets:
+        raise ValueError("Inverse design needs at least one variable and one target.")
+    bounds = {**DEFAULT_BOUNDS, **(bounds or {})}
+    metric_names = list(targets)
+    target = np.array([float(targets[name]) for name in metric_names])
+    lo = np.array([bounds[name][0] for name in variables], dtype=float)
+    hi = np.array([bounds[name][1] for name in variables], dtype=float)
+
+    x = np.clip(np.array([float(base_config.get(name, 0.0)) for name in variables]), lo, hi)
+    n = len(variables)
+    iterations = 0
+    converged = False
+    message = "maximum iterations reached"
+
+    def cost(values: np.ndarray) -> np.ndarray:
+        err = np.sum((values - target) ** 2, axis=-1)
+        return np.where(np.isfinite(err), err, np.inf)
+
+    f0 = _evaluate(base_config, variables, x[None, :], metric_names)[0]
+    for iterations in range(1, max_iterations + 1):
+        residual = f0 - target
+        if np.all(np.isfinite(residual)) and np.max(np.abs(residual)) <= tolerance:
+            converged = True
+            message = "converged"
+            iterations -= 1
+            break
+
+        h = 1e-4 * np.maximum(1.0, np.abs(x))
+        plus = np.minimum(x + h, hi)
+        minus = np.maximum(x - h, lo)
+        probes = np.repeat(x[None, :], 2 * n, axis=0)
+        probes[np.arange(n), np.arange(n)] = plus
+        probes[n + np.arange(n), np.arange(n)] = minus
+        f_probe = _evaluate(base_config, variables, probes, metric_names)
+        span = plus - minus
+        jac = ((f_probe[:n] - f_probe[n:]) / np.where(span > 0, span, 1.0)[:, None]).T
+        if not np.all(np.isfinite(jac)) or not np.all(np.isfinite(residual)):
+            message = "metrics undefined near the current point"
+            break
+
+        jtj = jac.T @ jac
+        jtr = jac.T @ residual
+        steps: List[np.ndarray] = []
+        for damping in _DAMPING:
+            if damping == 0.0:
+                step = -np.linalg.lstsq(jac, residual, rcond=None)[0]
+            else:
+                step = -np.linalg.solve(jtj + damping * np.diag(np.diag(jtj) + 1e-12), jtr)
+            steps.append(step)
+        trials = np.clip(x[None, :] + np.array(steps), lo, hi)
+        trials = np.vstack([trials, np.clip(x + 0.5 * steps[0], lo, hi)])
+        f_trials = _evaluate(base_config, variables, trials, metric_names)
+        trial_cost = cost(f_trials)
+        best = int(np.argmin(trial_cost))
+        if not trial_cost[best] < cost(f0):
+            message = "no further improvement within bounds"
+            break
+        x, f0 = trials[best], f_trials[best]
+
+    config = dict(base_config)
+    config.update({name: float(value) for name, value in zip(variables, x)})
+    values = {name: float(value) for name, value in zip(metric_names, f0)}
+    residuals = {name: values[name] - float(targets[name]) for name in metric_names}
+
+    metrics: Dict[str, object] = {}
+    try:
+        metrics = validate_geometry(build_plan_cached(config), config)
+    except (AssertionError, ValueError) as exc:
+        converged = False
+        message = f"solution fails validation: {exc}"
+    else:
+        flat = _flat_metrics(metrics)
+        violations = []
+        for name, (low, high) in (constraints or {}).items():
+            value = flat[name]
+            if (low is not None and value < low) or (high is not None and value > high):
+                violations.append(f"{name}={value:.2f} outside [{low}, {high}]")
+        if violations:
+            converged = False
+            message = "constraint violated: " + "; ".join(violations)
+    at_bound = [name for name, value, a, b in zip(variables, x, lo, hi) if math.isclose(value, a) or math.isclose(value, b)]
+    if at_bound and not converged and message == "no further improvement within bounds":
+        message += f" ({', '.join(at_bound)} at bound)"
+
+    return InverseDesignResult(
+        config=config,
+        values=values,
+        residuals=residuals,
+        iterations=iterations,
+        converged=converged,
+        message=message,
+        metrics=metrics,
+    )
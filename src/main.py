@@ -5,13 +5,15 @@ from datetime import datetime
 import json
 from pathlib import Path
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-from .export import write_glb, write_svg
-from .model import build_model
-from .plan import build_plan
-from .render_blender import render_if_available
-from .validate import validate_geometry, write_summary
+from .glb_io import read_glb, validate_glb
+from .inverse import solve_for_targets
+from .mesh_qa import check_model, write_report
+from .plan import ROTATION_RESIDUAL_TOLERANCE
+from .stages import GenerationSession
+from .sweep import expand_points, parse_axis, read_list_file, run_sweep
+from .validate import write_summary
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().with_name("config.json")
@@ -29,6 +31,7 @@ def _apply_overrides(config: Dict[str, Any], args: argparse.Namespace) -> Dict[s
         "d": "d",
         "triangle_clockwise_backoff_deg": "triangle_clockwise_backoff_deg",
         "triangle_plan_down_shift_ft": "triangle_plan_down_shift_ft",
+        "triangle_rotation_solver": "triangle_rotation_solver",
         "ceiling_height": "ceiling_height",
         "slab_thickness": "slab_thickness",
         "lower_ground": "lower_ground",
@@ -43,6 +46,11 @@ def _apply_overrides(config: Dict[str, Any], args: argparse.Namespace) -> Dict[s
         "driveway_top_width": "driveway_top_width",
         "driveway_length": "driveway_length",
         "glb_rotate_x_deg": "glb_rotate_x_deg",
+        "glb_weld_vertices": "glb_weld_vertices",
+        "glb_vertex_cache": "glb_vertex_cache",
+        "glb_quantize": "glb_quantize",
+        "glb_meshopt": "glb_meshopt",
+        "model_workers": "model_workers",
         "blender_executable": "blender_executable",
     }
 
@@ -73,6 +81,7 @@ def _output_paths(config: Dict[str, Any], out_dir: Path, timestamped: bool) -> D
         "plan": out_dir / f"plan_{name_suffix}.svg",
         "glb": out_dir / f"massing_{name_suffix}.glb",
         "summary": out_dir / f"summary_{name_suffix}.txt",
+        "qa": out_dir / f"qa_{name_suffix}.json",
     }
 
 
@@ -82,30 +91,22 @@ def generate_once(
     renders_dir: Path,
     timestamped: bool,
     blender_executable: str | None = None,
+    session: GenerationSession | None = None,
+    qa: bool = False,
 ) -> Dict[str, Any]:
     out_dir.mkdir(parents=True, exist_ok=True)
     paths = _output_paths(config, out_dir, timestamped=timestamped)
 
-    plan = build_plan(config)
-    metrics = validate_geometry(plan, config)
-    model = build_model(plan, config)
-    include_courtyard = str(config.get("courtyard_module", "none")) != "none"
-
-    write_svg(
-        plan,
-        paths["plan"],
-        include_labels=bool(config.get("labels", True)),
-        include_courtyard=include_courtyard,
-        config=config,
-        metrics=metrics,
-    )
-    write_glb(model, paths["glb"], rotate_x_deg=float(config.get("glb_rotate_x_deg", 0.0)))
-
-    blender_available, render_paths, render_error = render_if_available(
-        paths["glb"],
-        renders_dir / "latest",
-        blender_executable=blender_executable,
-    )
+    # Without a session every stage runs; auto mode and the UI pass a long-lived
+    # session so only stages (and model components) whose inputs changed rerun.
+    incremental = session is not None
+    if session is None:
+        with GenerationSession() as session:
+            values = session.run(config, paths, renders_dir, blender_executable=blender_executable)
+    else:
+        values = session.run(config, paths, renders_dir, blender_executable=blender_executable)
+    metrics = values["metrics"]
+    blender_available, render_paths, render_error = values["render"]
     quicklook_path: Path | None = None
     if blender_available and render_paths:
         iso_path = next((path for path in render_paths if path.name == "iso.png"), render_paths[0])
@@ -126,13 +127,71 @@ def generate_once(
     )
 
     areas = metrics["areas"]
+    residual = float(metrics.get("triangle_alignment_residual", 0.0))
+    if residual > ROTATION_RESIDUAL_TOLERANCE:
+        print(f"[warn] master triangle cannot reach Wing C corner; closest approach {residual:.4f} ft")
     print(
         f"[ok] areas sqft: atrium={areas['atrium']:.2f}, wings={areas['wings_total']:.2f}, "
         f"triangle={areas['master_triangle']:.2f}, courtyard={areas['courtyard']:.2f}"
     )
+    if incremental and session.graph.last_reused:
+        rebuilt = session.model_builder.last_rebuilt if "model" in session.graph.last_ran else []
+        print(
+            f"[ok] reused stages: {', '.join(session.graph.last_reused)}; "
+            f"rebuilt model components: {', '.join(rebuilt) or 'none'}"
+        )
+    model_ran = "model" in session.graph.last_ran
+    loaded = session.model_builder.last_loaded if model_ran else []
+    if loaded:
+        print(f"[ok] model components from disk cache: {', '.join(loaded)}")
+    timings = session.model_builder.last_timings if model_ran else {}
+    if timings:
+        slowest = sorted(timings.items(), key=lambda item: -item[1])
+        print("[ok] model component ms: " + ", ".join(f"{name}={seconds * 1000:.1f}" for name, seconds in slowest))
     print(f"[ok] plan: {paths['plan']}")
     print(f"[ok] glb: {paths['glb']}")
+    glb_report = values.get("glb_report") or {}
+    if glb_report.get("quantized"):
+        line = (
+            f"[ok] glb quantized: {len(glb_report['quantized'])} components, "
+            f"max error {glb_report['max_error_ft']:.4f} ft"
+        )
+        flipped = glb_report["flipped"]
+        over = [name for name in glb_report["float32"] if name not in flipped]
+        if over:
+            line += f"; kept float32 (over tolerance): {', '.join(over)}"
+        if flipped:
+            line += f"; kept float32 (faces flipped by rounding): {', '.join(f'{name} ({n})' for name, n in flipped.items())}"
+        print(line)
+    if glb_report.get("meshopt"):
+        meshopt = glb_report["meshopt"]
+        print(
+            f"[ok] glb meshopt: {meshopt['bytes']} bytes "
+            f"({meshopt['fallback_bytes'] / max(1, meshopt['bytes']):.1f}x smaller than uncompressed buffers)"
+        )
     print(f"[ok] summary: {paths['summary']}")
+    if qa:
+        report = check_model(values["model"])
+        with read_glb(paths["glb"]) as glb:
+            report["glb_issues"] = validate_glb(glb)
+        write_report(report, paths["qa"])
+        totals = report["totals"]
+        print(
+            f"[ok] qa: {totals['open_edges']} open edges, {totals['non_manifold_edges']} non-manifold, "
+            f"{totals['inconsistent_winding']} winding flips, {totals['zero_area_faces']} zero-area, "
+            f"{totals['duplicate_faces']} duplicate faces in {report['seconds'] * 1000:.1f} ms: {paths['qa']}"
+        )
+        overlaps = report["coplanar_overlaps"]
+        if overlaps:
+            worst = overlaps[0]
+            print(
+                f"[warn] qa: {len(overlaps)} coplanar overlaps ({totals['coplanar_overlap_area']:.1f} sq ft), "
+                f"largest {worst['a']} / {worst['b']} {worst['area']:.1f} sq ft at {worst['locations'][0]}"
+            )
+        if report["glb_issues"]:
+            print(f"[warn] qa: {len(report['glb_issues'])} glb issues, first: {report['glb_issues'][0]}")
+        else:
+            print(f"[ok] qa: glb valid ({paths['glb']})")
     if blender_available and render_paths:
         print(f"[ok] renders: {', '.join(str(path) for path in render_paths)}")
         if quicklook_path is not None:
@@ -168,9 +227,12 @@ def run_auto(config_path: Path, args: argparse.Namespace) -> None:
             Path(args.renders_dir),
             timestamped=True,
             blender_executable=(config.get("blender_executable") or None),
+            qa=args.qa,
         )
         return
 
+    session = GenerationSession()
+
     class RegenHandler(FileSystemEventHandler):
         def __init__(self) -> None:
             self.last_run = 0.0
@@ -187,6 +249,8 @@ def run_auto(config_path: Path, args: argparse.Namespace) -> None:
             if now - self.last_run < 0.5:
                 return
             self.last_run = now
+            if src.suffix == ".py":
+                session.clear()
 
             config = _apply_overrides(_load_config(config_path), args)
             try:
@@ -196,6 +260,8 @@ def run_auto(config_path: Path, args: argparse.Namespace) -> None:
                     Path(args.renders_dir),
                     timestamped=True,
                     blender_executable=(config.get("blender_executable") or None),
+                    session=session,
+                    qa=args.qa,
                 )
             except Exception as exc:
                 print(f"[auto] generation failed: {exc}")
@@ -213,6 +279,8 @@ def run_auto(config_path: Path, args: argparse.Namespace) -> None:
         Path(args.renders_dir),
         timestamped=True,
         blender_executable=(config.get("blender_executable") or None),
+        session=session,
+        qa=args.qa,
     )
     print(f"[auto] watching: {watch_dir}")
     try:
@@ -221,15 +289,95 @@ def run_auto(config_path: Path, args: argparse.Namespace) -> None:
     except KeyboardInterrupt:
         observer.stop()
     observer.join()
+    session.close()
+
+
+def run_sweep_command(config_path: Path, args: argparse.Namespace) -> None:
+    config = _apply_overrides(_load_config(config_path), args)
+    axes = [parse_axis(spec) for spec in args.sweep]
+    rows = read_list_file(Path(args.sweep_list)) if args.sweep_list else None
+    if not axes and not rows:
+        raise SystemExit("sweep needs at least one --sweep key=... axis or a --sweep-list file")
+    if args.sweep_out:
+        csv_path = Path(args.sweep_out)
+    else:
+        csv_path = Path(args.out_dir) / f"sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    result = run_sweep(
+        config,
+        expand_points(axes, rows),
+        csv_path,
+        with_model=args.sweep_model,
+        workers=args.workers,
+    )
+    if result["failed"]:
+        print(f"[warn] sweep: {result['failed']} of {result['points']} points failed (see the 'error' column)")
+    print(f"[ok] sweep: {result['points']} points in {result['seconds']:.2f}s")
+    print(f"[ok] table: {result['csv']}")
+    print(f"[ok] arrays: {result['npz']}")
+
+
+def _parse_target(spec: str) -> Tuple[str, float]:
+    key, sep, value = spec.partition("=")
+    if not sep or not key.strip():
+        raise SystemExit(f"--target must look like metric=sqft: {spec!r}")
+    return key.strip(), float(value)
+
+
+def run_solve_command(config_path: Path, args: argparse.Namespace) -> None:
+    config = _apply_overrides(_load_config(config_path), args)
+    if not args.target:
+        raise SystemExit("solve needs at least one --target metric=sqft")
+    targets = dict(_parse_target(spec) for spec in args.target)
+    t0 = time.perf_counter()
+    result = solve_for_targets(config, targets, variables=args.solve_for.split(","))
+    elapsed = time.perf_counter() - t0
+
+    for name, value in result.values.items():
+        print(f"  {name}: {value:.2f} (target {targets[name]:.2f}, residual {result.residuals[name]:+.4f})")
+    solved = {name: round(result.config[name], 6) for name in args.solve_for.split(",")}
+    if not result.converged:
+        print(f"[warn] solve: {result.message}")
+    print(f"[ok] solve: {json.dumps(solved)} in {result.iterations} iterations, {elapsed:.3f}s")
+    if args.solve_out:
+        out_path = Path(args.solve_out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(result.config, indent=2) + "\n", encoding="utf-8")
+        print(f"[ok] config: {out_path}")
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Exploded hexagon parametric generator")
-    parser.add_argument("command", nargs="?", choices=("regen", "auto"), default="regen")
+    parser.add_argument("command", nargs="?", choices=("regen", "auto", "sweep", "solve"), default="regen")
     parser.add_argument("--config", default=str(DEFAULT_CONFIG_PATH))
     parser.add_argument("--out-dir", default=str(PROJECT_ROOT / "out"))
     parser.add_argument("--renders-dir", default=str(PROJECT_ROOT / "renders"))
     parser.add_argument("--timestamped", action="store_true", help="Add timestamp suffix to output filenames.")
+    parser.add_argument("--qa", action="store_true", help="Check every model component's mesh and write a JSON report.")
+
+    sweep = parser.add_argument_group("sweep")
+    sweep.add_argument(
+        "--sweep",
+        action="append",
+        default=[],
+        metavar="KEY=SPEC",
+        help="Sweep axis: key=start:stop:count (inclusive) or key=v1,v2,... Repeat for a grid.",
+    )
+    sweep.add_argument("--sweep-list", default=None, help="CSV of config overrides, one point per row.")
+    sweep.add_argument("--sweep-out", default=None, help="Output CSV (an .npz is written alongside).")
+    sweep.add_argument("--sweep-model", action="store_true", help="Also build the model and record triangle counts.")
+    sweep.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+
+    solve = parser.add_argument_group("solve")
+    solve.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="METRIC=SQFT",
+        help="Target area, e.g. master_triangle=2400 or room_total=2500. Repeat for several.",
+    )
+    solve.add_argument("--solve-for", default="s,d", help="Comma-separated variables to solve for (default: s,d).")
+    solve.add_argument("--solve-out", default=None, help="Write the solved config as JSON.")
 
     parser.add_argument("--s", type=float, default=None)
     parser.add_argument("--d", type=float, default=None)
@@ -240,6 +388,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
     )
     parser.add_argument("--triangle-plan-down-shift-ft", dest="triangle_plan_down_shift_ft", type=float, default=None)
+    parser.add_argument(
+        "--triangle-rotation-solver",
+        dest="triangle_rotation_solver",
+        choices=("analytic", "scan"),
+        default=None,
+    )
     parser.add_argument("--ceiling-height", dest="ceiling_height", type=float, default=None)
     parser.add_argument("--slab-thickness", dest="slab_thickness", type=float, default=None)
     parser.add_argument("--lower-ground", dest="lower_ground", type=float, default=None)
@@ -254,7 +408,42 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--driveway-top-width", dest="driveway_top_width", type=float, default=None)
     parser.add_argument("--driveway-length", dest="driveway_length", type=float, default=None)
     parser.add_argument("--glb-rotate-x-deg", dest="glb_rotate_x_deg", type=float, default=None)
+    parser.add_argument(
+        "--glb-weld",
+        dest="glb_weld_vertices",
+        action="store_true",
+        default=None,
+        help="Write indexed GLB primitives with shared vertices (config glb_weld_vertices).",
+    )
+    parser.add_argument(
+        "--glb-vertex-cache",
+        dest="glb_vertex_cache",
+        action="store_true",
+        default=None,
+        help="With --glb-weld, reorder faces for the GPU vertex cache (config glb_vertex_cache).",
+    )
+    parser.add_argument(
+        "--glb-quantize",
+        dest="glb_quantize",
+        action="store_true",
+        default=None,
+        help="Store GLB positions as int16 and normals as int8 (KHR_mesh_quantization, config glb_quantize).",
+    )
+    parser.add_argument(
+        "--glb-meshopt",
+        dest="glb_meshopt",
+        action="store_true",
+        default=None,
+        help="Compress GLB buffers with EXT_meshopt_compression; implies --glb-quantize (config glb_meshopt).",
+    )
     parser.add_argument("--blender-executable", dest="blender_executable", type=str, default=None)
+    parser.add_argument(
+        "--model-workers",
+        dest="model_workers",
+        type=int,
+        default=None,
+        help="Build model components on this many processes (default: config model_workers, 1 = serial).",
+    )
     parser.add_argument("--labels", dest="labels", action="store_true")
     parser.add_argument("--no-labels", dest="labels", action="store_false")
     parser.set_defaults(labels=None)
@@ -269,6 +458,12 @@ def main() -> None:
     if args.command == "auto":
         run_auto(config_path, args)
         return
+    if args.command == "sweep":
+        run_sweep_command(config_path, args)
+        return
+    if args.command == "solve":
+        run_solve_command(config_path, args)
+        return
 
     config = _apply_overrides(_load_config(config_path), args)
     generate_once(
@@ -277,6 +472,7 @@ def main() -> None:
         Path(args.renders_dir),
         timestamped=args.timestamped,
         blender_executable=(config.get("blender_executable") or None),
+        qa=args.qa,
     )
 
 
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import time
+from typing import Any, Dict, List, Mapping, Tuple
+
+import numpy as np
+import shapely
+
+from .model import WELD_TOLERANCE, MeshBuffer, ModelData
+
+# Triangles with less area than this (sq ft) count as zero-area.
+ZERO_AREA_TOLERANCE = 1e-9
+# Locations listed per issue kind and component in the report.
+SAMPLE_LIMIT = 20
+
+# Faces within this distance (ft) of each other's plane, with unit normals
+# matching to ``COPLANAR_NORMAL_TOLERANCE`` per axis, count as coplanar.
+COPLANAR_OFFSET_TOLERANCE = 0.01
+COPLANAR_NORMAL_TOLERANCE = 1e-3
+# Smaller coplanar overlaps (sq ft) are shared edges or rounding, not z-fighting.
+MIN_OVERLAP_AREA = 1e-3
+
+ISSUE_KINDS = ("open_edges", "non_manifold_edges", "inconsistent_winding", "zero_area_faces", "duplicate_faces")
+
+
+def weld_buckets(buckets: Mapping[str, MeshBuffer], tolerance: float = WELD_TOLERANCE) -> Tuple[np.ndarray, np.ndarray]:
+    """One ``(vertices, faces)`` mesh from a component's material buckets.
+
+    Each bucket is welded on its own when built, so seams between materials
+    (glass band on a concrete wall) only share vertices after this pass.
+    """
+    vertex_parts = [np.asarray(bucket.vertices, dtype=np.float64) for bucket in buckets.values()]
+    face_parts = []
+    offset = 0
+    for bucket, vertices in zip(buckets.values(), vertex_parts):
+        face_parts.append(np.asarray(bucket.faces, dtype=np.int64) + offset)
+        offset += vertices.shape[0]
+    vertices = np.concatenate(vertex_parts).reshape(-1, 3) if vertex_parts else np.empty((0, 3))
+    faces = np.concatenate(face_parts).reshape(-1, 3) if face_parts else np.empty((0, 3), dtype=np.int64)
+    if not vertices.shape[0]:
+        return vertices, faces
+    keys = np.rint(vertices / tolerance).astype(np.int64) if tolerance > 0.0 else vertices
+    _keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return vertices[first], inverse.reshape(-1)[faces]
+
+
+def _samples(points: np.ndarray, limit: int) -> list:
+    return np.round(points[:limit], 4).tolist()
+
+
+def check_mesh(vertices: np.ndarray, faces: np.ndarray, samples: int = SAMPLE_LIMIT) -> Dict[str, Any]:
+    """Counts and sample locations of topology defects in one indexed mesh.
+
+    Edges are keyed by their sorted vertex pair: a key used by one face is an
+    open (boundary) edge, by three or more a non-manifold edge, and by two
+    faces that traverse it in the same direction a winding flip.  Faces with
+    a repeated vertex or under ``ZERO_AREA_TOLERANCE`` area are zero-area and
+    left out of the edge checks; faces over the same three vertices (in any
+    order) beyond the first are duplicates.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    a, b, c = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+    area = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    repeated = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 2] == faces[:, 0])
+    zero_area = repeated | (area < ZERO_AREA_TOLERANCE)
+
+    ordered = np.sort(faces, axis=1)
+    _rows, first_face = np.unique(ordered, axis=0, return_index=True)
+    duplicate = np.ones(faces.shape[0], dtype=bool)
+    duplicate[first_face] = False
+
+    live = faces[~zero_area]
+    directed = live[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    low = directed.min(axis=1)
+    high = directed.max(axis=1)
+    keys, first_edge, inverse, uses = np.unique(
+        low * max(1, vertices.shape[0]) + high, return_index=True, return_inverse=True, return_counts=True
+    )
+    forward = np.bincount(inverse.reshape(-1), weights=directed[:, 0] < directed[:, 1], minlength=keys.shape[0])
+    open_edges = uses == 1
+    non_manifold = uses > 2
+    flipped = (uses == 2) & (forward != 1)
+    edge_mid = (vertices[low[first_edge]] + vertices[high[first_edge]]) * 0.5
+    centroid = (a + b + c) / 3.0
+
+    return {
+        "vertices": int(vertices.shape[0]),
+        "faces": int(faces.shape[0]),
+        "edges": int(keys.shape[0]),
+        "open_edges": int(np.count_nonzero(open_edges)),
+        "non_manifold_edges": int(np.count_nonzero(non_manifold)),
+        "inconsistent_winding": int(np.count_nonzero(flipped)),
+        "zero_area_faces": int(np.count_nonzero(zero_area)),
+        "duplicate_faces": int(np.count_nonzero(duplicate)),
+        "watertight": bool(keys.shape[0] and uses.min() == 2 and uses.max() == 2),
+        "samples": {
+            "open_edges": _samples(edge_mid[open_edges], samples),
+            "non_manifold_edges": _samples(edge_mid[non_manifold], samples),
+            "inconsistent_winding": _samples(edge_mid[flipped], samples),
+            "zero_area_faces": _samples(centroid[zero_area], samples),
+            "duplicate_faces": _samples(centroid[duplicate], samples),
+        },
+    }
+
+
+def _plane_basis(normal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    axis = np.zeros(3)
+    axis[int(np.argmin(np.abs(normal)))] = 1.0
+    u = np.cross(normal, axis)
+    u /= np.linalg.norm(u)
+    return u, np.cross(normal, u)
+
+
+def _normal_groups(normal: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Group unit normals that match to ``tolerance`` per axis; returns (group, flip) per face.
+
+    Normals are binned into cells of ``tolerance``, and cells are claimed
+    greedily (most faces first) by a leader whose mean normal every claimed
+    cell's mean is within ``tolerance`` of, so groups never chain further than
+    that.  The neighbouring cells (+/-1 per axis) are probed so that normals
+    either side of a rounding boundary still meet, including the mirrored
+    cells: a normal whose largest component is nearly tied may have been
+    canonicalized to the other sign, and ``flip`` marks faces to turn back.
+    """
+    key = np.rint(normal / tolerance).astype(np.int64)
+    cells, cell_of, counts = np.unique(key, axis=0, return_inverse=True, return_counts=True)
+    cell_of = cell_of.reshape(-1)
+    sums = np.zeros((cells.shape[0], 3))
+    np.add.at(sums, cell_of, normal)
+    means = (sums / counts[:, None]).tolist()
+    cell_keys = cells.tolist()
+    lookup = {tuple(cell): index for index, cell in enumerate(cell_keys)}
+    group = [-1] * len(cell_keys)
+    flip = [False] * len(cell_keys)
+    around = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+    groups = 0
+    for leader in np.argsort(-counts, kind="stable").tolist():
+        if group[leader] >= 0:
+            continue
+        group[leader] = groups
+        lx, ly, lz = cell_keys[leader]
+        mx, my, mz = means[leader]
+        for sign in (1, -1):
+            for dx, dy, dz in around:
+                index = lookup.get((sign * lx + dx, sign * ly + dy, sign * lz + dz))
+                if index is None or group[index] >= 0:
+                    continue
+                nx, ny, nz = means[index]
+                if max(abs(sign * nx - mx), abs(sign * ny - my), abs(sign * nz - mz)) <= tolerance:
+                    group[index] = groups
+                    flip[index] = sign < 0
+        groups += 1
+    return np.asarray(group, dtype=np.int64)[cell_of], np.asarray(flip, dtype=bool)[cell_of]
+
+
+def find_coplanar_overlaps(
+    mesh: ModelData,
+    offset_tolerance: float = COPLANAR_OFFSET_TOLERANCE,
+    normal_tolerance: float = COPLANAR_NORMAL_TOLERANCE,
+    min_area: float = MIN_OVERLAP_AREA,
+    samples: int = SAMPLE_LIMIT,
+) -> List[Dict[str, Any]]:
+    """Coplanar faces of different (component, material) buckets that overlap in area.
+
+    Faces are grouped by their plane equation: unit normals (sign fixed so
+    the largest component is positive) are grouped by ``_normal_groups``,
+    and within a normal group faces are sorted by their centroid's offset
+    along the group's normal and split into planes no more than
+    ``offset_tolerance`` thick, measured from each plane's first offset.
+    In each plane with two or more buckets, every bucket's faces are unioned
+    in plane coordinates and intersected pairwise.  Returns one entry per
+    bucket pair, largest overlap first, with the overlap centroid per plane
+    and whether the two buckets face the same way (``"opposite"`` faces only
+    fight where back faces are drawn).
+    """
+    labels = [f"{component}/{material}" for component, material in mesh.buckets]
+    parts = [np.asarray(bucket.vertices)[np.asarray(bucket.faces)] for bucket in mesh.buckets.values()]
+    if not parts:
+        return []
+    tris = np.concatenate(parts).reshape(-1, 3, 3)
+    owner = np.repeat(np.arange(len(parts)), [part.shape[0] for part in parts])
+    cross = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = np.linalg.norm(cross, axis=1)
+    keep = 0.5 * length >= ZERO_AREA_TOLERANCE
+    tris, owner, cross, length = tris[keep], owner[keep], cross[keep], length[keep]
+    if not tris.shape[0]:
+        return []
+    normal = cross / length[:, None]
+    dominant = np.abs(normal).argmax(axis=1)
+    facing = np.where(normal[np.arange(normal.shape[0]), dominant] < 0.0, -1, 1)
+    normal *= facing[:, None]
+
+    normal_group, flip = _normal_groups(normal, normal_tolerance)
+    normal[flip] *= -1.0
+    facing[flip] *= -1
+    sums = np.zeros((int(normal_group.max()) + 1, 3))
+    np.add.at(sums, normal_group, normal)
+    axis = sums / np.linalg.norm(sums, axis=1, keepdims=True)
+    offset = np.einsum("ij,ij->i", axis[normal_group], tris.mean(axis=1))
+
+    order = np.lexsort((offset, normal_group))
+    sorted_group, sorted_offset = normal_group[order], offset[order]
+    new_plane = np.zeros(order.shape[0], dtype=bool)
+    start = 0
+    while start < order.shape[0]:
+        new_plane[start] = True
+        end = int(np.searchsorted(sorted_group, sorted_group[start], side="right"))
+        start += int(np.searchsorted(sorted_offset[start:end], sorted_offset[start] + offset_tolerance, side="right"))
+    plane = np.cumsum(new_plane) - 1
+
+    # Only planes holding faces from two or more buckets can overlap.
+    pairs = np.unique(np.column_stack([plane, owner[order]]), axis=0)
+    shared = np.flatnonzero(np.bincount(pairs[:, 0]) > 1)
+    starts = np.flatnonzero(new_plane)
+    ends = np.append(starts[1:], order.shape[0])
+    found: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    for index in shared.tolist():
+        members = order[starts[index] : ends[index]]
+        plane_normal = normal[members].mean(axis=0)
+        plane_normal /= np.linalg.norm(plane_normal)
+        u, v = _plane_basis(plane_normal)
+        origin = plane_normal * float(np.dot(plane_normal, tris[members].reshape(-1, 3).mean(axis=0)))
+        flat = np.stack([tris[members] @ u, tris[members] @ v], axis=2)
+        rings = shapely.polygons(np.concatenate([flat, flat[:, :1]], axis=1))
+        buckets = np.unique(owner[members]).tolist()
+        regions = {bucket: shapely.union_all(rings[owner[members] == bucket]) for bucket in buckets}
+        sides = {bucket: set(facing[members][owner[members] == bucket].tolist()) for bucket in buckets}
+        for i, first in enumerate(buckets):
+            for second in buckets[i + 1 :]:
+                overlap = shapely.intersection(regions[first], regions[second])
+                area = float(overlap.area)
+                if area < min_area:
+                    continue
+                centre = overlap.centroid
+                entry = found.setdefault(
+                    (first, second), {"a": labels[first], "b": labels[second], "area": 0.0, "facing": set(), "locations": []}
+                )
+                entry["area"] += area
+                if len(sides[first]) == 1 and len(sides[second]) == 1:
+                    entry["facing"].add("same" if sides[first] == sides[second] else "opposite")
+                else:
+                    entry["facing"].add("mixed")
+                if len(entry["locations"]) < samples:
+                    entry["locations"].append(np.round(origin + u * centre.x + v * centre.y, 4).tolist())
+    results = sorted(found.values(), key=lambda entry: -entry["area"])
+    for entry in results:
+        entry["area"] = round(entry["area"], 4)
+        entry["facing"] = entry["facing"].pop() if len(entry["facing"]) == 1 else "mixed"
+    return results
+
+
+def check_model(mesh: ModelData, samples: int = SAMPLE_LIMIT) -> Dict[str, Any]:
+    """``check_mesh`` for every component of ``mesh`` (materials welded together), with totals,
+    plus ``find_coplanar_overlaps`` across components."""
+    start = time.perf_counter()
+    components = {
+        component: check_mesh(*weld_buckets(buckets, mesh.weld_tolerance), samples=samples)
+        for component, buckets in mesh.triangles_by_component.items()
+    }
+    overlaps = find_coplanar_overlaps(mesh, samples=samples)
+    totals = {kind: sum(result[kind] for result in components.values()) for kind in ("faces",) + ISSUE_KINDS}
+    totals["watertight_components"] = sum(result["watertight"] for result in components.values())
+    totals["components"] = len(components)
+    totals["coplanar_overlaps"] = len(overlaps)
+    totals["coplanar_overlap_area"] = round(sum(entry["area"] for entry in overlaps), 4)
+    return {
+        "totals": totals,
+        "components": components,
+        "coplanar_overlaps": overlaps,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def write_report(report: Mapping[str, Any], path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
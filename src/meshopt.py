@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Bitstreams of the glTF EXT_meshopt_compression extension (meshoptimizer's
+# vertex codec version 0 and index codec version 1), in NumPy.
+
+VERTEX_HEADER = 0xA0
+INDEX_HEADER = 0xE1
+
+_BYTE_GROUP = 16
+_VERTEX_BLOCK_BYTES = 8192
+_VERTEX_BLOCK_MAX = 256
+_TAIL_SIZE = 32
+# Candidate group encodings in the encoder's order of preference: raw bytes,
+# all-zero, 2-bit and 4-bit with escapes.  The header stores log2 of the bits.
+_GROUP_BITSLOG2 = np.array([3, 0, 1, 2], dtype=np.uint8)
+
+# meshoptimizer's static codeaux table (two last entries unused by the encoder).
+_CODEAUX_TABLE = bytes([0x00, 0x76, 0x87, 0x56, 0x67, 0x78, 0xA9, 0x86, 0x65, 0x89, 0x68, 0x98, 0x01, 0x69, 0x00, 0x00])
+_TRIANGLE_ORDER = ((0, 1, 2), (1, 2, 0), (2, 0, 1))
+
+
+def _vertex_block_size(stride: int) -> int:
+    return min((_VERTEX_BLOCK_BYTES // stride) & ~(_BYTE_GROUP - 1), _VERTEX_BLOCK_MAX)
+
+
+def _encode_byte_rows(rows: np.ndarray) -> np.ndarray:
+    """Byte-group encoding of each row of ``rows`` (``(r, n)`` uint8, ``n`` a multiple of 16), concatenated."""
+    count, width = rows.shape
+    group_count = width // _BYTE_GROUP
+    groups = rows.reshape(count, group_count, _BYTE_GROUP)
+
+    escapes2 = groups >= 3
+    escapes4 = groups >= 15
+    sizes = np.stack(
+        [
+            np.full(groups.shape[:2], _BYTE_GROUP),
+            np.where(groups.any(axis=2), 2 * _BYTE_GROUP, 0),
+            4 + escapes2.sum(axis=2),
+            8 + escapes4.sum(axis=2),
+        ],
+        axis=2,
+    )
+    # argmin keeps the first of equal sizes: raw bytes, then the narrower widths.
+    choice = sizes.argmin(axis=2)
+    length = np.take_along_axis(sizes, choice[..., None], axis=2)[..., 0]
+
+    payload = np.zeros((count, group_count, _BYTE_GROUP), dtype=np.uint8)
+    raw = choice == 0
+    payload[raw] = groups[raw]
+    for option, bits, escapes in ((2, 2, escapes2), (3, 4, escapes4)):
+        chosen = choice == option
+        if not chosen.any():
+            continue
+        per_byte = 8 // bits
+        codes = np.minimum(groups[chosen], (1 << bits) - 1).reshape(-1, _BYTE_GROUP // per_byte, per_byte)
+        packed = np.zeros(codes.shape[:2], dtype=np.uint8)
+        for k in range(per_byte):
+            packed = (packed << bits) | codes[:, :, k]
+        fixed = _BYTE_GROUP * bits // 8
+        block = payload[chosen]
+        block[:, :fixed] = packed
+        escaped = escapes[chosen]
+        rank = np.cumsum(escaped, axis=1) - 1
+        row, column = np.nonzero(escaped)
+        block[row, fixed + rank[row, column]] = groups[chosen][row, column]
+        payload[chosen] = block
+
+    header_size = (group_count + 3) // 4
+    header = np.zeros((count, _BYTE_GROUP), dtype=np.uint8)
+    bitslog2 = _GROUP_BITSLOG2[choice]
+    for g in range(group_count):
+        header[:, g // 4] |= bitslog2[:, g] << ((g % 4) * 2)
+
+    items = np.concatenate([header[:, None, :], payload], axis=1)
+    lengths = np.concatenate([np.full((count, 1), header_size), length], axis=1)
+    return items[np.arange(_BYTE_GROUP) < lengths[..., None]]
+
+
+def encode_vertex_buffer(data: np.ndarray) -> bytes:
+    """Encode ``(count, stride)`` bytes (``stride`` a multiple of 4, at most 256) as an ATTRIBUTES stream."""
+    data = np.ascontiguousarray(data, dtype=np.uint8)
+    count, stride = data.shape
+    if stride % 4 or not 0 < stride <= 256:
+        raise ValueError("meshopt vertex stride must be a multiple of 4 in 4..256")
+    previous = np.concatenate([data[:1], data[:-1]]) if count else data
+    delta = data - previous
+    zigzag = (delta << 1) ^ (delta.view(np.int8) >> 7).view(np.uint8)
+
+    chunks: List[np.ndarray] = [np.array([VERTEX_HEADER], dtype=np.uint8)]
+    block = _vertex_block_size(stride)
+    full = count // block
+    if full:
+        # Full blocks in one batch: rows ordered block by block, byte by byte.
+        rows = zigzag[: full * block].reshape(full, block, stride).transpose(0, 2, 1)
+        chunks.append(_encode_byte_rows(rows.reshape(full * stride, block)))
+    if count > full * block:
+        part = zigzag[full * block :]
+        aligned = (part.shape[0] + _BYTE_GROUP - 1) & ~(_BYTE_GROUP - 1)
+        rows = np.zeros((stride, aligned), dtype=np.uint8)
+        rows[:, : part.shape[0]] = part.T
+        chunks.append(_encode_byte_rows(rows))
+    tail = np.zeros(max(_TAIL_SIZE, stride), dtype=np.uint8)
+    if count:
+        tail[-stride:] = data[0]
+    chunks.append(tail)
+    return np.concatenate(chunks).tobytes()
+
+
+def _decode_group(data: bytes, pos: int, bitslog2: int) -> Tuple[List[int], int]:
+    if bitslog2 == 0:
+        return [0] * _BYTE_GROUP, pos
+    if bitslog2 == 3:
+        return list(data[pos : pos + _BYTE_GROUP]), pos + _BYTE_GROUP
+    bits = 1 << bitslog2
+    sentinel = (1 << bits) - 1
+    fixed = _BYTE_GROUP * bits // 8
+    codes = []
+    for byte in data[pos : pos + fixed]:
+        for shift in range(8 - bits, -1, -bits):
+            codes.append((byte >> shift) & sentinel)
+    pos += fixed
+    values = []
+    for code in codes:
+        if code == sentinel:
+            code = data[pos]
+            pos += 1
+        values.append(code)
+    return values, pos
+
+
+def decode_vertex_buffer(buffer: bytes, count: int, stride: int) -> np.ndarray:
+    """Inverse of ``encode_vertex_buffer``: ``(count, stride)`` uint8."""
+    data = bytes(buffer)
+    if not data or data[0] != VERTEX_HEADER:
+        raise ValueError("not a meshopt vertex stream (version 0)")
+    tail_size = max(_TAIL_SIZE, stride)
+    if len(data) < 1 + tail_size:
+        raise ValueError("truncated meshopt vertex stream")
+    last = np.frombuffer(data[len(data) - stride :], dtype=np.uint8).astype(np.int64)
+    out = np.empty((count, stride), dtype=np.uint8)
+    pos = 1
+    block = _vertex_block_size(stride)
+    for start in range(0, count, block):
+        size = min(block, count - start)
+        group_count = (size + _BYTE_GROUP - 1) // _BYTE_GROUP
+        for k in range(stride):
+            header = data[pos : pos + (group_count + 3) // 4]
+            pos += len(header)
+            values: List[int] = []
+            for g in range(group_count):
+                group, pos = _decode_group(data, pos, (header[g // 4] >> ((g % 4) * 2)) & 3)
+                values.extend(group)
+            encoded = np.asarray(values[:size], dtype=np.int64)
+            delta = (encoded >> 1) ^ -(encoded & 1)
+            out[start : start + size, k] = (last[k] + np.cumsum(delta)) & 0xFF
+        last = out[start + size - 1].astype(np.int64)
+    if pos + tail_size != len(data):
+        raise ValueError("meshopt vertex stream has trailing or missing bytes")
+    return out
+
+
+def _encode_vbyte(out: bytearray, value: int) -> None:
+    while True:
+        if value > 127:
+            out.append((value & 127) | 128)
+            value >>= 7
+        else:
+            out.append(value)
+            return
+
+
+def _encode_index(out: bytearray, index: int, last: int) -> None:
+    delta = (index - last) & 0xFFFFFFFF
+    _encode_vbyte(out, ((delta << 1) ^ (0xFFFFFFFF if delta & 0x80000000 else 0)) & 0xFFFFFFFF)
+
+
+def encode_index_buffer(indices: np.ndarray) -> bytes:
+    """Encode a triangle list as a TRIANGLES stream (edge/vertex FIFOs, version 1).
+
+    Triangles may come back rotated (winding kept), as with meshoptimizer.
+    """
+    flat = np.asarray(indices, dtype=np.int64).ravel()
+    if flat.shape[0] % 3:
+        raise ValueError("meshopt triangle stream needs a multiple of 3 indices")
+    codes = bytearray([INDEX_HEADER])
+    data = bytearray()
+    # The 16-entry FIFOs are kept as "item -> number of its latest push";
+    # an item is in a FIFO while fewer than 16 pushes followed it.
+    edges: Dict[Tuple[int, int], int] = {}
+    vertices: Dict[int, int] = {}
+    edge_pushes = 0
+    vertex_pushes = 0
+    next_index = 0
+    last = 0
+
+    def fifo_age(fifo: Dict, item, pushes: int) -> int:
+        seen = fifo.get(item, -17)
+        return pushes - 1 - seen if pushes - seen <= 16 else -1
+
+    for tri in flat.reshape(-1, 3).tolist():
+        # Youngest of the triangle's three edges in the edge FIFO, and its rotation.
+        found = 64
+        for rotation in range(3):
+            seen = edges.get((tri[rotation], tri[rotation - 2]), -17)
+            if edge_pushes - seen <= 16:
+                found = min(found, ((edge_pushes - 1 - seen) << 2) | rotation)
+        if found < 60:
+            a, b, c = (tri[k] for k in _TRIANGLE_ORDER[found & 3])
+            fc = fifo_age(vertices, c, vertex_pushes)
+            if 1 <= fc < 13:
+                fec = fc
+            elif c == next_index:
+                fec = 0
+                next_index += 1
+            else:
+                fec = 15
+                # Strip-like neighbours of the last free index get their own codes.
+                if c + 1 == last:
+                    fec, last = 13, c
+                elif c == last + 1:
+                    fec, last = 14, c
+            codes.append(((found >> 2) << 4) | fec)
+            if fec == 15:
+                _encode_index(data, c, last)
+                last = c
+            if fec == 0 or fec >= 13:
+                vertices[c] = vertex_pushes
+                vertex_pushes += 1
+            edges[(c, b)] = edge_pushes
+            edges[(a, c)] = edge_pushes + 1
+            edge_pushes += 2
+            continue
+
+        rotation = 1 if tri[1] == next_index else 2 if tri[2] == next_index else 0
+        a, b, c = (tri[k] for k in _TRIANGLE_ORDER[rotation])
+        reset = a == 0 and b == 1 and c == 2 and next_index > 0
+        if reset:
+            next_index = 0
+            vertices.clear()
+        fb = fifo_age(vertices, b, vertex_pushes)
+        fc = fifo_age(vertices, c, vertex_pushes)
+        fea = 15
+        if a == next_index:
+            fea = 0
+            next_index += 1
+        if 0 <= fb < 14:
+            feb = fb + 1
+        elif b == next_index:
+            feb = 0
+            next_index += 1
+        else:
+            feb = 15
+        if 0 <= fc < 14:
+            fec = fc + 1
+        elif c == next_index:
+            fec = 0
+            next_index += 1
+        else:
+            fec = 15
+        codeaux = (feb << 4) | fec
+        table_index = _CODEAUX_TABLE.find(bytes([codeaux]))
+        if fea == 0 and 0 <= table_index < 14 and not reset:
+            codes.append(0xF0 | table_index)
+        else:
+            codes.append(0xF0 | 14 | fea)
+            data.append(codeaux)
+        for vertex, code in ((a, fea), (b, feb), (c, fec)):
+            if code == 15:
+                _encode_index(data, vertex, last)
+                last = vertex
+        for vertex, code in ((a, fea), (b, feb), (c, fec)):
+            if code == 0 or code == 15:
+                vertices[vertex] = vertex_pushes
+                vertex_pushes += 1
+        edges[(b, a)] = edge_pushes
+        edges[(c, b)] = edge_pushes + 1
+        edges[(a, c)] = edge_pushes + 2
+        edge_pushes += 3
+    return bytes(codes + data + _CODEAUX_TABLE)
+
+
+def _decode_vbyte(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 127) << shift
+        if byte < 128:
+            return value, pos
+        shift += 7
+
+
+def decode_index_buffer(buffer: bytes, count: int) -> np.ndarray:
+    """Inverse of ``encode_index_buffer``: ``count`` uint32 indices."""
+    data = bytes(buffer)
+    if count % 3 or not data or data[0] != INDEX_HEADER:
+        raise ValueError("not a meshopt triangle stream (version 1)")
+    if len(data) < 1 + count // 3 + 16:
+        raise ValueError("truncated meshopt triangle stream")
+    table = data[-16:]
+    out = np.empty(count, dtype=np.uint32)
+    edge_fifo = [(0, 0)] * 16
+    vertex_fifo = [0] * 16
+    edge_offset = vertex_offset = 0
+    next_index = last = 0
+    pos = 1 + count // 3
+
+    def decode_free(pos: int, last: int) -> Tuple[int, int]:
+        value, pos = _decode_vbyte(data, pos)
+        return (last + ((value >> 1) ^ -(value & 1))) & 0xFFFFFFFF, pos
+
+    for t in range(count // 3):
+        code = data[1 + t]
+        if code < 0xF0:
+            a, b = edge_fifo[(edge_offset - 1 - (code >> 4)) & 15]
+            fec = code & 15
+            push = True
+            if fec == 0:
+                c = next_index
+                next_index += 1
+            elif fec < 13:
+                c = vertex_fifo[(vertex_offset - 1 - fec) & 15]
+                push = False
+            elif fec < 15:
+                c = last = (last + (-1 if fec == 13 else 1)) & 0xFFFFFFFF
+            else:
+                c, pos = decode_free(pos, last)
+                last = c
+            if push:
+                vertex_fifo[vertex_offset] = c
+                vertex_offset = (vertex_offset + 1) & 15
+            edges = ((c, b), (a, c))
+        else:
+            if code < 0xFE:
+                codeaux = table[code & 15]
+                fea = 0
+            else:
+                codeaux = data[pos]
+                pos += 1
+                fea = 0 if code == 0xFE else 15
+                if codeaux == 0:
+                    next_index = 0
+            feb, fec = codeaux >> 4, codeaux & 15
+            picked = []
+            for fe in (fea, feb, fec):
+                if fe == 0:
+                    picked.append(next_index)
+                    next_index += 1
+                elif fe < 15:
+                    picked.append(vertex_fifo[(vertex_offset - fe) & 15])
+                else:
+                    picked.append(None)
+            for k, fe in enumerate((fea, feb, fec)):
+                if fe == 15:
+                    picked[k], pos = decode_free(pos, last)
+                    last = picked[k]
+            a, b, c = picked
+            for vertex, fe in ((a, 0), (b, feb), (c, fec)):
+                if fe == 0 or fe == 15:
+                    vertex_fifo[vertex_offset] = vertex
+                    vertex_offset = (vertex_offset + 1) & 15
+            edges = ((b, a), (c, b), (a, c))
+        out[3 * t : 3 * t + 3] = (a, b, c)
+        for edge in edges:
+            edge_fifo[edge_offset] = edge
+            edge_offset = (edge_offset + 1) & 15
+    if pos != len(data) - 16:
+        raise ValueError("meshopt triangle stream has trailing or missing bytes")
+    return out
+
+
+def encode_filter_oct(normals: np.ndarray) -> np.ndarray:
+    """``(n, 4)`` int8 octahedral encoding (u, v, 127, 0) of unit ``normals`` for the OCTAHEDRAL filter."""
+    n = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+    length = np.abs(n).sum(axis=1)
+    safe = np.where(length == 0.0, np.float32(1.0), length)
+    scale = np.where(length == 0.0, np.float32(0.0), np.float32(1.0) / safe)
+    x, y, z = n[:, 0] * scale, n[:, 1] * scale, n[:, 2]
+    one = np.float32(1.0)
+    u = np.where(z >= 0.0, x, (one - np.abs(y)) * np.where(x >= 0.0, one, -one))
+    v = np.where(z >= 0.0, y, (one - np.abs(x)) * np.where(y >= 0.0, one, -one))
+    out = np.zeros((n.shape[0], 4), dtype=np.int8)
+    out[:, 0] = _quantize_snorm8(u)
+    out[:, 1] = _quantize_snorm8(v)
+    out[:, 2] = 127
+    return out
+
+
+def _quantize_snorm8(value: np.ndarray) -> np.ndarray:
+    value = np.clip(value.astype(np.float32), -1.0, 1.0)
+    rounded = value * np.float32(127.0) + np.where(value >= 0.0, np.float32(0.5), np.float32(-0.5))
+    return np.trunc(rounded).astype(np.int8)
+
+
+def decode_filter_oct(data: np.ndarray) -> np.ndarray:
+    """What a decoder's OCTAHEDRAL filter makes of ``(n, 4)`` int8 data: normalized xyz plus the 4th byte.
+
+    Scalar reference arithmetic; SIMD decoders may differ by one unit.
+    """
+    data = np.asarray(data, dtype=np.int8).reshape(-1, 4)
+    x = data[:, 0].astype(np.float32)
+    y = data[:, 1].astype(np.float32)
+    z = data[:, 2].astype(np.float32) - np.abs(x) - np.abs(y)
+    t = np.minimum(z, np.float32(0.0))
+    x = x + np.where(x >= 0.0, t, -t)
+    y = y + np.where(y >= 0.0, t, -t)
+    scale = np.float32(127.0) / np.sqrt(x * x + y * y + z * z)
+    out = data.copy()
+    for k, value in enumerate((x, y, z)):
+        rounded = value * scale + np.where(value >= 0.0, np.float32(0.5), np.float32(-0.5))
+        out[:, k] = np.trunc(rounded).astype(np.int8)
+    return out
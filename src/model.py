@@ -1,30 +1,262 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 import math
-from typing import Callable, Dict, Iterable, List, Tuple
+import os
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from shapely.geometry import GeometryCollection, LineString, MultiPolygon, Point, Polygon
-from shapely.ops import triangulate, unary_union
+import numpy as np
+
+from shapely.geometry import GeometryCollection, LineString, MultiPolygon, Polygon
+from shapely.ops import unary_union
 
 from .plan import PlanGeometry, WING_EDGE_INDICES
+from .predicates import PointPredicates, outward_normals
+from .terrain import EMBANKMENT_WIDTH, SegmentIndex, TerrainField, TerrainMeshSettings, mesh_terrain
+from .triangulate import triangulate_polygon
 
 Point2D = Tuple[float, float]
 Point3D = Tuple[float, float, float]
 Triangle3D = Tuple[Point3D, Point3D, Point3D]
 
 
+# Vertices closer than this (feet, per axis after rounding) are welded together.
+WELD_TOLERANCE = 1e-6
+# Batches up to this many points are welded with dict lookups, not np.unique.
+_SCALAR_WELD_MAX = 64
+
+
+def _grow(array: np.ndarray, used: int, needed: int) -> np.ndarray:
+    if needed <= array.shape[0]:
+        return array
+    grown = np.empty((max(needed, 2 * array.shape[0]),) + array.shape[1:], dtype=array.dtype)
+    grown[:used] = array[:used]
+    return grown
+
+
+class MeshBuffer(Sequence):
+    """Indexed, vertex-welded triangles for one (component, material) bucket.
+
+    Positions go into a growable ``(V, 3)`` float64 vertex table keyed by their
+    coordinates quantized to ``weld_tolerance`` (``0`` welds only exact
+    duplicates); triangles are rows of a ``(T, 3)`` index buffer.  Indexing and
+    iteration still yield ``Triangle3D`` tuples for list-based callers.
+    """
+
+    __slots__ = ("_vertices", "_vertex_count", "_faces", "_size", "_lookup", "_quantum")
+
+    def __init__(self, weld_tolerance: float = WELD_TOLERANCE, capacity: int = 16) -> None:
+        self._vertices = np.empty((max(capacity, 1), 3), dtype=np.float64)
+        self._vertex_count = 0
+        self._faces = np.empty((max(capacity, 1), 3), dtype=np.int64)
+        self._size = 0
+        self._lookup: Dict[tuple, int] = {}
+        self._quantum = float(weld_tolerance)
+
+    def _key(self, x: float, y: float, z: float) -> tuple:
+        q = self._quantum
+        if q <= 0.0:
+            return (x, y, z)
+        return (round(x / q), round(y / q), round(z / q))
+
+    def _vertex_index(self, point: Point3D) -> int:
+        x, y, z = float(point[0]), float(point[1]), float(point[2])
+        key = self._key(x, y, z)
+        index = self._lookup.get(key)
+        if index is None:
+            index = self._vertex_count
+            self._vertices = _grow(self._vertices, index, index + 1)
+            self._vertices[index] = (x, y, z)
+            self._vertex_count += 1
+            self._lookup[key] = index
+        return index
+
+    def add_vertices(self, points) -> np.ndarray:
+        """Weld ``(n, 3)`` points into the vertex table; returns their indices."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if points.shape[0] <= _SCALAR_WELD_MAX:
+            return np.array([self._vertex_index(p) for p in points.tolist()], dtype=np.int64)
+        if self._quantum > 0.0:
+            keys = np.rint(points / self._quantum).astype(np.int64)
+        else:
+            keys = points
+        unique_keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        # Assign new vertices in first-appearance order so the table is deterministic.
+        order = np.argsort(first, kind="stable")
+        resolved = np.empty(unique_keys.shape[0], dtype=np.int64)
+        if not self._lookup:
+            # Empty bucket (e.g. merging a worker's buffers): every key is new.
+            count = order.shape[0]
+            self._vertices = _grow(self._vertices, 0, count)
+            self._vertices[:count] = points[first[order]]
+            self._vertex_count = count
+            resolved[order] = np.arange(count)
+            self._lookup = dict(zip(map(tuple, unique_keys[order].tolist()), range(count)))
+            return resolved[inverse.reshape(-1)]
+        key_rows = unique_keys.tolist()
+        point_rows = points.tolist()
+        for u in order.tolist():
+            key = tuple(key_rows[u])
+            index = self._lookup.get(key)
+            if index is None:
+                index = self._vertex_count
+                self._vertices = _grow(self._vertices, index, index + 1)
+                self._vertices[index] = point_rows[int(first[u])]
+                self._vertex_count += 1
+                self._lookup[key] = index
+            resolved[u] = index
+        return resolved[inverse.reshape(-1)]
+
+    def _add_faces(self, faces: np.ndarray) -> None:
+        self._faces = _grow(self._faces, self._size, self._size + faces.shape[0])
+        self._faces[self._size : self._size + faces.shape[0]] = faces
+        self._size += faces.shape[0]
+
+    def append(self, tri: Triangle3D) -> None:
+        a, b, c = tri
+        self._faces = _grow(self._faces, self._size, self._size + 1)
+        self._faces[self._size] = (self._vertex_index(a), self._vertex_index(b), self._vertex_index(c))
+        self._size += 1
+
+    def extend(self, tris) -> None:
+        tris = np.asarray(tris, dtype=np.float64).reshape(-1, 3, 3)
+        self._add_faces(self.add_vertices(tris.reshape(-1, 3)).reshape(-1, 3))
+
+    def add_indexed(self, vertices, faces) -> None:
+        """Append triangles given as a vertex array and ``(m, 3)`` indices into it."""
+        remap = self.add_vertices(vertices)
+        self._add_faces(remap[np.asarray(faces, dtype=np.int64).reshape(-1, 3)])
+
+    @property
+    def vertices(self) -> np.ndarray:
+        view = self._vertices[: self._vertex_count]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def faces(self) -> np.ndarray:
+        view = self._faces[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def vertex_count(self) -> int:
+        return self._vertex_count
+
+    @property
+    def array(self) -> np.ndarray:
+        """``(T, 3, 3)`` triangle corners (a new array)."""
+        return self._vertices[self._faces[: self._size]]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_as_triangle(rows) for rows in self.array[index].tolist()]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("triangle index out of range")
+        return _as_triangle(self._vertices[self._faces[index]].tolist())
+
+    def __iter__(self) -> Iterator[Triangle3D]:
+        return (_as_triangle(rows) for rows in self.array.tolist())
+
+
+class MaterialTriangles(Sequence):
+    """One material's triangles across components, read in place from their buffers."""
+
+    __slots__ = ("_buffers",)
+
+    def __init__(self, buffers: List[MeshBuffer]) -> None:
+        self._buffers = buffers
+
+    @property
+    def array(self) -> np.ndarray:
+        if len(self._buffers) == 1:
+            return self._buffers[0].array
+        return np.concatenate([buf.array for buf in self._buffers]) if self._buffers else np.empty((0, 3, 3))
+
+    def __len__(self) -> int:
+        return sum(len(buf) for buf in self._buffers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        for buf in self._buffers:
+            if index < len(buf):
+                return buf[index]
+            index -= len(buf)
+        raise IndexError("triangle index out of range")
+
+    def __iter__(self) -> Iterator[Triangle3D]:
+        for buf in self._buffers:
+            yield from buf
+
+
+def _as_triangle(rows: List[List[float]]) -> Triangle3D:
+    a, b, c = rows
+    return (a[0], a[1], a[2]), (b[0], b[1], b[2]), (c[0], c[1], c[2])
+
+
 @dataclass
 class ModelData:
-    triangles_by_material: Dict[str, List[Triangle3D]] = field(default_factory=lambda: defaultdict(list))
-    triangles_by_component: Dict[str, Dict[str, List[Triangle3D]]] = field(
-        default_factory=lambda: defaultdict(lambda: defaultdict(list))
-    )
+    """Indexed triangles stored once per (component, material) bucket.
+
+    ``triangles_by_component`` and ``triangles_by_material`` are views over the
+    same buckets, in insertion order.
+    """
+
+    buckets: Dict[Tuple[str, str], MeshBuffer] = field(default_factory=dict)
+    weld_tolerance: float = WELD_TOLERANCE
+
+    def _bucket(self, component: str, material: str) -> MeshBuffer:
+        bucket = self.buckets.get((component, material))
+        if bucket is None:
+            bucket = self.buckets[(component, material)] = MeshBuffer(self.weld_tolerance)
+        return bucket
 
     def add_triangle(self, material: str, tri: Triangle3D, component: str = "model") -> None:
-        self.triangles_by_material[material].append(tri)
-        self.triangles_by_component[component][material].append(tri)
+        self._bucket(component, material).append(tri)
+
+    def add_triangles(self, material: str, tris, component: str = "model") -> None:
+        """Append an ``(n, 3, 3)`` array (or sequence) of triangles in one call."""
+        self._bucket(component, material).extend(tris)
+
+    def add_indexed(self, material: str, vertices, faces, component: str = "model") -> None:
+        """Append triangles that share ``vertices`` (``(n, 3)``) via ``faces`` (``(m, 3)``)."""
+        self._bucket(component, material).add_indexed(vertices, faces)
+
+    @property
+    def triangles_by_component(self) -> Dict[str, Dict[str, MeshBuffer]]:
+        view: Dict[str, Dict[str, MeshBuffer]] = {}
+        for (component, material), bucket in self.buckets.items():
+            view.setdefault(component, {})[material] = bucket
+        return view
+
+    @property
+    def triangles_by_material(self) -> Dict[str, MaterialTriangles]:
+        grouped: Dict[str, List[MeshBuffer]] = {}
+        for (_component, material), bucket in self.buckets.items():
+            grouped.setdefault(material, []).append(bucket)
+        return {material: MaterialTriangles(buffers) for material, buffers in grouped.items()}
+
+    def triangle_count(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def vertex_count(self) -> int:
+        return sum(bucket.vertex_count for bucket in self.buckets.values())
+
+    def merge(self, other: "ModelData") -> None:
+        """Append ``other``'s triangles, keeping their per-material and per-component order."""
+        for (component, material), bucket in other.buckets.items():
+            self._bucket(component, material).add_indexed(bucket.vertices, bucket.faces)
 
 
 def _triangle_normal(tri: Triangle3D) -> Point3D:
@@ -52,26 +284,6 @@ def _iter_polygons(geometry) -> Iterable[Polygon]:
     raise TypeError(f"Unsupported geometry type: {geometry.geom_type}")
 
 
-def _triangles_for_polygon(poly: Polygon) -> List[Tuple[Point2D, Point2D, Point2D]]:
-    tris = []
-    for tri in triangulate(poly):
-        if not poly.covers(tri.representative_point()):
-            continue
-        coords = list(tri.exterior.coords)[:-1]
-        if len(coords) != 3:
-            continue
-        tris.append((coords[0], coords[1], coords[2]))
-    return tris
-
-
-def _signed_area_2d(points: List[Point2D]) -> float:
-    area = 0.0
-    for i, (x0, y0) in enumerate(points):
-        x1, y1 = points[(i + 1) % len(points)]
-        area += x0 * y1 - x1 * y0
-    return area * 0.5
-
-
 def _add_polygon_cap(
     mesh: ModelData,
     material: str,
@@ -80,19 +292,131 @@ def _add_polygon_cap(
     up: bool,
     component: str = "model",
 ) -> None:
-    for tri in _triangles_for_polygon(poly):
-        tri_pts = [tri[0], tri[1], tri[2]]
-        if _signed_area_2d(tri_pts) < 0:
-            tri_pts.reverse()
-
-        tri3d: Triangle3D = (
-            (tri_pts[0][0], tri_pts[0][1], z),
-            (tri_pts[1][0], tri_pts[1][1], z),
-            (tri_pts[2][0], tri_pts[2][1], z),
-        )
-        if not up:
-            tri3d = (tri3d[0], tri3d[2], tri3d[1])
-        mesh.add_triangle(material, tri3d, component=component)
+    xy, faces = triangulate_polygon(poly)
+    if not len(faces):
+        return
+    if not up:
+        faces = faces[:, [0, 2, 1]]
+    vertices = np.column_stack([xy, np.full(xy.shape[0], z)])
+    mesh.add_indexed(material, vertices, faces, component=component)
+
+
+def oriented_quads(quads: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Split ``(Q, 4, 3)`` quads ``abcd`` into ``abc``/``acd`` triangles facing ``out`` (``(Q, 3)``).
+
+    Returns ``(2Q, 3, 3)``, two triangles per quad in order; a quad whose
+    first triangle faces away from ``out`` is reversed (``acb``/``adc``).
+    """
+    quads = np.asarray(quads, dtype=np.float64).reshape(-1, 4, 3)
+    out = np.asarray(out, dtype=np.float64).reshape(-1, 3)
+    a, b, c = quads[:, 0], quads[:, 1], quads[:, 2]
+    ab = b - a
+    ac = c - a
+    nx = ab[:, 1] * ac[:, 2] - ab[:, 2] * ac[:, 1]
+    ny = ab[:, 2] * ac[:, 0] - ab[:, 0] * ac[:, 2]
+    nz = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+    dot = nx * out[:, 0] + ny * out[:, 1] + nz * out[:, 2]
+    # A degenerate first triangle counts as facing up, as in _triangle_normal.
+    degenerate = (nx == 0.0) & (ny == 0.0) & (nz == 0.0)
+    flip = np.where(degenerate, out[:, 2], dot) < 0.0
+    tris = quads[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 2, 3, 3)
+    tris[flip] = tris[flip][:, :, [0, 2, 1]]
+    return tris.reshape(-1, 3, 3)
+
+
+# Corner indices of each box face (outer, inner, top, bottom, start, end) into
+# the per-edge corners: outer start/end bottom, outer end/start top, then the
+# same four on the inner side.
+_BOX_FACES = np.array(
+    [
+        [0, 1, 2, 3],
+        [5, 4, 7, 6],
+        [3, 2, 6, 7],
+        [4, 5, 1, 0],
+        [0, 3, 7, 4],
+        [5, 6, 2, 1],
+    ]
+)
+
+
+def wall_triangles(
+    ring,
+    z0,
+    z1,
+    thickness: float = 0.0,
+    outward=None,
+    closed: bool = True,
+    edges=None,
+    cap_top: bool = True,
+    cap_bottom: bool = True,
+    end_caps=True,
+    extend_ends: bool = False,
+    box: bool | None = None,
+) -> np.ndarray:
+    """Wall triangles along every edge of an ``(N, 2)`` ring in one pass.
+
+    ``z0``/``z1`` are scalars or per-vertex ``(N,)`` heights.  ``outward``
+    (``(E, 2)``, one hint per edge; default: right of the edge direction)
+    picks which side faces out.  Each edge is a box centred on the edge with
+    outer, inner, top, bottom and end faces, optionally lengthened by half the
+    thickness at both ends so corners overlap; ``box`` (default: thickness >
+    0) False gives a single face instead.  ``edges`` masks which edges to build and
+    ``end_caps`` may be an ``(E, 2)`` mask of start/end caps.  Returns
+    ``(T, 3, 3)``, ordered edge by edge and face by face.
+    """
+    ring = np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+    size = ring.shape[0]
+    count = size if closed else size - 1
+    if count < 1:
+        return np.empty((0, 3, 3))
+    nxt = np.arange(1, count + 1) % size
+    p0 = ring[:count]
+    p1 = ring[nxt]
+    z_lo = np.broadcast_to(np.asarray(z0, dtype=np.float64), (size,))
+    z_hi = np.broadcast_to(np.asarray(z1, dtype=np.float64), (size,))
+
+    delta = p1 - p0
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    keep = length >= 1e-9
+    if edges is not None:
+        keep &= np.asarray(edges, dtype=bool)
+    safe = np.where(keep, length, 1.0)
+    u = delta / safe[:, None]
+    n = np.column_stack([-delta[:, 1] / safe, delta[:, 0] / safe])
+    hint = -n if outward is None else np.asarray(outward, dtype=np.float64).reshape(-1, 2)
+    n[n[:, 0] * hint[:, 0] + n[:, 1] * hint[:, 1] < 0.0] *= -1.0
+
+    half = thickness / 2.0
+    if extend_ends:
+        p0 = p0 - u * half
+        p1 = p1 + u * half
+    offset = n * half
+    corners = np.empty((count, 8, 3))
+    corners[:, [0, 3], :2] = (p0 + offset)[:, None]
+    corners[:, [1, 2], :2] = (p1 + offset)[:, None]
+    corners[:, [4, 7], :2] = (p0 - offset)[:, None]
+    corners[:, [5, 6], :2] = (p1 - offset)[:, None]
+    corners[:, [0, 4], 2] = z_lo[:count, None]
+    corners[:, [1, 5], 2] = z_lo[nxt, None]
+    corners[:, [2, 6], 2] = z_hi[nxt, None]
+    corners[:, [3, 7], 2] = z_hi[:count, None]
+    out = np.zeros((count, 6, 3))
+    out[:, 0, :2] = n
+    out[:, 1, :2] = -n
+    out[:, 2, 2] = 1.0
+    out[:, 3, 2] = -1.0
+    out[:, 4, :2] = -u
+    out[:, 5, :2] = u
+
+    faces = np.zeros((count, 6), dtype=bool)
+    faces[:, 0] = True
+    if thickness > 0.0 if box is None else box:
+        faces[:, 1] = True
+        faces[:, 2] = cap_top
+        faces[:, 3] = cap_bottom
+        faces[:, 4:6] = np.broadcast_to(np.asarray(end_caps, dtype=bool), (count, 2))
+    faces &= keep[:, None]
+    return oriented_quads(corners[:, _BOX_FACES][faces], out[faces])
 
 
 def _add_solid_wall_edge(
@@ -109,81 +433,105 @@ def _add_solid_wall_edge(
     cap_bottom: bool = True,
 ) -> None:
     """Create a solid wall box for a single edge with real thickness."""
-    edge_dx = p1[0] - p0[0]
-    edge_dy = p1[1] - p0[1]
-    edge_len = math.hypot(edge_dx, edge_dy)
-    if edge_len < 1e-9:
-        return
+    ring = np.array([p0, p1], dtype=np.float64)
+    tris = wall_triangles(
+        ring,
+        z0,
+        z1,
+        wall_thickness,
+        outward=outward_normals(ring[:1], ring[1:], PointPredicates(interior_test_polygon)),
+        closed=False,
+        cap_top=cap_top,
+        cap_bottom=cap_bottom,
+        extend_ends=True,
+        box=True,
+    )
+    if len(tris):
+        mesh.add_triangles(material, tris, component=component)
 
-    # Perpendicular unit normal
-    nx = -edge_dy / edge_len
-    ny = edge_dx / edge_len
-
-    # Determine outward direction using interior test
-    mx = (p0[0] + p1[0]) * 0.5
-    my = (p0[1] + p1[1]) * 0.5
-    probe = Point(mx + nx * 0.05, my + ny * 0.05)
-    if interior_test_polygon.covers(probe):
-        nx, ny = -nx, -ny  # flip so (nx, ny) points outward
-
-    half_t = wall_thickness / 2.0
-    edge_ux = edge_dx / edge_len
-    edge_uy = edge_dy / edge_len
-    end_ext = half_t
-    q0 = (p0[0] - edge_ux * end_ext, p0[1] - edge_uy * end_ext)
-    q1 = (p1[0] + edge_ux * end_ext, p1[1] + edge_uy * end_ext)
-
-    # Outer vertices (offset outward)
-    o0 = (q0[0] + nx * half_t, q0[1] + ny * half_t)
-    o1 = (q1[0] + nx * half_t, q1[1] + ny * half_t)
-    # Inner vertices (offset inward)
-    i0 = (q0[0] - nx * half_t, q0[1] - ny * half_t)
-    i1 = (q1[0] - nx * half_t, q1[1] - ny * half_t)
-
-    def _quad(a: Point3D, b: Point3D, c: Point3D, d: Point3D, out: Point3D) -> None:
-        """Add a quad (a,b,c,d) with normals facing toward 'out' direction."""
-        t1: Triangle3D = (a, b, c)
-        t2: Triangle3D = (a, c, d)
-        n = _triangle_normal(t1)
-        # Check if normal points toward out direction
-        dot = n[0] * out[0] + n[1] * out[1] + n[2] * out[2]
-        if dot < 0:
-            t1 = (t1[0], t1[2], t1[1])
-            t2 = (t2[0], t2[2], t2[1])
-        mesh.add_triangle(material, t1, component=component)
-        mesh.add_triangle(material, t2, component=component)
-
-    # Outer face (normal points outward)
-    _quad((o0[0], o0[1], z0), (o1[0], o1[1], z0),
-          (o1[0], o1[1], z1), (o0[0], o0[1], z1),
-          (nx, ny, 0.0))
-
-    # Inner face (normal points inward)
-    _quad((i1[0], i1[1], z0), (i0[0], i0[1], z0),
-          (i0[0], i0[1], z1), (i1[0], i1[1], z1),
-          (-nx, -ny, 0.0))
 
-    if cap_top:
-        # Top cap (normal points up)
-        _quad((o0[0], o0[1], z1), (o1[0], o1[1], z1),
-              (i1[0], i1[1], z1), (i0[0], i0[1], z1),
-              (0.0, 0.0, 1.0))
+# Ring edges whose endpoints are both this close to a skip edge's are skipped.
+SKIP_EDGE_TOLERANCE = 1e-3
 
-    if cap_bottom:
-        # Bottom cap (normal points down)
-        _quad((i0[0], i0[1], z0), (i1[0], i1[1], z0),
-              (o1[0], o1[1], z0), (o0[0], o0[1], z0),
-              (0.0, 0.0, -1.0))
 
-    # Left end cap (at p0, normal along -edge direction)
-    _quad((o0[0], o0[1], z0), (o0[0], o0[1], z1),
-          (i0[0], i0[1], z1), (i0[0], i0[1], z0),
-          (-edge_ux, -edge_uy, 0.0))
+class EdgeIndex:
+    """Set of undirected plan edges with O(1) approximate membership.
+
+    Endpoints are snapped to shared vertex ids: each is hashed into a grid of
+    ``tolerance``-sized cells, and a query probes its cell and the eight
+    neighbours, so any point within ``tolerance`` of a stored endpoint
+    matches it.  A new endpoint takes the id of the nearest stored point.
+    Edges are stored as sorted id pairs, so ``(p0, p1)`` and ``(p1, p0)`` are
+    the same edge.
+    """
 
-    # Right end cap (at p1, normal along +edge direction)
-    _quad((i1[0], i1[1], z0), (i1[0], i1[1], z1),
-          (o1[0], o1[1], z1), (o1[0], o1[1], z0),
-          (edge_ux, edge_uy, 0.0))
+    __slots__ = ("tolerance", "_cells", "_points", "_edges")
+
+    def __init__(self, edges: Iterable[Tuple[Point2D, Point2D]] = (), tolerance: float = SKIP_EDGE_TOLERANCE) -> None:
+        self.tolerance = float(tolerance)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._points: List[Point2D] = []
+        self._edges: set = set()
+        for p0, p1 in edges:
+            self.add(p0, p1)
+
+    @classmethod
+    def coerce(cls, edges: "EdgeIndex | Iterable[Tuple[Point2D, Point2D]] | None") -> "EdgeIndex | None":
+        """``edges`` as an index (None or empty stays None); indexes pass through."""
+        if edges is None or isinstance(edges, EdgeIndex):
+            return edges or None
+        index = cls(edges)
+        return index or None
+
+    def _cell(self, point: Point2D) -> Tuple[int, int]:
+        return (math.floor(point[0] / self.tolerance), math.floor(point[1] / self.tolerance))
+
+    def _matches(self, point: Point2D) -> List[int]:
+        """Ids of stored points within ``tolerance`` of ``point``, nearest first."""
+        cx, cy = self._cell(point)
+        tol = self.tolerance
+        found: List[Tuple[float, int]] = []
+        for ix in (cx - 1, cx, cx + 1):
+            for iy in (cy - 1, cy, cy + 1):
+                for pid in self._cells.get((ix, iy), ()):
+                    q = self._points[pid]
+                    dist = math.hypot(point[0] - q[0], point[1] - q[1])
+                    if dist < tol:
+                        found.append((dist, pid))
+        found.sort()
+        return [pid for _dist, pid in found]
+
+    def _find(self, point: Point2D) -> int | None:
+        matches = self._matches(point)
+        return matches[0] if matches else None
+
+    def _id(self, point: Point2D) -> int:
+        pid = self._find(point)
+        if pid is None:
+            pid = len(self._points)
+            self._points.append((float(point[0]), float(point[1])))
+            self._cells.setdefault(self._cell(point), []).append(pid)
+        return pid
+
+    def add(self, p0: Point2D, p1: Point2D) -> None:
+        a, b = self._id(p0), self._id(p1)
+        self._edges.add((a, b) if a <= b else (b, a))
+
+    def __contains__(self, edge: Tuple[Point2D, Point2D]) -> bool:
+        # Stored points are at least ``tolerance`` apart, but a query can sit
+        # within ``tolerance`` of two of them; any matching pair counts.
+        starts = self._matches(edge[0])
+        if not starts:
+            return False
+        ends = self._matches(edge[1])
+        return any(((a, b) if a <= b else (b, a)) in self._edges for a in starts for b in ends)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+
+# Edges to leave open: an EdgeIndex shared between emitters, or (p0, p1) pairs.
+SkipEdges = Optional[Union[EdgeIndex, Iterable[Tuple[Point2D, Point2D]]]]
 
 
 def _add_wall_band_ring(
@@ -194,7 +542,7 @@ def _add_wall_band_ring(
     z1: float,
     interior_test_polygon: Polygon,
     component: str = "model",
-    skip_edges: List[Tuple[Point2D, Point2D]] | None = None,
+    skip_edges: SkipEdges = None,
     wall_thickness: float = 0.0,
     cap_top: bool = True,
     cap_bottom: bool = True,
@@ -203,43 +551,25 @@ def _add_wall_band_ring(
     if len(pts) < 2 or z1 <= z0:
         return
 
-    for i in range(len(pts)):
-        p0 = pts[i]
-        p1 = pts[(i + 1) % len(pts)]
-
-        # Check if this edge should be skipped (open connection)
-        if skip_edges:
-            skip = False
-            for se0, se1 in skip_edges:
-                d0a = math.hypot(p0[0] - se0[0], p0[1] - se0[1])
-                d0b = math.hypot(p0[0] - se1[0], p0[1] - se1[1])
-                d1a = math.hypot(p1[0] - se0[0], p1[1] - se0[1])
-                d1b = math.hypot(p1[0] - se1[0], p1[1] - se1[1])
-                if (d0a < 1e-3 and d1b < 1e-3) or (d0b < 1e-3 and d1a < 1e-3):
-                    skip = True
-                    break
-            if skip:
-                continue
-
-        if wall_thickness > 0:
-            _add_solid_wall_edge(mesh, material, p0, p1, z0, z1,
-                                wall_thickness, interior_test_polygon, component,
-                                cap_top=cap_top, cap_bottom=cap_bottom)
-        else:
-            tri1: Triangle3D = ((p0[0], p0[1], z0), (p1[0], p1[1], z0), (p1[0], p1[1], z1))
-            tri2: Triangle3D = ((p0[0], p0[1], z0), (p1[0], p1[1], z1), (p0[0], p0[1], z1))
-
-            nx, ny, _ = _triangle_normal(tri1)
-            if abs(nx) + abs(ny) > 1e-9:
-                mx = (p0[0] + p1[0]) * 0.5
-                my = (p0[1] + p1[1]) * 0.5
-                probe = Point(mx + nx * 0.05, my + ny * 0.05)
-                if interior_test_polygon.covers(probe):
-                    tri1 = (tri1[0], tri1[2], tri1[1])
-                    tri2 = (tri2[0], tri2[2], tri2[1])
-
-            mesh.add_triangle(material, tri1, component=component)
-            mesh.add_triangle(material, tri2, component=component)
+    skip_index = EdgeIndex.coerce(skip_edges)
+    ring = np.asarray(pts, dtype=np.float64)[:, :2]
+    edges = None
+    if skip_index is not None:
+        # Check which edges should be skipped (open connections)
+        edges = [(p0, p1) not in skip_index for p0, p1 in zip(pts, pts[1:] + pts[:1])]
+    tris = wall_triangles(
+        ring,
+        z0,
+        z1,
+        wall_thickness,
+        outward=outward_normals(ring, np.roll(ring, -1, axis=0), PointPredicates(interior_test_polygon)),
+        edges=edges,
+        cap_top=cap_top,
+        cap_bottom=cap_bottom,
+        extend_ends=True,
+    )
+    if len(tris):
+        mesh.add_triangles(material, tris, component=component)
 
 
 def _add_vertical_walls_for_polygon(
@@ -249,29 +579,19 @@ def _add_vertical_walls_for_polygon(
     z1: float,
     material: str,
     component: str = "model",
-    skip_edges: List[Tuple[Point2D, Point2D]] | None = None,
+    skip_edges: SkipEdges = None,
     wall_thickness: float = 0.0,
     cap_top: bool = True,
     cap_bottom: bool = True,
 ) -> None:
+    skip_edges = EdgeIndex.coerce(skip_edges)
     _add_wall_band_ring(mesh, material, list(poly.exterior.coords), z0, z1, poly, component=component, skip_edges=skip_edges, wall_thickness=wall_thickness, cap_top=cap_top, cap_bottom=cap_bottom)
     for interior in poly.interiors:
         _add_wall_band_ring(mesh, material, list(interior.coords), z0, z1, poly, component=component, skip_edges=skip_edges, wall_thickness=wall_thickness, cap_top=cap_top, cap_bottom=cap_bottom)
 
 
 def _edge_outward_normal(p0: Point2D, p1: Point2D, interior_test_polygon: Polygon) -> Point2D:
-    dx = p1[0] - p0[0]
-    dy = p1[1] - p0[1]
-    edge_len = math.hypot(dx, dy)
-    if edge_len < 1e-9:
-        return (0.0, 0.0)
-    nx = -dy / edge_len
-    ny = dx / edge_len
-    mx = (p0[0] + p1[0]) * 0.5
-    my = (p0[1] + p1[1]) * 0.5
-    probe = Point(mx + nx * 0.05, my + ny * 0.05)
-    if interior_test_polygon.covers(probe):
-        nx, ny = -nx, -ny
+    nx, ny = outward_normals([p0], [p1], PointPredicates(interior_test_polygon))[0].tolist()
     return (nx, ny)
 
 
@@ -441,7 +761,7 @@ def add_extruded_polygon(
     side_material: str,
     component: str = "model",
     wall_thickness: float = 0.0,
-    skip_edges: List[Tuple[Point2D, Point2D]] | None = None,
+    skip_edges: SkipEdges = None,
 ) -> None:
     if z1 <= z0:
         return
@@ -620,40 +940,86 @@ def _motorcourt_and_driveway(
             extra_segments, extra_left_edges, extra_right_edges)
 
 
-def _add_terrain(
-    mesh: ModelData,
-    plan: PlanGeometry,
-    config: Dict[str, float],
-) -> None:
+@dataclass
+class _SiteLayout:
+    """Terrain profile and driveway layout shared by the site builders."""
+
+    lower_ground: float
+    upper_ground: float
+    driveway_width: float
+    approach_slope: float
+    y_break: float
+    y_low: float
+    motorcourt: Polygon
+    driveway: Polygon
+    drive_start: Point2D
+    drive_end: Point2D
+    floor_pts: Tuple[Point2D, Point2D, Point2D, Point2D]
+    extra_drive_segs: List[Polygon]
+    extra_left_edges: List[Point2D]
+    extra_right_edges: List[Point2D]
+    drive_ux: float
+    drive_uy: float
+    drive_len: float
+    driveway_end_z: float
+    terrain: TerrainField
+    driveway_cut: Polygon
+    driveway_cut_terrain: Polygon
+    cut_start_left: Point2D
+    cut_start_right: Point2D
+    cut_end_left: Point2D
+    cut_end_right: Point2D
+
+    def base_terrain_z(self, x: float, y: float) -> float:
+        return _terrain_profile(y, self.y_break, self.y_low, self.upper_ground, self.lower_ground)
+
+    def driveway_z(self, x: float, y: float) -> float:
+        proj = (x - self.drive_start[0]) * self.drive_ux + (y - self.drive_start[1]) * self.drive_uy
+        t = max(0.0, min(1.0, proj / self.drive_len))
+        return self.lower_ground + (self.driveway_end_z - self.lower_ground) * t
+
+    def extra_drive_z(self, x: float, y: float) -> float:
+        proj = (x - self.drive_end[0]) * self.drive_ux + (y - self.drive_end[1]) * self.drive_uy
+        dist = max(0.0, proj)
+        return self.driveway_end_z - self.approach_slope * dist
+
+    def terrain_z(self, x: float, y: float) -> float:
+        return float(self.terrain.z(np.array([x]), np.array([y]))[0])
+
+    def terrain_z_points(self, points) -> np.ndarray:
+        """Graded terrain heights for an ``(n, 2)`` array of plan points in one call."""
+        return self.terrain.z_points(points)
+
+
+_SITE_LAYOUT_CACHE: Dict[Tuple[object, ...], _SiteLayout] = {}
+_SITE_LAYOUT_CACHE_SIZE = 4
+
+
+def _site_layout(plan: PlanGeometry, config: Dict[str, float]) -> _SiteLayout:
+    # Config is read unconditionally (before the cache lookup) so every caller
+    # records the same reads when config access is being tracked.
     lower_ground = float(config["lower_ground"])
     upper_ground = float(config["upper_ground"])
-    terrain_drop = float(config["terrain_drop"])
     s = float(config["s"])
     driveway_width = float(config.get("driveway_width", 12.0))
     driveway_length = float(config.get("driveway_length", 67.5))
     driveway_flat_length = float(config.get("driveway_flat_length", 50.0))
     driveway_curve_length = float(config.get("driveway_curve_length", 50.0))
     approach_slope = float(config.get("driveway_approach_slope", 0.02))
-    slab_t = float(config.get("slab_thickness", 1.0))
-    z_base = lower_ground - terrain_drop
-
-    house_points = plan.master_triangle + plan.hex_vertices + [p for wing in plan.wing_polygons.values() for p in wing]
-    min_x = min(p[0] for p in house_points)
-    max_x = max(p[0] for p in house_points)
-    min_y = min(p[1] for p in house_points)
-    max_y = max(p[1] for p in house_points)
-    cx = (min_x + max_x) * 0.5
-    cy = (min_y + max_y) * 0.5
-    side = max(max_x - min_x, max_y - min_y) * 6.0
-    half = side * 0.5
-    terrain_square = Polygon(
-        [
-            (cx - half, cy - half),
-            (cx + half, cy - half),
-            (cx + half, cy + half),
-            (cx - half, cy + half),
-        ]
+    key = (
+        plan.fingerprint,
+        lower_ground,
+        upper_ground,
+        s,
+        driveway_width,
+        driveway_length,
+        driveway_flat_length,
+        driveway_curve_length,
+        approach_slope,
     )
+    layout = _SITE_LAYOUT_CACHE.get(key)
+    if layout is not None:
+        return layout
 
     # Terrain stays flat across to the back of Wings A and B, then drops
     wing_a_back_y = max(p[1] for p in plan.wing_polygons["A"])
@@ -665,82 +1031,33 @@ def _add_terrain(
     )
     y_low = wing_c_outer_mid[1]
 
-    cutout_list = [
-        Polygon(plan.hex_vertices),
-        Polygon(plan.wing_polygons["A"]),
-        Polygon(plan.wing_polygons["B"]),
-        Polygon(plan.wing_polygons["C"]),
-    ]
-    # Side courtyards cut from terrain
-    if plan.side_courtyard_right:
-        cutout_list.append(Polygon(plan.side_courtyard_right))
-    if plan.side_courtyard_left:
-        cutout_list.append(Polygon(plan.side_courtyard_left))
-    building_cutouts = unary_union(cutout_list)
     motorcourt, driveway, drive_start, drive_end, floor_pts, extra_drive_segs, extra_left_edges, extra_right_edges = _motorcourt_and_driveway(
         s, driveway_width, driveway_length, driveway_flat_length, driveway_curve_length
     )
 
-    def _base_terrain_z(x: float, y: float) -> float:
-        return _terrain_profile(y, y_break, y_low, upper_ground, lower_ground)
-
     drive_dx = drive_end[0] - drive_start[0]
     drive_dy = drive_end[1] - drive_start[1]
     drive_len = max(math.hypot(drive_dx, drive_dy), 1e-6)
     drive_ux, drive_uy = drive_dx / drive_len, drive_dy / drive_len
     cut_nx, cut_ny = -drive_uy, drive_ux
-    driveway_end_z = _base_terrain_z(drive_end[0], drive_end[1])
-    half_w_drive = driveway_width * 0.5
-
-    def driveway_z(x: float, y: float) -> float:
-        proj = (x - drive_start[0]) * drive_ux + (y - drive_start[1]) * drive_uy
-        t = max(0.0, min(1.0, proj / drive_len))
-        return lower_ground + (driveway_end_z - lower_ground) * t
-
-    def extra_drive_z(x: float, y: float) -> float:
-        proj = (x - drive_end[0]) * drive_ux + (y - drive_end[1]) * drive_uy
-        dist = max(0.0, proj)
-        return driveway_end_z - approach_slope * dist
+    driveway_end_z = _terrain_profile(drive_end[1], y_break, y_low, upper_ground, lower_ground)
 
-    # Embankment grading: terrain slopes down to meet extended driveway
-    _EMBANKMENT_W = 20.0
+    embankment = None
     if extra_left_edges or extra_right_edges:
-        _all_ext = extra_left_edges + extra_right_edges
-        _ext_bbox = (
-            min(p[0] for p in _all_ext) - _EMBANKMENT_W,
-            min(p[1] for p in _all_ext) - _EMBANKMENT_W,
-            max(p[0] for p in _all_ext) + _EMBANKMENT_W,
-            max(p[1] for p in _all_ext) + _EMBANKMENT_W,
-        )
-    else:
-        _ext_bbox = (0.0, 0.0, 0.0, 0.0)
+        embankment = SegmentIndex([extra_left_edges, extra_right_edges], EMBANKMENT_WIDTH)
+    terrain = TerrainField(
+        y_break=y_break,
+        y_low=y_low,
+        upper_ground=upper_ground,
+        lower_ground=lower_ground,
+        drive_end=drive_end,
+        drive_ux=drive_ux,
+        drive_uy=drive_uy,
+        driveway_end_z=driveway_end_z,
+        approach_slope=approach_slope,
+        embankment=embankment,
+    )
 
-    def terrain_z(x: float, y: float) -> float:
-        base = _base_terrain_z(x, y)
-        if not extra_left_edges and not extra_right_edges:
-            return base
-        if x < _ext_bbox[0] or x > _ext_bbox[2] or y < _ext_bbox[1] or y > _ext_bbox[3]:
-            return base
-        min_dist = _EMBANKMENT_W + 1.0
-        nearest_dz = base
-        for edge_list in (extra_left_edges, extra_right_edges):
-            for i in range(len(edge_list) - 1):
-                e0, e1 = edge_list[i], edge_list[i + 1]
-                edx, edy = e1[0] - e0[0], e1[1] - e0[1]
-                seg_sq = edx * edx + edy * edy
-                if seg_sq < 1e-12:
-                    continue
-                et = max(0.0, min(1.0, ((x - e0[0]) * edx + (y - e0[1]) * edy) / seg_sq))
-                px, py = e0[0] + et * edx, e0[1] + et * edy
-                d = math.hypot(x - px, y - py)
-                if d < min_dist:
-                    min_dist = d
-                    nearest_dz = extra_drive_z(px, py)
-        if min_dist >= _EMBANKMENT_W:
-            return base
-        blend = min_dist / _EMBANKMENT_W
-        blend = blend * blend * (3.0 - 2.0 * blend)
-        return nearest_dz + blend * (base - nearest_dz)
     # Keep driveway top cut aligned to driveway wall footprint at the courtyard seam.
     cut_start_half = driveway_width * 0.5
     cut_start_a = (drive_start[0] + cut_nx * cut_start_half, drive_start[1] + cut_ny * cut_start_half)
@@ -816,211 +1133,255 @@ def _add_terrain(
             if isinstance(driveway_cut_terrain, MultiPolygon):
                 driveway_cut_terrain = max(driveway_cut_terrain.geoms, key=lambda g: g.area)
 
+    layout = _SiteLayout(
+        lower_ground=lower_ground,
+        upper_ground=upper_ground,
+        driveway_width=driveway_width,
+        approach_slope=approach_slope,
+        y_break=y_break,
+        y_low=y_low,
+        motorcourt=motorcourt,
+        driveway=driveway,
+        drive_start=drive_start,
+        drive_end=drive_end,
+        floor_pts=floor_pts,
+        extra_drive_segs=extra_drive_segs,
+        extra_left_edges=extra_left_edges,
+        extra_right_edges=extra_right_edges,
+        drive_ux=drive_ux,
+        drive_uy=drive_uy,
+        drive_len=drive_len,
+        driveway_end_z=driveway_end_z,
+        terrain=terrain,
+        driveway_cut=driveway_cut,
+        driveway_cut_terrain=driveway_cut_terrain,
+        cut_start_left=cut_start_left,
+        cut_start_right=cut_start_right,
+        cut_end_left=cut_end_left,
+        cut_end_right=cut_end_right,
+    )
+    if len(_SITE_LAYOUT_CACHE) >= _SITE_LAYOUT_CACHE_SIZE:
+        _SITE_LAYOUT_CACHE.pop(next(iter(_SITE_LAYOUT_CACHE)))
+    _SITE_LAYOUT_CACHE[key] = layout
+    return layout
+
+
+def _build_terrain(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    site = _site_layout(plan, config)
+    terrain_drop = float(config["terrain_drop"])
+    z_base = site.lower_ground - terrain_drop
+
+    house_points = list(plan.master_triangle) + list(plan.hex_vertices) + [p for wing in plan.wing_polygons.values() for p in wing]
+    min_x = min(p[0] for p in house_points)
+    max_x = max(p[0] for p in house_points)
+    min_y = min(p[1] for p in house_points)
+    max_y = max(p[1] for p in house_points)
+    cx = (min_x + max_x) * 0.5
+    cy = (min_y + max_y) * 0.5
+    side = max(max_x - min_x, max_y - min_y) * 6.0
+    half = side * 0.5
+    terrain_square = Polygon(
+        [
+            (cx - half, cy - half),
+            (cx + half, cy - half),
+            (cx + half, cy + half),
+            (cx - half, cy + half),
+        ]
+    )
+
+    cutout_list = [
+        plan.atrium_polygon,
+        plan.polygon("wing_A"),
+        plan.polygon("wing_B"),
+        plan.polygon("wing_C"),
+    ]
+    # Side courtyards cut from terrain
+    if plan.side_courtyard_right:
+        cutout_list.append(plan.polygon("side_courtyard_right"))
+    if plan.side_courtyard_left:
+        cutout_list.append(plan.polygon("side_courtyard_left"))
+    building_cutouts = unary_union(cutout_list)
+
     # Include extra driveway segments in terrain cutout
-    all_drive_cuts = [building_cutouts, motorcourt, driveway_cut_terrain]
-    for seg_poly in extra_drive_segs:
+    all_drive_cuts = [building_cutouts, site.motorcourt, site.driveway_cut_terrain]
+    for seg_poly in site.extra_drive_segs:
         if seg_poly.is_valid and not seg_poly.is_empty:
             all_drive_cuts.append(seg_poly)
     terrain_area = terrain_square.difference(unary_union(all_drive_cuts))
 
+    terrain_mesh = str(config.get("terrain_mesh", "adaptive"))
+    if terrain_mesh == "adaptive":
+        settings = TerrainMeshSettings.from_config(config)
+        underside = [triangulate_polygon(poly) for poly in _iter_polygons(terrain_area)]
+        reserved = sum(len(faces) for _xy, faces in underside)
+        graded = mesh_terrain((cx - half, cy - half), side, terrain_area, site.terrain_z_points, settings, reserved)
+        mesh.add_indexed("ground", graded.vertices, graded.faces, component="ground")
+        for xy, faces in underside:
+            if len(faces):
+                vertices = np.column_stack([xy, np.full(xy.shape[0], z_base)])
+                mesh.add_indexed("ground", vertices, faces[:, [0, 2, 1]], component="ground")
+        _add_terrain_skirt(mesh, graded.outline.tolist(), z_base)
+        return
+    if terrain_mesh != "polygon":
+        raise ValueError(f"Unknown terrain_mesh {terrain_mesh!r}; use 'adaptive' or 'polygon'.")
+
     for poly in _iter_polygons(terrain_area):
-        for tri in _triangles_for_polygon(poly):
-            p0, p1, p2 = tri
-            t0 = (p0[0], p0[1], terrain_z(p0[0], p0[1]))
-            t1 = (p1[0], p1[1], terrain_z(p1[0], p1[1]))
-            t2 = (p2[0], p2[1], terrain_z(p2[0], p2[1]))
-            n = _triangle_normal((t0, t1, t2))
-            tri3 = (t0, t1, t2) if n[2] >= 0 else (t0, t2, t1)
-            mesh.add_triangle("ground", tri3, component="ground")
+        # Faces are counter-clockwise in plan, so the height field faces up.
+        xy, faces = triangulate_polygon(poly)
+        vertices = np.column_stack([xy, site.terrain_z_points(xy)])
+        mesh.add_indexed("ground", vertices, faces, component="ground")
 
         _add_polygon_cap(mesh, "ground", poly, z_base, up=False, component="ground")
 
         ext = list(poly.exterior.coords)
         ext = ext[:-1] if ext and ext[0] == ext[-1] else ext
-        for i in range(len(ext)):
-            p0 = ext[i]
-            p1 = ext[(i + 1) % len(ext)]
-            z0 = terrain_z(p0[0], p0[1])
-            z1 = terrain_z(p1[0], p1[1])
-            tri1 = ((p0[0], p0[1], z_base), (p1[0], p1[1], z_base), (p1[0], p1[1], z1))
-            tri2 = ((p0[0], p0[1], z_base), (p1[0], p1[1], z1), (p0[0], p0[1], z0))
-            mesh.add_triangle("ground", tri1, component="ground")
-            mesh.add_triangle("ground", tri2, component="ground")
-
+        if ext:
+            ext_z = site.terrain_z_points(ext)
+            _add_terrain_skirt(mesh, np.column_stack([np.asarray(ext)[:, :2], ext_z]).tolist(), z_base)
+
+
+def _add_terrain_skirt(mesh: ModelData, ring: List[Point3D], z_base: float) -> None:
+    """Vertical ground faces from each terrain edge of ``ring`` down to ``z_base``."""
+    for i in range(len(ring)):
+        p0 = ring[i]
+        p1 = ring[(i + 1) % len(ring)]
+        z0, z1 = p0[2], p1[2]
+        tri1 = ((p0[0], p0[1], z_base), (p1[0], p1[1], z_base), (p1[0], p1[1], z1))
+        tri2 = ((p0[0], p0[1], z_base), (p1[0], p1[1], z1), (p0[0], p0[1], z0))
+        mesh.add_triangle("ground", tri1, component="ground")
+        mesh.add_triangle("ground", tri2, component="ground")
+
+
+def _build_motorcourt(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    site = _site_layout(plan, config)
+    lower_ground = site.lower_ground
+    driveway_cut = site.driveway_cut
+    motorcourt = site.motorcourt
     slab_t = float(config["slab_thickness"])
-    driveway_cut_boundary = driveway_cut.boundary
-    atrium_front_boundary = LineString(plan.atrium_front_edge)
+    driveway_cut_boundary = PointPredicates(driveway_cut.boundary)
+    atrium_front_boundary = PointPredicates(LineString(plan.atrium_front_edge))
     motorcourt_floor_area = motorcourt.difference(driveway_cut)
     for poly in _iter_polygons(motorcourt_floor_area):
         # Motorcourt slab: top + bottom + side walls (1' thick)
         _add_polygon_cap(mesh, "concrete", poly, lower_ground, up=True, component="motorcourt_floor")
         _add_polygon_cap(mesh, "concrete", poly, lower_ground - slab_t, up=False, component="motorcourt_floor")
-        centroid_xy = (poly.centroid.x, poly.centroid.y)
-        ring = list(poly.exterior.coords)
-        ring = ring[:-1] if ring and ring[0] == ring[-1] else ring
-        for i in range(len(ring)):
-            p0 = ring[i]
-            p1 = ring[(i + 1) % len(ring)]
-            midpoint = ((p0[0] + p1[0]) * 0.5, (p0[1] + p1[1]) * 0.5)
-            on_driveway_cut_edge = (
-                driveway_cut_boundary.distance(Point(p0)) < 1e-5
-                and driveway_cut_boundary.distance(Point(p1)) < 1e-5
-                and driveway_cut_boundary.distance(Point(midpoint)) < 1e-5
-            )
-            on_atrium_front_edge = (
-                atrium_front_boundary.distance(Point(p0)) < 1e-5
-                and atrium_front_boundary.distance(Point(p1)) < 1e-5
-                and atrium_front_boundary.distance(Point(midpoint)) < 1e-5
-            )
-            if on_driveway_cut_edge:
-                continue
-            if on_atrium_front_edge:
-                # Add slab edge face (motorcourt slab thickness visible from atrium side)
-                se1_af: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground))
-                se2_af: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground), (p0[0], p0[1], lower_ground))
-                sn_af = _triangle_normal(se1_af)
-                af_mx = (p0[0] + p1[0]) * 0.5
-                af_my = (p0[1] + p1[1]) * 0.5
-                af_tcx = centroid_xy[0] - af_mx
-                af_tcy = centroid_xy[1] - af_my
-                if (sn_af[0] * af_tcx + sn_af[1] * af_tcy) > 0.0:
-                    se1_af = (se1_af[0], se1_af[2], se1_af[1])
-                    se2_af = (se2_af[0], se2_af[2], se2_af[1])
-                mesh.add_triangle("concrete", se1_af, component="motorcourt_walls")
-                mesh.add_triangle("concrete", se2_af, component="motorcourt_walls")
-                continue
-            z0 = terrain_z(p0[0], p0[1])
-            z1 = terrain_z(p1[0], p1[1])
-            # Retaining wall from slab bottom to terrain
-            tri1: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p1[0], p1[1], z1), (p1[0], p1[1], lower_ground - slab_t))
-            tri2: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p0[0], p0[1], z0), (p1[0], p1[1], z1))
-            nx, ny, _ = _triangle_normal(tri1)
-            mx = (tri1[0][0] + tri1[1][0] + tri1[2][0]) / 3.0
-            my = (tri1[0][1] + tri1[1][1] + tri1[2][1]) / 3.0
-            to_center_x = centroid_xy[0] - mx
-            to_center_y = centroid_xy[1] - my
-            if (nx * to_center_x + ny * to_center_y) < 0.0:
-                tri1 = (tri1[0], tri1[2], tri1[1])
-                tri2 = (tri2[0], tri2[2], tri2[1])
-            mesh.add_triangle("concrete", tri1, component="motorcourt_walls")
-            mesh.add_triangle("concrete", tri2, component="motorcourt_walls")
-            # Slab edge (from slab bottom to slab top)
-            se1: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground))
-            se2: Triangle3D = ((p0[0], p0[1], lower_ground - slab_t), (p1[0], p1[1], lower_ground), (p0[0], p0[1], lower_ground))
-            sn = _triangle_normal(se1)
-            if (sn[0] * to_center_x + sn[1] * to_center_y) > 0.0:
-                se1 = (se1[0], se1[2], se1[1])
-                se2 = (se2[0], se2[2], se2[1])
-            mesh.add_triangle("concrete", se1, component="motorcourt_walls")
-            mesh.add_triangle("concrete", se2, component="motorcourt_walls")
+        ring = np.asarray(poly.exterior.coords, dtype=np.float64)[:, :2]
+        ring = ring[:-1] if len(ring) > 1 and np.array_equal(ring[0], ring[-1]) else ring
+        nxt = np.roll(ring, -1, axis=0)
+        midpoints = (ring + nxt) * 0.5
+
+        def on_boundary(boundary: PointPredicates) -> np.ndarray:
+            near = boundary.near(np.vstack([ring, nxt, midpoints]), 1e-5).reshape(3, -1)
+            return near.all(axis=0)
+
+        on_driveway_cut_edge = on_boundary(driveway_cut_boundary)
+        on_atrium_front_edge = on_boundary(atrium_front_boundary)
+        to_center = np.array([poly.centroid.x, poly.centroid.y]) - midpoints
+        slab_bottom = lower_ground - slab_t
+        # Retaining wall from slab bottom to terrain, facing the motorcourt;
+        # none along the atrium front, where only the slab edge shows.
+        walls = wall_triangles(
+            ring,
+            slab_bottom,
+            site.terrain_z_points(ring),
+            outward=to_center,
+            edges=~on_driveway_cut_edge & ~on_atrium_front_edge,
+        )
+        # Slab edge (from slab bottom to slab top), facing away from it.
+        slab_edges = wall_triangles(ring, slab_bottom, lower_ground, outward=-to_center, edges=~on_driveway_cut_edge)
+        for tris in (walls, slab_edges):
+            if len(tris):
+                mesh.add_triangles("concrete", tris, component="motorcourt_walls")
+
+
+def _add_draped_slab(
+    mesh: ModelData,
+    poly: Polygon,
+    surface_z: Callable[[float, float], float],
+    slab_t: float,
+    component: str,
+) -> None:
+    """Top surface following ``surface_z`` plus a bottom surface ``slab_t`` below it."""
+    xy, faces = triangulate_polygon(poly)
+    top = np.column_stack([xy, [surface_z(x, y) for x, y in xy.tolist()]])
+    mesh.add_indexed("concrete", top, faces, component=component)
+    bottom = top - (0.0, 0.0, slab_t)
+    mesh.add_indexed("concrete", bottom, faces[:, [0, 2, 1]], component=component)
+
+
+def _build_driveway(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    site = _site_layout(plan, config)
+    terrain_z = site.terrain_z
+    driveway_z = site.driveway_z
+    slab_t = float(config["slab_thickness"])
+    drive_start, drive_end = site.drive_start, site.drive_end
+    floor_sl, floor_sr, floor_er, floor_el = site.floor_pts
+    cut_start_left, cut_start_right = site.cut_start_left, site.cut_start_right
+    cut_end_left, cut_end_right = site.cut_end_left, site.cut_end_right
 
     # Driveway slab: top surface + bottom surface (offset 1' down) + side edge walls
-    for tri in _triangles_for_polygon(driveway):
-        p0, p1, p2 = tri
-        # Top surface
-        t0 = (p0[0], p0[1], driveway_z(p0[0], p0[1]))
-        t1 = (p1[0], p1[1], driveway_z(p1[0], p1[1]))
-        t2 = (p2[0], p2[1], driveway_z(p2[0], p2[1]))
-        n = _triangle_normal((t0, t1, t2))
-        tri3 = (t0, t1, t2) if n[2] >= 0 else (t0, t2, t1)
-        mesh.add_triangle("concrete", tri3, component="driveway_floor")
-        # Bottom surface (1' below)
-        b0 = (p0[0], p0[1], driveway_z(p0[0], p0[1]) - slab_t)
-        b1 = (p1[0], p1[1], driveway_z(p1[0], p1[1]) - slab_t)
-        b2 = (p2[0], p2[1], driveway_z(p2[0], p2[1]) - slab_t)
-        n2 = _triangle_normal((b0, b1, b2))
-        tri3b = (b0, b2, b1) if n2[2] >= 0 else (b0, b1, b2)
-        mesh.add_triangle("concrete", tri3b, component="driveway_floor")
+    _add_draped_slab(mesh, site.driveway, driveway_z, slab_t, "driveway_floor")
 
     wall_pairs = [
         (floor_sl, cut_start_left, cut_end_left, floor_el),
         (floor_sr, cut_start_right, cut_end_right, floor_er),
     ]
     driveway_center_xy = ((drive_start[0] + drive_end[0]) * 0.5, (drive_start[1] + drive_end[1]) * 0.5)
+    quads: List[Tuple[Point3D, Point3D, Point3D, Point3D]] = []
+    outs: List[Point3D] = []
     for f_start, c_start, c_end, f_end in wall_pairs:
         # Wall from slab bottom to terrain (retaining wall visible from outside)
         fs_bot = (f_start[0], f_start[1], driveway_z(f_start[0], f_start[1]) - slab_t)
         fe_bot = (f_end[0], f_end[1], driveway_z(f_end[0], f_end[1]) - slab_t)
         cs = (c_start[0], c_start[1], max(terrain_z(c_start[0], c_start[1]), fs_bot[2]))
         ce = (c_end[0], c_end[1], max(terrain_z(c_end[0], c_end[1]), fe_bot[2]))
-        tri1: Triangle3D = (fs_bot, cs, ce)
-        tri2: Triangle3D = (fs_bot, ce, fe_bot)
-        nx, ny, _ = _triangle_normal(tri1)
         mx = (fs_bot[0] + cs[0] + ce[0]) / 3.0
         my = (fs_bot[1] + cs[1] + ce[1]) / 3.0
         to_center_x = driveway_center_xy[0] - mx
         to_center_y = driveway_center_xy[1] - my
-        if (nx * to_center_x + ny * to_center_y) < 0.0:
-            tri1 = (tri1[0], tri1[2], tri1[1])
-            tri2 = (tri2[0], tri2[2], tri2[1])
-        mesh.add_triangle("concrete", tri1, component="driveway_walls")
-        mesh.add_triangle("concrete", tri2, component="driveway_walls")
-        # Slab edge strip (slab bottom to slab top)
+        quads.append((fs_bot, cs, ce, fe_bot))
+        outs.append((to_center_x, to_center_y, 0.0))
+        # Slab edge strip (slab bottom to slab top), facing away from the centre
         fs_top = (f_start[0], f_start[1], driveway_z(f_start[0], f_start[1]))
         fe_top = (f_end[0], f_end[1], driveway_z(f_end[0], f_end[1]))
-        se1: Triangle3D = (fs_bot, fe_bot, fe_top)
-        se2: Triangle3D = (fs_bot, fe_top, fs_top)
-        sn = _triangle_normal(se1)
-        if (sn[0] * to_center_x + sn[1] * to_center_y) > 0.0:
-            se1 = (se1[0], se1[2], se1[1])
-            se2 = (se2[0], se2[2], se2[1])
-        mesh.add_triangle("concrete", se1, component="driveway_walls")
-        mesh.add_triangle("concrete", se2, component="driveway_walls")
+        quads.append((fs_bot, fe_bot, fe_top, fs_top))
+        outs.append((-to_center_x, -to_center_y, 0.0))
+    mesh.add_triangles("concrete", oriented_quads(np.array(quads), np.array(outs)), component="driveway_walls")
+
+
+def _build_driveway_extension(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    site = _site_layout(plan, config)
+    extra_drive_z = site.extra_drive_z
+    slab_t = float(config["slab_thickness"])
+    extra_left_edges, extra_right_edges = site.extra_left_edges, site.extra_right_edges
 
     # Extra driveway segments (flat + curved sections) — top + bottom surfaces
-    for seg_poly in extra_drive_segs:
+    for seg_poly in site.extra_drive_segs:
         if not seg_poly.is_valid or seg_poly.is_empty:
             continue
-        for tri in _triangles_for_polygon(seg_poly):
-            p0, p1, p2 = tri
-            # Top surface
-            t0 = (p0[0], p0[1], extra_drive_z(p0[0], p0[1]))
-            t1 = (p1[0], p1[1], extra_drive_z(p1[0], p1[1]))
-            t2 = (p2[0], p2[1], extra_drive_z(p2[0], p2[1]))
-            n = _triangle_normal((t0, t1, t2))
-            tri3 = (t0, t1, t2) if n[2] >= 0 else (t0, t2, t1)
-            mesh.add_triangle("concrete", tri3, component="driveway_ext_floor")
-            # Bottom surface (1' below)
-            b0 = (p0[0], p0[1], extra_drive_z(p0[0], p0[1]) - slab_t)
-            b1 = (p1[0], p1[1], extra_drive_z(p1[0], p1[1]) - slab_t)
-            b2 = (p2[0], p2[1], extra_drive_z(p2[0], p2[1]) - slab_t)
-            n2 = _triangle_normal((b0, b1, b2))
-            tri3b = (b0, b2, b1) if n2[2] >= 0 else (b0, b1, b2)
-            mesh.add_triangle("concrete", tri3b, component="driveway_ext_floor")
+        _add_draped_slab(mesh, seg_poly, extra_drive_z, slab_t, "driveway_ext_floor")
 
     # Retaining walls along extra driveway edges (fills terrain-to-driveway gap)
     for edge_points, sign in [(extra_left_edges, 1.0), (extra_right_edges, -1.0)]:
         if len(edge_points) < 2:
             continue
-        for i in range(len(edge_points) - 1):
-            p0 = edge_points[i]
-            p1 = edge_points[i + 1]
-            tz0 = terrain_z(p0[0], p0[1])
-            tz1 = terrain_z(p1[0], p1[1])
-            dz0 = extra_drive_z(p0[0], p0[1])
-            dz1 = extra_drive_z(p1[0], p1[1])
-            dz0_bot = dz0 - slab_t
-            dz1_bot = dz1 - slab_t
-            if tz0 <= dz0_bot + 0.05 and tz1 <= dz1_bot + 0.05:
-                continue
-            top0: Point3D = (p0[0], p0[1], max(tz0, dz0_bot))
-            top1: Point3D = (p1[0], p1[1], max(tz1, dz1_bot))
-            bot0: Point3D = (p0[0], p0[1], dz0_bot)
-            bot1: Point3D = (p1[0], p1[1], dz1_bot)
-            tri1: Triangle3D = (bot0, bot1, top1)
-            tri2: Triangle3D = (bot0, top1, top0)
-            # Orient normals outward (away from driveway center)
-            wnx, wny, _ = _triangle_normal(tri1)
-            edge_dx = p1[0] - p0[0]
-            edge_dy = p1[1] - p0[1]
-            # Cross product of edge direction with up gives outward direction
-            outward_x = -edge_dy * sign
-            outward_y = edge_dx * sign
-            if (wnx * outward_x + wny * outward_y) < 0:
-                tri1 = (tri1[0], tri1[2], tri1[1])
-                tri2 = (tri2[0], tri2[2], tri2[1])
-            mesh.add_triangle("concrete", tri1, component="driveway_ext_walls")
-            mesh.add_triangle("concrete", tri2, component="driveway_ext_walls")
+        points = np.asarray(edge_points, dtype=np.float64)
+        edge_tz = site.terrain_z_points(points)
+        bottom = np.array([extra_drive_z(x, y) for x, y in edge_points]) - slab_t
+        low = edge_tz <= bottom + 0.05
+        delta = points[1:] - points[:-1]
+        # Outward = away from the driveway centre line (edge direction x up).
+        outward = np.column_stack([-delta[:, 1], delta[:, 0]]) * sign
+        tris = wall_triangles(
+            points,
+            bottom,
+            np.maximum(edge_tz, bottom),
+            outward=outward,
+            closed=False,
+            edges=~(low[:-1] & low[1:]),
+        )
+        if len(tris):
+            mesh.add_triangles("concrete", tris, component="driveway_ext_walls")
 
 
 def _add_pyramid_roof(
@@ -1050,7 +1411,7 @@ def _add_pyramid_roof(
 def build_courtyard_shared_front_edge(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
     if not plan.courtyard_polygon:
         return
-    courtyard = Polygon(plan.courtyard_polygon)
+    courtyard = plan.polygon("courtyard")
     top = float(config.get("master_triangle_elevation", float(config["upper_ground"])))
     drop = top + float(config["courtyard_drop"])
     wt_conc = float(config.get("wall_thickness_concrete", 0.0))
@@ -1097,13 +1458,14 @@ def _add_side_courtyards(
     def terrain_z(x: float, y: float) -> float:
         return _terrain_profile(y, y_break, y_low, upper_ground, lower_ground)
 
-    for label, court_verts in [
-        ("side_court_right", plan.side_courtyard_right),
-        ("side_court_left", plan.side_courtyard_left),
+    for label, outline in [
+        ("side_court_right", "side_courtyard_right"),
+        ("side_court_left", "side_courtyard_left"),
     ]:
+        court_verts = plan.points(outline)
         if not court_verts:
             continue
-        court_poly = Polygon(court_verts)
+        court_poly = plan.polygon(outline)
         # Lawn floor at lower_ground level
         _add_polygon_cap(mesh, "ground", court_poly, lower_ground, up=True, component=f"{label}_floor")
 
@@ -1114,118 +1476,47 @@ def _add_side_courtyards(
             key=lambda i: (pts[i][1] + pts[(i + 1) % len(pts)][1]) / 2.0,
         )
         wt_conc = float(config.get("wall_thickness_concrete", 0.667))
-        edge_count = len(pts)
-        edge_enabled = [False] * edge_count
-        for i in range(edge_count):
-            if i == back_edge_idx:
-                continue
-            p0 = pts[i]
-            p1 = pts[(i + 1) % edge_count]
-            tz0 = terrain_z(p0[0], p0[1])
-            tz1 = terrain_z(p1[0], p1[1])
-            wall_top_0 = max(tz0 + retaining_wall_rise, lower_ground)
-            wall_top_1 = max(tz1 + retaining_wall_rise, lower_ground)
-            if wall_top_0 - lower_ground < 0.5 and wall_top_1 - lower_ground < 0.5:
-                continue
-            if math.hypot(p1[0] - p0[0], p1[1] - p0[1]) < 1e-9:
-                continue
-            edge_enabled[i] = True
-
-        for i in range(edge_count):
-            if not edge_enabled[i]:
-                continue
-            p0 = pts[i]
-            p1 = pts[(i + 1) % edge_count]
-            # Terrain height at each vertex
-            tz0 = terrain_z(p0[0], p0[1])
-            tz1 = terrain_z(p1[0], p1[1])
-            # Retaining wall top = terrain + 4', but not below courtyard floor
-            wall_top_0 = max(tz0 + retaining_wall_rise, lower_ground)
-            wall_top_1 = max(tz1 + retaining_wall_rise, lower_ground)
-            # Build thick wall with per-vertex top heights (follows terrain contour)
-            edge_dx = p1[0] - p0[0]
-            edge_dy = p1[1] - p0[1]
-            edge_len = math.hypot(edge_dx, edge_dy)
-            if edge_len < 1e-9:
-                continue
-            # Perpendicular outward normal (away from courtyard center)
-            nx = -edge_dy / edge_len
-            ny = edge_dx / edge_len
-            cx, cy = court_poly.centroid.x, court_poly.centroid.y
-            mx, my = (p0[0] + p1[0]) * 0.5, (p0[1] + p1[1]) * 0.5
-            if nx * (mx - cx) + ny * (my - cy) < 0:
-                nx, ny = -nx, -ny
-            half_t = wt_conc / 2.0
-            # Outer vertices
-            o0 = (p0[0] + nx * half_t, p0[1] + ny * half_t)
-            o1 = (p1[0] + nx * half_t, p1[1] + ny * half_t)
-            # Inner vertices
-            i0 = (p0[0] - nx * half_t, p0[1] - ny * half_t)
-            i1 = (p1[0] - nx * half_t, p1[1] - ny * half_t)
-
-            def _cquad(a, b, c, d, out_dir):
-                t1 = (a, b, c)
-                t2 = (a, c, d)
-                n = _triangle_normal(t1)
-                dot = n[0]*out_dir[0] + n[1]*out_dir[1] + n[2]*out_dir[2]
-                if dot < 0:
-                    t1 = (t1[0], t1[2], t1[1])
-                    t2 = (t2[0], t2[2], t2[1])
-                mesh.add_triangle("concrete", t1, component=f"{label}_walls")
-                mesh.add_triangle("concrete", t2, component=f"{label}_walls")
-
-            z_bot = lower_ground
-            # Outer face (per-vertex top heights)
-            _cquad((o0[0], o0[1], z_bot), (o1[0], o1[1], z_bot),
-                   (o1[0], o1[1], wall_top_1), (o0[0], o0[1], wall_top_0),
-                   (nx, ny, 0.0))
-            # Inner face
-            _cquad((i1[0], i1[1], z_bot), (i0[0], i0[1], z_bot),
-                   (i0[0], i0[1], wall_top_0), (i1[0], i1[1], wall_top_1),
-                   (-nx, -ny, 0.0))
-            # Top cap (sloped)
-            _cquad((o0[0], o0[1], wall_top_0), (o1[0], o1[1], wall_top_1),
-                   (i1[0], i1[1], wall_top_1), (i0[0], i0[1], wall_top_0),
-                   (0.0, 0.0, 1.0))
-            # Bottom cap
-            _cquad((i0[0], i0[1], z_bot), (i1[0], i1[1], z_bot),
-                   (o1[0], o1[1], z_bot), (o0[0], o0[1], z_bot),
-                   (0.0, 0.0, -1.0))
-            # End caps only where walls terminate (adjacent edge absent)
-            prev_i = (i - 1) % edge_count
-            next_i = (i + 1) % edge_count
-            if not edge_enabled[prev_i]:
-                _cquad((o0[0], o0[1], z_bot), (o0[0], o0[1], wall_top_0),
-                       (i0[0], i0[1], wall_top_0), (i0[0], i0[1], z_bot),
-                       (-edge_dx / edge_len, -edge_dy / edge_len, 0.0))
-            if not edge_enabled[next_i]:
-                _cquad((i1[0], i1[1], z_bot), (i1[0], i1[1], wall_top_1),
-                       (o1[0], o1[1], wall_top_1), (o1[0], o1[1], z_bot),
-                       (edge_dx / edge_len, edge_dy / edge_len, 0.0))
-
-
-def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
-    mesh = ModelData()
+        ring = np.asarray(pts, dtype=np.float64)
+        # Retaining wall top = terrain + 4', but not below courtyard floor
+        # (per vertex, so the wall follows the terrain contour).
+        wall_top = np.maximum([terrain_z(x, y) + retaining_wall_rise for x, y in pts], lower_ground)
+        edge_len = np.hypot(*(np.roll(ring, -1, axis=0) - ring).T)
+        edge_enabled = ((wall_top - lower_ground >= 0.5) | (np.roll(wall_top, -1) - lower_ground >= 0.5)) & (edge_len >= 1e-9)
+        edge_enabled[back_edge_idx] = False
+        # Outward = away from the courtyard centre; end caps only where walls
+        # terminate (adjacent edge absent).
+        court_centroid = plan.centroid(outline)
+        centre = np.array([court_centroid.x, court_centroid.y])
+        outward = (ring + np.roll(ring, -1, axis=0)) * 0.5 - centre
+        end_caps = np.column_stack([~np.roll(edge_enabled, 1), ~np.roll(edge_enabled, -1)])
+        tris = wall_triangles(
+            ring,
+            lower_ground,
+            wall_top,
+            wt_conc,
+            outward=outward,
+            edges=edge_enabled,
+            end_caps=end_caps,
+            box=True,
+        )
+        if len(tris):
+            mesh.add_triangles("concrete", tris, component=f"{label}_walls")
 
-    lower_ground = float(config["lower_ground"])
-    upper_ground = float(config["upper_ground"])
+
+def _master_triangle_elevation(config: Dict[str, float]) -> float:
+    if "master_triangle_elevation" in config:
+        return float(config["master_triangle_elevation"])
+    return float(config["upper_ground"]) + float(config["ceiling_height"])
+
+
+def _build_master_triangle(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
     slab = float(config["slab_thickness"])
     ceiling = float(config["ceiling_height"])
-    master_triangle_elevation = float(config.get("master_triangle_elevation", upper_ground + ceiling))
-    atrium_floor = float(config["atrium_floor"])
-    atrium_roof_base = float(config["atrium_roof_base"])
-    atrium_roof_rise = float(config["atrium_roof_rise"])
-
+    master_triangle_elevation = _master_triangle_elevation(config)
     wt_conc = float(config.get("wall_thickness_concrete", 0.0))
     wt_glass = float(config.get("wall_thickness_glass", 0.0))
-
-    triangle_poly = Polygon(plan.master_triangle)
-    atrium_poly = Polygon(plan.hex_vertices)
-    courtyard_module_name = str(config.get("courtyard_module", "none"))
-    courtyard_module = COURTYARD_MODULES.get(courtyard_module_name)
-    if courtyard_module is None:
-        raise ValueError(f"Unknown courtyard module: {courtyard_module_name}")
-    _add_terrain(mesh, plan, config)
+    triangle_poly = plan.polygon("master_triangle")
+    atrium_poly = plan.atrium_polygon
 
     triangle_slab_poly = triangle_poly.difference(atrium_poly)
     add_extruded_polygon(
@@ -1263,11 +1554,19 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         wall_thickness=wt_conc,
     )
 
+
+def _build_garage(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    lower_ground = float(config["lower_ground"])
+    slab = float(config["slab_thickness"])
+    ceiling = float(config["ceiling_height"])
+    atrium_floor = float(config["atrium_floor"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+
     garage_floor = lower_ground
     for wing_name in ("A", "B"):
-        wing_poly = Polygon(plan.wing_polygons[wing_name])
+        wing_poly = plan.polygon(f"wing_{wing_name}")
         i0, i1 = WING_EDGE_INDICES[wing_name]
-        atrium_edge_garage = (plan.hex_vertices[i0], plan.hex_vertices[i1])
+        atrium_edge_garage = EdgeIndex([(plan.hex_vertices[i0], plan.hex_vertices[i1])])
 
         # Garage floor slab: caps + side walls on non-atrium edges only.
         # Atrium-facing wall is a separate component (wing_X_atrium_wall)
@@ -1280,7 +1579,7 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         _add_vertical_walls_for_polygon(
             mesh, wing_poly, atrium_floor, garage_floor + slab,
             "concrete", component=comp_gf,
-            skip_edges=[atrium_edge_garage],
+            skip_edges=atrium_edge_garage,
             wall_thickness=wt_conc,
             cap_top=False,
             cap_bottom=False,
@@ -1293,7 +1592,7 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
             garage_floor + slab + ceiling,
             "concrete",
             component=f"wing_{wing_name.lower()}_garage_facade",
-            skip_edges=[atrium_edge_garage],
+            skip_edges=atrium_edge_garage,
             wall_thickness=wt_conc,
             cap_top=False,
             cap_bottom=False,
@@ -1302,6 +1601,16 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         # NOTE: garage_roof_slab removed - wing_floor at same z range covers it,
         # and having both caused z-fighting on the atrium edge.
 
+
+def _build_wings(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    lower_ground = float(config["lower_ground"])
+    upper_ground = float(config["upper_ground"])
+    slab = float(config["slab_thickness"])
+    ceiling = float(config["ceiling_height"])
+    master_triangle_elevation = _master_triangle_elevation(config)
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    wt_glass = float(config.get("wall_thickness_glass", 0.0))
+
     wing_floor_elevation = {"A": upper_ground, "B": upper_ground, "C": lower_ground}
     double_height_wings = {"C"}
     # Edges facing the atrium that should be open (no wall)
@@ -1311,9 +1620,9 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         "C": (plan.hex_vertices[1], plan.hex_vertices[2]),   # hex v1→v2
     }
     for wing_name, floor in wing_floor_elevation.items():
-        wing_poly = Polygon(plan.wing_polygons[wing_name])
+        wing_poly = plan.polygon(f"wing_{wing_name}")
         wall_top = master_triangle_elevation if wing_name in double_height_wings else floor + ceiling
-        wing_skip = [wing_atrium_edges[wing_name]] if wing_name in wing_atrium_edges else []
+        wing_skip = EdgeIndex([wing_atrium_edges[wing_name]] if wing_name in wing_atrium_edges else [])
         add_extruded_polygon(
             mesh,
             wing_poly,
@@ -1350,6 +1659,15 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
             wall_thickness=wt_conc,
         )
 
+
+def _build_wing_atrium_walls(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    lower_ground = float(config["lower_ground"])
+    slab = float(config["slab_thickness"])
+    master_triangle_elevation = _master_triangle_elevation(config)
+    atrium_floor = float(config["atrium_floor"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    wing_floor_elevation = {"C": lower_ground}
+
     # Concrete wall on the atrium-facing edge of each wing.
     # Single solid wall from atrium floor up to where upper wing glazing begins.
     for wing_name in ("A", "B", "C"):
@@ -1362,12 +1680,19 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         else:
             z_top = wing_floor_elevation[wing_name] + slab
         if z_top > z_bot:
-            w_poly = Polygon(plan.wing_polygons[wing_name])
+            w_poly = plan.polygon(f"wing_{wing_name}")
             _add_solid_wall_edge(mesh, "concrete", p0, p1, z_bot, z_top,
                                 wt_conc, w_poly,
                                 component=f"wing_{wing_name.lower()}_atrium_wall",
                                 cap_top=False, cap_bottom=(wing_name in ("A", "B")))
 
+
+def _build_atrium_floor(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    slab = float(config["slab_thickness"])
+    atrium_floor = float(config["atrium_floor"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    atrium_poly = plan.atrium_polygon
+
     # Atrium floor slab.
     # Polygon buffered OUTWARD by half concrete wall thickness so the marble
     # cap extends under/through the surrounding structural walls, preventing
@@ -1409,14 +1734,26 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
             ((_a[0], _a[1], _z0), (_b[0], _b[1], _z1), (_b[0], _b[1], _z0)),
             component="atrium_floor")
 
+
+def _build_atrium_walls(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    garage_floor = float(config["lower_ground"])
+    slab = float(config["slab_thickness"])
+    ceiling = float(config["ceiling_height"])
+    master_triangle_elevation = _master_triangle_elevation(config)
+    atrium_floor = float(config["atrium_floor"])
+    atrium_roof_base = float(config["atrium_roof_base"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    wt_glass = float(config.get("wall_thickness_glass", 0.0))
+    atrium_poly = plan.atrium_polygon
+
     # Wing C edge (hex v1→v2) and Wing A edge (hex v0→v5) are open to atrium
     # Wing B edge (hex v3→v4) handled separately: concrete at bedroom level, glass elsewhere
     wing_b_atrium_edge = (plan.hex_vertices[3], plan.hex_vertices[4])
-    open_atrium_edges = [
+    open_atrium_edges = EdgeIndex([
         (plan.hex_vertices[1], plan.hex_vertices[2]),  # Wing C
         (plan.hex_vertices[0], plan.hex_vertices[5]),  # Wing A
         wing_b_atrium_edge,                             # Wing B (added manually below)
-    ]
+    ])
     # Keep a concrete base band on non-wing atrium edges: glass starts at
     # garage floor level so the lower atrium side is polished concrete, not
     # glass, where the wing-adjacent gap was visible.
@@ -1479,7 +1816,22 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         _add_solid_wall_edge(mesh, seg_mat, p0_b, p1_b, z0_seg, z1_seg,
                              seg_wt, atrium_poly, component=comp,
                              cap_top=False, cap_bottom=False)
+
+
+def _build_atrium_roof(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    atrium_roof_base = float(config["atrium_roof_base"])
+    atrium_roof_rise = float(config["atrium_roof_rise"])
     _add_pyramid_roof(mesh, plan.hex_vertices, atrium_roof_base, atrium_roof_rise, "glass", component="atrium_roof")
+
+
+def _build_atrium_corner_fillers(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    lower_ground = float(config["lower_ground"])
+    slab = float(config["slab_thickness"])
+    master_triangle_elevation = _master_triangle_elevation(config)
+    atrium_floor = float(config["atrium_floor"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    wing_floor_elevation = {"C": lower_ground}
+    atrium_poly = plan.atrium_polygon
     _add_hex_corner_fillers(
         mesh,
         plan.hex_vertices,
@@ -1498,8 +1850,16 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
         cap_top=False,
         cap_bottom=False,
     )
-    wing_a_poly = Polygon(plan.wing_polygons["A"])
-    wing_b_poly = Polygon(plan.wing_polygons["B"])
+
+
+def _build_garage_corner_fillers(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    garage_floor = float(config["lower_ground"])
+    slab = float(config["slab_thickness"])
+    atrium_floor = float(config["atrium_floor"])
+    wt_conc = float(config.get("wall_thickness_concrete", 0.0))
+    atrium_poly = plan.atrium_polygon
+    wing_a_poly = plan.polygon("wing_A")
+    wing_b_poly = plan.polygon("wing_B")
     e0 = plan.extension_vertices[0]
     e3 = plan.extension_vertices[3]
     e4 = plan.extension_vertices[4]
@@ -1529,10 +1889,140 @@ def build_model(plan: PlanGeometry, config: Dict[str, float]) -> ModelData:
             cap_bottom=False,
         )
 
+
+def _build_courtyard(mesh: ModelData, plan: PlanGeometry, config: Dict[str, float]) -> None:
+    courtyard_module_name = str(config.get("courtyard_module", "none"))
+    courtyard_module = COURTYARD_MODULES.get(courtyard_module_name)
+    if courtyard_module is None:
+        raise ValueError(f"Unknown courtyard module: {courtyard_module_name}")
     courtyard_module(mesh, plan, config)
 
-    # Side courtyards between wing pairs
-    _add_side_courtyards(mesh, plan, config)
 
-    return mesh
+ComponentBuilder = Callable[[ModelData, PlanGeometry, Dict[str, float]], None]
 
+# Model components in build order.  Each builder only reads the config keys it
+# needs, so stages.IncrementalModelBuilder can rebuild components selectively;
+# the order fixes the triangle order of the merged model.
+MODEL_COMPONENTS: Tuple[Tuple[str, ComponentBuilder], ...] = (
+    ("terrain", _build_terrain),
+    ("motorcourt", _build_motorcourt),
+    ("driveway", _build_driveway),
+    ("driveway_extension", _build_driveway_extension),
+    ("master_triangle", _build_master_triangle),
+    ("garage", _build_garage),
+    ("wing_slabs", _build_wings),
+    ("wing_atrium_walls", _build_wing_atrium_walls),
+    ("atrium_floor", _build_atrium_floor),
+    ("atrium_walls", _build_atrium_walls),
+    ("atrium_roof", _build_atrium_roof),
+    ("atrium_corner_fillers", _build_atrium_corner_fillers),
+    ("garage_corner_fillers", _build_garage_corner_fillers),
+    ("courtyard", _build_courtyard),
+    ("side_courtyards", _add_side_courtyards),
+)
+
+
+# Compact, picklable form of a ModelData: (component, material, vertices, faces)
+# per bucket, in bucket order.
+ModelBuffers = List[Tuple[str, str, np.ndarray, np.ndarray]]
+
+
+def model_buffers(mesh: ModelData) -> ModelBuffers:
+    return [(component, material, bucket.vertices, bucket.faces) for (component, material), bucket in mesh.buckets.items()]
+
+
+def merge_buffers(mesh: ModelData, buffers: ModelBuffers) -> None:
+    """``mesh.merge`` for a ``model_buffers`` result."""
+    for component, material, vertices, faces in buffers:
+        mesh.add_indexed(material, vertices, faces, component=component)
+
+
+def build_component(builder: ComponentBuilder, plan: PlanGeometry, config: Dict[str, float]) -> Tuple[ModelData, float]:
+    """Run one component builder into a fresh ModelData; returns it and the wall time."""
+    t0 = time.perf_counter()
+    part = ModelData()
+    builder(part, plan, config)
+    return part, time.perf_counter() - t0
+
+
+def _component_worker(task: Tuple[ComponentBuilder, PlanGeometry, Dict[str, float]]) -> Tuple[ModelBuffers, float]:
+    builder, plan, config = task
+    part, seconds = build_component(builder, plan, config)
+    return model_buffers(part), seconds
+
+
+class ComponentPool:
+    """Process pool for component builds, owned by whoever opens it.
+
+    The worker processes start on first ``submit`` and are kept between
+    models until ``close`` (or the end of a ``with`` block), so a long-lived
+    owner such as ``IncrementalModelBuilder`` pays the start-up only once.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = int(workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def submit(self, fn, *args):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor.submit(fn, *args)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ComponentPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def model_workers(config: Dict[str, float]) -> int:
+    """``model_workers`` from ``config``, capped at the CPU count (extra processes only add overhead)."""
+    workers = int(config.get("model_workers", 1))
+    if workers < 1:
+        raise ValueError("model_workers must be at least 1")
+    return min(workers, os.cpu_count() or 1)
+
+
+def build_model(
+    plan: PlanGeometry,
+    config: Dict[str, float],
+    workers: int | None = None,
+    timings: Dict[str, float] | None = None,
+    pool: ComponentPool | None = None,
+) -> ModelData:
+    """Build every model component, on ``workers`` processes when > 1.
+
+    ``workers`` defaults to the ``model_workers`` config key (1 = serial).
+    Parallel components come back as ``model_buffers`` and are merged in
+    ``MODEL_COMPONENTS`` order, so the result matches the serial build
+    exactly.  Without a ``pool`` a temporary one is started and shut down
+    for this call.  ``timings``, if given, receives each component's wall
+    time.
+    """
+    courtyard_module_name = str(config.get("courtyard_module", "none"))
+    if courtyard_module_name not in COURTYARD_MODULES:
+        raise ValueError(f"Unknown courtyard module: {courtyard_module_name}")
+    workers = model_workers(config) if workers is None else workers
+    timings = {} if timings is None else timings
+    mesh = ModelData()
+    if workers <= 1:
+        for name, builder in MODEL_COMPONENTS:
+            t0 = time.perf_counter()
+            builder(mesh, plan, config)
+            timings[name] = time.perf_counter() - t0
+        return mesh
+
+    if pool is None:
+        with ComponentPool(workers) as own_pool:
+            return build_model(plan, config, workers, timings, own_pool)
+    config = dict(config)
+    futures = [(name, pool.submit(_component_worker, (builder, plan, config))) for name, builder in MODEL_COMPONENTS]
+    for name, future in futures:
+        buffers, timings[name] = future.result()
+        merge_buffers(mesh, buffers)
+    return mesh
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+import hashlib
 import math
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
-from shapely.geometry import Polygon
+import numpy as np
+import shapely
+from shapely.geometry import Point, Polygon
 
 Point2D = Tuple[float, float]
+Polygon2D = Tuple[Point2D, ...]
 
 WING_EDGE_INDICES: Dict[str, Tuple[int, int]] = {
     "A": (5, 0),  # front-right
@@ -20,21 +26,222 @@ TRIANGLE_EDGE_INDICES: Tuple[Tuple[int, int], ...] = (
     (5, 0),  # rotated 120° to align points between wing axes
 )
 
+# Reference scan used by the "scan" rotation solver (and mirrored by the
+# analytic solver when choosing between the two alignment roots).
+ROTATION_SCAN_STEPS = 7200
+ROTATION_SCAN_HIT = 1e-3
+# The plan is symmetric, so the two alignment roots often tie on the scan grid
+# and only float rounding separates their distances.  Scan distances within
+# this many feet count as equal and the lowest scan sample wins, so the choice
+# does not depend on the last ulp.  All three solvers (scan, analytic, batch)
+# apply the same rule.
+ROTATION_TIE_TOLERANCE = 1e-9
+ROTATION_RESIDUAL_TOLERANCE = 1e-6
+
+# The only config keys build_plan reads; build_plan_cached keys on these.
+PLAN_CONFIG_KEYS: Tuple[str, ...] = (
+    "s",
+    "d",
+    "triangle_clockwise_backoff_deg",
+    "triangle_plan_down_shift_ft",
+    "courtyard_module",
+    "triangle_rotation_solver",
+)
+PLAN_CACHE_SIZE = 64
+
+
+# Named vertex runs stored in PlanGeometry's vertex block, in block order.
+PLAN_OUTLINES: Tuple[str, ...] = (
+    "atrium",
+    "extension",
+    "wing_A",
+    "wing_B",
+    "wing_C",
+    "master_triangle",
+    "atrium_front_edge",
+    "courtyard",
+    "side_courtyard_right",
+    "side_courtyard_left",
+)
+
+
+def _restore_plan(vertices: np.ndarray, spans: Tuple[Tuple[int, int], ...], residual: float) -> "PlanGeometry":
+    plan = object.__new__(PlanGeometry)
+    vertices.flags.writeable = False
+    object.__setattr__(plan, "vertices", vertices)
+    object.__setattr__(plan, "_spans", dict(zip(PLAN_OUTLINES, spans)))
+    object.__setattr__(plan, "triangle_alignment_residual", residual)
+    object.__setattr__(plan, "_cache", {})
+    return plan
+
 
-@dataclass
 class PlanGeometry:
-    hex_vertices: List[Point2D]
-    extension_vertices: List[Point2D]
-    wing_polygons: Dict[str, List[Point2D]]
-    master_triangle: List[Point2D]
-    atrium_front_edge: Tuple[Point2D, Point2D]
-    courtyard_polygon: List[Point2D]
-    side_courtyard_right: List[Point2D] = None  # between Wing A and C
-    side_courtyard_left: List[Point2D] = None   # between Wing B and C
+    """Immutable plan outlines backed by one contiguous ``(K, 2)`` vertex block.
+
+    The list-style attributes (``hex_vertices``, ``wing_polygons``...) return
+    tuples of points.  Shapely polygons, centroids and bounds are built on
+    first use and cached, so a shared (cached) plan must never be mutated.
+    """
+
+    __slots__ = ("vertices", "_spans", "triangle_alignment_residual", "_cache")
+
+    def __init__(
+        self,
+        hex_vertices: Sequence[Point2D],
+        extension_vertices: Sequence[Point2D],
+        wing_polygons: Mapping[str, Sequence[Point2D]],
+        master_triangle: Sequence[Point2D],
+        atrium_front_edge: Tuple[Point2D, Point2D],
+        courtyard_polygon: Sequence[Point2D],
+        side_courtyard_right: Sequence[Point2D] | None = None,  # between Wing A and C
+        side_courtyard_left: Sequence[Point2D] | None = None,  # between Wing B and C
+        # Distance from the Wing C corner to the rotated back edge; > 0 only
+        # when no rotation can align them (see ROTATION_RESIDUAL_TOLERANCE).
+        triangle_alignment_residual: float = 0.0,
+    ) -> None:
+        runs = (
+            hex_vertices,
+            extension_vertices,
+            wing_polygons["A"],
+            wing_polygons["B"],
+            wing_polygons["C"],
+            master_triangle,
+            atrium_front_edge,
+            courtyard_polygon,
+            side_courtyard_right or (),
+            side_courtyard_left or (),
+        )
+        spans = []
+        start = 0
+        for run in runs:
+            spans.append((start, start + len(run)))
+            start += len(run)
+        vertices = np.array([pt for run in runs for pt in run], dtype=np.float64).reshape(-1, 2)
+        vertices.flags.writeable = False
+        object.__setattr__(self, "vertices", vertices)
+        object.__setattr__(self, "_spans", dict(zip(PLAN_OUTLINES, spans)))
+        object.__setattr__(self, "triangle_alignment_residual", float(triangle_alignment_residual))
+        object.__setattr__(self, "_cache", {})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        # The vertex block and spans are all the state; caches are rebuilt lazily.
+        spans = tuple(self._spans[name] for name in PLAN_OUTLINES)
+        return _restore_plan, (self.vertices, spans, self.triangle_alignment_residual)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlanGeometry):
+            return NotImplemented
+        return (
+            self._spans == other._spans
+            and self.triangle_alignment_residual == other.triangle_alignment_residual
+            and np.array_equal(self.vertices, other.vertices)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PlanGeometry(vertices={len(self.vertices)}, residual={self.triangle_alignment_residual:g})"
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the outlines; equal plans share a fingerprint."""
+        cached = self._cache.get("fingerprint")
+        if cached is None:
+            digest = hashlib.blake2b(self.vertices.tobytes(), digest_size=16)
+            digest.update(repr((sorted(self._spans.items()), self.triangle_alignment_residual)).encode())
+            cached = digest.hexdigest()
+            self._cache["fingerprint"] = cached
+        return cached
+
+    def array(self, name: str) -> np.ndarray:
+        """Read-only ``(k, 2)`` view of one outline in the vertex block."""
+        start, stop = self._spans[name]
+        return self.vertices[start:stop]
+
+    def points(self, name: str) -> Polygon2D:
+        key = ("points", name)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = tuple((x, y) for x, y in self.array(name).tolist())
+            self._cache[key] = cached
+        return cached
+
+    @property
+    def hex_vertices(self) -> Polygon2D:
+        return self.points("atrium")
+
+    @property
+    def extension_vertices(self) -> Polygon2D:
+        return self.points("extension")
+
+    @property
+    def wing_polygons(self) -> Mapping[str, Polygon2D]:
+        cached = self._cache.get("wing_polygons")
+        if cached is None:
+            cached = MappingProxyType({wing: self.points(f"wing_{wing}") for wing in WING_EDGE_INDICES})
+            self._cache["wing_polygons"] = cached
+        return cached
+
+    @property
+    def master_triangle(self) -> Polygon2D:
+        return self.points("master_triangle")
+
+    @property
+    def atrium_front_edge(self) -> Tuple[Point2D, Point2D]:
+        return self.points("atrium_front_edge")
+
+    @property
+    def courtyard_polygon(self) -> Polygon2D:
+        return self.points("courtyard")
+
+    @property
+    def side_courtyard_right(self) -> Polygon2D:
+        return self.points("side_courtyard_right")
+
+    @property
+    def side_courtyard_left(self) -> Polygon2D:
+        return self.points("side_courtyard_left")
+
+    def polygon(self, name: str) -> Polygon:
+        """Cached, prepared Shapely polygon for one of PLAN_OUTLINES."""
+        key = ("polygon", name)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = Polygon(self.array(name)) if len(self.array(name)) else Polygon()
+            if not cached.is_empty:
+                shapely.prepare(cached)
+            self._cache[key] = cached
+        return cached
+
+    def centroid(self, name: str) -> Point:
+        key = ("centroid", name)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self.polygon(name).centroid
+            self._cache[key] = cached
+        return cached
+
+    def bounds(self, name: str) -> Tuple[float, float, float, float]:
+        """``(min_x, min_y, max_x, max_y)`` of one outline."""
+        key = ("bounds", name)
+        cached = self._cache.get(key)
+        if cached is None:
+            pts = self.array(name)
+            lo = pts.min(axis=0)
+            hi = pts.max(axis=0)
+            cached = (float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1]))
+            self._cache[key] = cached
+        return cached
 
     @property
     def atrium_polygon(self) -> Polygon:
-        return Polygon(self.hex_vertices)
+        return self.polygon("atrium")
 
 
 def _polygon_area(points: List[Point2D]) -> float:
@@ -107,6 +314,128 @@ def _distance_point_to_line(point: Point2D, line_a: Point2D, line_b: Point2D) ->
     return abs((ux * vy - uy * vx) / den)
 
 
+def _scan_triangle_rotation(
+    back_a: Point2D,
+    back_b: Point2D,
+    tri_center: Point2D,
+    target: Point2D,
+) -> Tuple[float, float]:
+    """Reference solver: coarse 7200-step scan refined by ternary search.
+
+    The first sample within ``ROTATION_SCAN_HIT`` wins; without one, ties on
+    the minimum are broken as in ``ROTATION_TIE_TOLERANCE``.
+    """
+    step = (2.0 * math.pi) / ROTATION_SCAN_STEPS
+    distances: List[float] = []
+    for k in range(1, ROTATION_SCAN_STEPS + 1):
+        angle = k * step
+        ra = _rotate_point(back_a, tri_center, angle)
+        rb = _rotate_point(back_b, tri_center, angle)
+        dist = _distance_point_to_line(target, ra, rb)
+        distances.append(dist)
+        if dist <= ROTATION_SCAN_HIT + ROTATION_TIE_TOLERANCE:
+            break
+    else:
+        # No hit: the lowest sample within ROTATION_TIE_TOLERANCE of the minimum.
+        best = min(distances)
+        k = 1 + next(i for i, dist in enumerate(distances) if dist <= best + ROTATION_TIE_TOLERANCE)
+    best_angle = k * step
+    lo = max(0.0, best_angle - step)
+    hi = best_angle + step
+    for _ in range(40):
+        m1 = lo + (hi - lo) / 3.0
+        m2 = hi - (hi - lo) / 3.0
+        d1 = _distance_point_to_line(
+            target,
+            _rotate_point(back_a, tri_center, m1),
+            _rotate_point(back_b, tri_center, m1),
+        )
+        d2 = _distance_point_to_line(
+            target,
+            _rotate_point(back_a, tri_center, m2),
+            _rotate_point(back_b, tri_center, m2),
+        )
+        if d1 <= d2:
+            hi = m2
+        else:
+            lo = m1
+    best_angle = (lo + hi) * 0.5
+    residual = _distance_point_to_line(
+        target,
+        _rotate_point(back_a, tri_center, best_angle),
+        _rotate_point(back_b, tri_center, best_angle),
+    )
+    return best_angle, residual
+
+
+def _solve_triangle_rotation(
+    back_a: Point2D,
+    back_b: Point2D,
+    tri_center: Point2D,
+    target: Point2D,
+) -> Tuple[float, float]:
+    """Closed-form rotation about ``tri_center`` that puts ``target`` on line a-b.
+
+    Rotating the line by theta keeps its distance ``c0`` to the center, so the
+    signed distance of ``target`` is ``|q| cos(theta + alpha - beta) - c0`` and
+    the roots are ``beta - alpha +/- acos(c0 / |q|)``.  Of the two roots, the
+    one the reference scan would land on is picked by evaluating only the scan
+    samples that bracket each root; distances within ``ROTATION_TIE_TOLERANCE``
+    are ties, won by the lowest sample.  When no rotation reaches ``target`` the
+    closest-approach angle is returned together with a positive residual.
+    """
+    ex, ey = back_b[0] - back_a[0], back_b[1] - back_a[1]
+    edge_len = math.hypot(ex, ey)
+    if edge_len < 1e-12:
+        raise ValueError("Degenerate master triangle back edge.")
+    nx, ny = -ey / edge_len, ex / edge_len
+    c0 = nx * (back_a[0] - tri_center[0]) + ny * (back_a[1] - tri_center[1])
+    qx, qy = target[0] - tri_center[0], target[1] - tri_center[1]
+    q_len = math.hypot(qx, qy)
+    phase = math.atan2(qy, qx) - math.atan2(ny, nx)
+    twopi = 2.0 * math.pi
+
+    if q_len < 1e-12 or abs(c0) >= q_len:
+        # No crossing: the scan's ternary search settles on the extremum of
+        # cos() nearest to c0.
+        angle = (phase if c0 >= 0.0 else phase + math.pi) % twopi
+        if angle == 0.0:
+            angle = twopi
+        return angle, abs(q_len - abs(c0))
+
+    spread = math.acos(c0 / q_len)
+    step = twopi / ROTATION_SCAN_STEPS
+
+    def scan_dist(k: int) -> float:
+        # Same float operations as the scan so ties resolve identically.
+        angle = k * step
+        return _distance_point_to_line(
+            target,
+            _rotate_point(back_a, tri_center, angle),
+            _rotate_point(back_b, tri_center, angle),
+        )
+
+    roots = [(phase + spread) % twopi, (phase - spread) % twopi]
+    candidates: Dict[int, float] = {}
+    for root in roots:
+        for base in (root, root + twopi):
+            k_lo = int(math.floor(base / step))
+            for k in (k_lo, k_lo + 1):
+                if 1 <= k <= ROTATION_SCAN_STEPS:
+                    candidates[k] = base
+    if not candidates:
+        return roots[0], 0.0
+
+    distances = {k: scan_dist(k) for k in sorted(candidates)}
+    hits = [k for k, dist in distances.items() if dist <= ROTATION_SCAN_HIT + ROTATION_TIE_TOLERANCE]
+    if hits:
+        chosen = hits[0]
+    else:
+        best = min(distances.values())
+        chosen = next(k for k, dist in distances.items() if dist <= best + ROTATION_TIE_TOLERANCE)
+    return candidates[chosen], 0.0
+
+
 def make_shared_front_edge_courtyard(
     atrium_front_edge: Tuple[Point2D, Point2D],
     master_triangle: List[Point2D],
@@ -191,40 +520,13 @@ def build_plan(config: Dict[str, float]) -> PlanGeometry:
     back_a = master_triangle[back_edge_idx]
     back_b = master_triangle[(back_edge_idx + 1) % 3]
     wing_c_top_right = extension_vertices[1]
-    step = (2.0 * math.pi) / 7200.0
-    best_angle = 0.0
-    best_dist = float("inf")
-    for k in range(1, 7201):
-        angle = k * step
-        ra = _rotate_point(back_a, tri_center, angle)
-        rb = _rotate_point(back_b, tri_center, angle)
-        dist = _distance_point_to_line(wing_c_top_right, ra, rb)
-        if dist < best_dist:
-            best_dist = dist
-            best_angle = angle
-        if dist <= 1e-3:
-            best_angle = angle
-            break
-    lo = max(0.0, best_angle - step)
-    hi = best_angle + step
-    for _ in range(40):
-        m1 = lo + (hi - lo) / 3.0
-        m2 = hi - (hi - lo) / 3.0
-        d1 = _distance_point_to_line(
-            wing_c_top_right,
-            _rotate_point(back_a, tri_center, m1),
-            _rotate_point(back_b, tri_center, m1),
-        )
-        d2 = _distance_point_to_line(
-            wing_c_top_right,
-            _rotate_point(back_a, tri_center, m2),
-            _rotate_point(back_b, tri_center, m2),
-        )
-        if d1 <= d2:
-            hi = m2
-        else:
-            lo = m1
-    best_angle = (lo + hi) * 0.5
+    solver = str(config.get("triangle_rotation_solver", "analytic"))
+    if solver == "analytic":
+        best_angle, alignment_residual = _solve_triangle_rotation(back_a, back_b, tri_center, wing_c_top_right)
+    elif solver == "scan":
+        best_angle, alignment_residual = _scan_triangle_rotation(back_a, back_b, tri_center, wing_c_top_right)
+    else:
+        raise ValueError(f"Unknown triangle rotation solver: {solver}")
     clockwise_backoff_deg = float(config.get("triangle_clockwise_backoff_deg", 0.0))
     best_angle -= math.radians(clockwise_backoff_deg)
     master_triangle = _ensure_ccw([_rotate_point(p, tri_center, best_angle) for p in master_triangle])
@@ -257,5 +559,40 @@ def build_plan(config: Dict[str, float]) -> PlanGeometry:
         courtyard_polygon=courtyard_polygon,
         side_courtyard_right=side_courtyard_right,
         side_courtyard_left=side_courtyard_left,
+        triangle_alignment_residual=alignment_residual,
+    )
+
+
+def plan_cache_key(config: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Normalized values of PLAN_CONFIG_KEYS, as build_plan would read them."""
+    return (
+        float(config["s"]),
+        float(config["d"]),
+        float(config.get("triangle_clockwise_backoff_deg", 0.0)),
+        float(config.get("triangle_plan_down_shift_ft", 0.0)),
+        str(config.get("courtyard_module", "none")),
+        str(config.get("triangle_rotation_solver", "analytic")),
     )
 
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _build_plan_for_key(key: Tuple[Any, ...]) -> PlanGeometry:
+    return build_plan(dict(zip(PLAN_CONFIG_KEYS, key)))
+
+
+def build_plan_cached(config: Mapping[str, Any]) -> PlanGeometry:
+    """Memoized build_plan; only PLAN_CONFIG_KEYS take part in the lookup.
+
+    The returned plan is shared between callers and must not be modified.
+    """
+    return _build_plan_for_key(plan_cache_key(config))
+
+
+def plan_cache_info():
+    """``functools`` cache statistics (hits, misses, maxsize, currsize)."""
+    return _build_plan_for_key.cache_info()
+
+
+def clear_plan_cache() -> None:
+    _build_plan_for_key.cache_clear()
+
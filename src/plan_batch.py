@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .plan import (
+    ROTATION_SCAN_HIT,
+    ROTATION_SCAN_STEPS,
+    ROTATION_TIE_TOLERANCE,
+    TRIANGLE_EDGE_INDICES,
+    WING_EDGE_INDICES,
+    PlanGeometry,
+    make_exterior_hex_courtyard,
+    make_shared_front_edge_courtyard,
+)
+
+_HEX_ANGLES = np.radians(np.arange(6) * 60.0)
+_HEX_UNIT = np.stack([np.cos(_HEX_ANGLES), np.sin(_HEX_ANGLES)], axis=-1)
+
+
+@dataclass
+class PlanBatch:
+    """Structure-of-arrays plan geometry; row ``i`` matches ``build_plan``.
+
+    Vertex arrays are shaped ``(N, k, 2)`` in the same vertex order as the
+    corresponding ``PlanGeometry`` lists.
+    """
+
+    s: np.ndarray
+    d: np.ndarray
+    triangle_clockwise_backoff_deg: np.ndarray
+    triangle_plan_down_shift_ft: np.ndarray
+    hex_vertices: np.ndarray
+    extension_vertices: np.ndarray
+    wing_polygons: Dict[str, np.ndarray]
+    offset_lines: np.ndarray  # (N, 3, 2, 2) in TRIANGLE_EDGE_INDICES order
+    master_triangle: np.ndarray
+    triangle_rotation: np.ndarray  # radians, backoff applied
+    triangle_alignment_residual: np.ndarray
+    side_courtyard_right: np.ndarray
+    side_courtyard_left: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.s.shape[0])
+
+    def areas(self) -> Dict[str, np.ndarray]:
+        """Per-row areas using the key names of ``validate_geometry``'s ``areas``."""
+        wing_areas = {name: polygon_areas(poly) for name, poly in self.wing_polygons.items()}
+        return {
+            "atrium": polygon_areas(self.hex_vertices),
+            "wing_A": wing_areas["A"],
+            "wing_B": wing_areas["B"],
+            "wing_C": wing_areas["C"],
+            "wings_total": wing_areas["A"] + wing_areas["B"] + wing_areas["C"],
+            "master_triangle": polygon_areas(self.master_triangle),
+        }
+
+    def plan(self, index: int, courtyard_module: str = "none") -> PlanGeometry:
+        """Materialize one row as a ``PlanGeometry``."""
+
+        def pts(arr: np.ndarray):
+            return tuple((float(x), float(y)) for x, y in arr)
+
+        hex_vertices = pts(self.hex_vertices[index])
+        master_triangle = pts(self.master_triangle[index])
+        atrium_front_edge = (hex_vertices[4], hex_vertices[5])
+        if courtyard_module == "none":
+            courtyard_polygon = ()
+        elif courtyard_module == "shared_front_edge":
+            courtyard_polygon = make_shared_front_edge_courtyard(atrium_front_edge, master_triangle)
+        elif courtyard_module == "exterior_hex":
+            courtyard_polygon = make_exterior_hex_courtyard(float(self.s[index]))
+        else:
+            raise ValueError(f"Unknown courtyard module: {courtyard_module}")
+        return PlanGeometry(
+            hex_vertices=hex_vertices,
+            extension_vertices=pts(self.extension_vertices[index]),
+            wing_polygons={name: pts(poly[index]) for name, poly in self.wing_polygons.items()},
+            master_triangle=master_triangle,
+            atrium_front_edge=atrium_front_edge,
+            courtyard_polygon=courtyard_polygon,
+            side_courtyard_right=pts(self.side_courtyard_right[index]),
+            side_courtyard_left=pts(self.side_courtyard_left[index]),
+            triangle_alignment_residual=float(self.triangle_alignment_residual[index]),
+        )
+
+
+def polygon_areas(points: np.ndarray) -> np.ndarray:
+    """Signed shoelace area of each ``(k, 2)`` polygon in an ``(N, k, 2)`` array."""
+    x = points[..., 0]
+    y = points[..., 1]
+    return 0.5 * np.sum(x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y, axis=-1)
+
+
+def _ensure_ccw(points: np.ndarray) -> np.ndarray:
+    flip = polygon_areas(points) < 0
+    if not flip.any():
+        return points
+    return np.where(flip[:, None, None], points[:, ::-1, :], points)
+
+
+def _offset_edge_lines(p0: np.ndarray, p1: np.ndarray, offset: np.ndarray) -> np.ndarray:
+    """Vectorized ``plan._offset_edge_line`` about the origin."""
+    ex = p1[:, 0] - p0[:, 0]
+    ey = p1[:, 1] - p0[:, 1]
+    mid_x = (p0[:, 0] + p1[:, 0]) * 0.5
+    mid_y = (p0[:, 1] + p1[:, 1]) * 0.5
+    mag = np.hypot(ex, ey)
+    n1x, n1y = ey / mag, -ex / mag
+    n2x, n2y = -ey / mag, ex / mag
+    use_n1 = (n1x * mid_x + n1y * mid_y) > (n2x * mid_x + n2y * mid_y)
+    ux = np.where(use_n1, n1x, n2x) * offset
+    uy = np.where(use_n1, n1y, n2y) * offset
+    shift = np.stack([ux, uy], axis=-1)
+    return np.stack([p0 + shift, p1 + shift], axis=1)
+
+
+def _line_intersections(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Vectorized ``plan._line_intersection`` for lines shaped ``(N, 2, 2)``."""
+    x1, y1 = a[:, 0, 0], a[:, 0, 1]
+    x2, y2 = a[:, 1, 0], a[:, 1, 1]
+    x3, y3 = b[:, 0, 0], b[:, 0, 1]
+    x4, y4 = b[:, 1, 0], b[:, 1, 1]
+    den = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+    if np.any(np.abs(den) < 1e-12):
+        raise ValueError("Parallel lines encountered while building master triangle.")
+    det_a = x1 * y2 - y1 * x2
+    det_b = x3 * y4 - y3 * x4
+    px = (det_a * (x3 - x4) - (x1 - x2) * det_b) / den
+    py = (det_a * (y3 - y4) - (y1 - y2) * det_b) / den
+    return np.stack([px, py], axis=-1)
+
+
+def _rotate_points(points: np.ndarray, center: np.ndarray, angle: np.ndarray) -> np.ndarray:
+    """Rotate ``(N, ..., 2)`` points about per-row centers by per-row angles."""
+    shape = (-1,) + (1,) * (points.ndim - 2)
+    c = np.cos(angle).reshape(shape)
+    s = np.sin(angle).reshape(shape)
+    cx = center[:, 0].reshape(shape)
+    cy = center[:, 1].reshape(shape)
+    px = points[..., 0] - cx
+    py = points[..., 1] - cy
+    return np.stack([cx + c * px - s * py, cy + s * px + c * py], axis=-1)
+
+
+def _scan_distances(
+    back_a: np.ndarray,
+    back_b: np.ndarray,
+    center: np.ndarray,
+    target: np.ndarray,
+    k: np.ndarray,
+) -> np.ndarray:
+    """Point-to-line distance at scan sample ``k`` (``(N, m)``), as in the scalar scan."""
+    step = (2.0 * math.pi) / ROTATION_SCAN_STEPS
+    angle = k * step
+    c = np.cos(angle)
+    s = np.sin(angle)
+    ax, ay = back_a[:, 0:1] - center[:, 0:1], back_a[:, 1:2] - center[:, 1:2]
+    bx, by = back_b[:, 0:1] - center[:, 0:1], back_b[:, 1:2] - center[:, 1:2]
+    rax, ray = center[:, 0:1] + c * ax - s * ay, center[:, 1:2] + s * ax + c * ay
+    rbx, rby = center[:, 0:1] + c * bx - s * by, center[:, 1:2] + s * bx + c * by
+    ux, uy = rbx - rax, rby - ray
+    vx, vy = target[:, 0:1] - rax, target[:, 1:2] - ray
+    den = np.maximum(np.hypot(ux, uy), 1e-12)
+    return np.abs((ux * vy - uy * vx) / den)
+
+
+def _solve_triangle_rotations(
+    back_a: np.ndarray,
+    back_b: np.ndarray,
+    center: np.ndarray,
+    target: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``plan._solve_triangle_rotation``; returns (angle, residual)."""
+    twopi = 2.0 * math.pi
+    step = twopi / ROTATION_SCAN_STEPS
+    ex = back_b[:, 0] - back_a[:, 0]
+    ey = back_b[:, 1] - back_a[:, 1]
+    edge_len = np.hypot(ex, ey)
+    if np.any(edge_len < 1e-12):
+        raise ValueError("Degenerate master triangle back edge.")
+    nx, ny = -ey / edge_len, ex / edge_len
+    c0 = nx * (back_a[:, 0] - center[:, 0]) + ny * (back_a[:, 1] - center[:, 1])
+    qx = target[:, 0] - center[:, 0]
+    qy = target[:, 1] - center[:, 1]
+    q_len = np.hypot(qx, qy)
+    phase = np.arctan2(qy, qx) - np.arctan2(ny, nx)
+
+    degenerate = (q_len < 1e-12) | (np.abs(c0) >= q_len)
+    closest = np.mod(np.where(c0 >= 0.0, phase, phase + math.pi), twopi)
+    closest = np.where(closest == 0.0, twopi, closest)
+    residual = np.where(degenerate, np.abs(q_len - np.abs(c0)), 0.0)
+
+    ratio = np.clip(c0 / np.where(q_len < 1e-12, 1.0, q_len), -1.0, 1.0)
+    spread = np.arccos(ratio)
+    roots = np.stack([np.mod(phase + spread, twopi), np.mod(phase - spread, twopi)], axis=1)
+    # Candidate scan samples bracketing each root (and its +2pi alias),
+    # ordered root-major so root_of[j] recovers which angle a sample brackets.
+    bases = np.concatenate([roots, roots + twopi], axis=1)  # (N, 4)
+    k_lo = np.floor(bases / step)
+    ks = np.concatenate([k_lo, k_lo + 1.0], axis=1)  # (N, 8)
+    cand_angle = np.concatenate([bases, bases], axis=1)
+    valid = (ks >= 1) & (ks <= ROTATION_SCAN_STEPS)
+    dist = _scan_distances(back_a, back_b, center, target, np.where(valid, ks, 1.0))
+    dist = np.where(valid, dist, np.inf)
+
+    hit = valid & (dist <= ROTATION_SCAN_HIT + ROTATION_TIE_TOLERANCE)
+    # Lowest-k hit wins; otherwise lowest-k among the (tied) minimal distances.
+    hit_key = np.where(hit, ks, np.inf)
+    first_hit = np.argmin(hit_key, axis=1)
+    any_hit = hit.any(axis=1)
+    min_dist = dist.min(axis=1, keepdims=True)
+    min_key = np.where(dist <= min_dist + ROTATION_TIE_TOLERANCE, ks, np.inf)
+    first_min = np.argmin(min_key, axis=1)
+    chosen = np.where(any_hit, first_hit, first_min)
+    rows = np.arange(back_a.shape[0])
+    angle = cand_angle[rows, chosen]
+
+    angle = np.where(degenerate, closest, angle)
+    return angle, residual
+
+
+def _hexes_about(center_x: np.ndarray, center_y: np.ndarray, s: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [
+            center_x[:, None] + s[:, None] * _HEX_UNIT[None, :, 0],
+            center_y[:, None] + s[:, None] * _HEX_UNIT[None, :, 1],
+        ],
+        axis=-1,
+    )
+
+
+def build_plans_batch(
+    s,
+    d,
+    triangle_clockwise_backoff_deg=0.0,
+    triangle_plan_down_shift_ft=0.0,
+) -> PlanBatch:
+    """Evaluate ``build_plan`` for every row of the broadcast input arrays.
+
+    Inputs are broadcast together and flattened, so scalars mix freely with
+    arrays (e.g. a grid of ``s`` and ``d`` with a fixed backoff).  Rotation
+    uses the analytic solver; courtyard modules are applied per row by
+    ``PlanBatch.plan``.
+    """
+    s_arr, d_arr, backoff, down_shift = (
+        np.ravel(a).astype(np.float64)
+        for a in np.broadcast_arrays(s, d, triangle_clockwise_backoff_deg, triangle_plan_down_shift_ft)
+    )
+    if np.any(s_arr <= 0.0):
+        raise ValueError("Atrium side s must be positive.")
+    n = s_arr.shape[0]
+    zeros = np.zeros(n)
+
+    hex_vertices = _ensure_ccw(_hexes_about(zeros, zeros, s_arr))
+    radial = np.hypot(hex_vertices[..., 0], hex_vertices[..., 1])
+    extension_vertices = hex_vertices + hex_vertices / radial[..., None] * s_arr[:, None, None]
+
+    wing_polygons: Dict[str, np.ndarray] = {}
+    for wing_name, (i0, i1) in WING_EDGE_INDICES.items():
+        quad = np.stack(
+            [hex_vertices[:, i0], hex_vertices[:, i1], extension_vertices[:, i1], extension_vertices[:, i0]],
+            axis=1,
+        )
+        wing_polygons[wing_name] = _ensure_ccw(quad)
+
+    offset_lines = np.stack(
+        [_offset_edge_lines(hex_vertices[:, i0], hex_vertices[:, i1], d_arr) for i0, i1 in TRIANGLE_EDGE_INDICES],
+        axis=1,
+    )
+    top = _line_intersections(offset_lines[:, 0], offset_lines[:, 1])
+    left = _line_intersections(offset_lines[:, 1], offset_lines[:, 2])
+    right = _line_intersections(offset_lines[:, 2], offset_lines[:, 0])
+    master_triangle = _ensure_ccw(np.stack([right, top, left], axis=1))
+    tri_center = (master_triangle[:, 0] + master_triangle[:, 1] + master_triangle[:, 2]) / 3.0
+
+    edge_mid_y = (master_triangle[:, :, 1] + np.roll(master_triangle[:, :, 1], -1, axis=1)) * 0.5
+    back_edge_idx = np.argmax(edge_mid_y, axis=1)
+    rows = np.arange(n)
+    back_a = master_triangle[rows, back_edge_idx]
+    back_b = master_triangle[rows, (back_edge_idx + 1) % 3]
+
+    angle, residual = _solve_triangle_rotations(back_a, back_b, tri_center, extension_vertices[:, 1])
+    angle = angle - np.radians(backoff)
+    master_triangle = _ensure_ccw(_rotate_points(master_triangle, tri_center, angle))
+    shift = np.where(np.abs(down_shift) > 1e-9, down_shift, 0.0)
+    master_triangle = master_triangle.copy()
+    master_triangle[..., 1] -= shift[:, None]
+
+    sqrt3 = math.sqrt(3.0)
+    side_y = sqrt3 * s_arr * 0.5
+    side_courtyard_right = _ensure_ccw(_hexes_about(1.5 * s_arr, side_y, s_arr))
+    side_courtyard_left = _ensure_ccw(_hexes_about(-1.5 * s_arr, side_y, s_arr))
+
+    return PlanBatch(
+        s=s_arr,
+        d=d_arr,
+        triangle_clockwise_backoff_deg=backoff,
+        triangle_plan_down_shift_ft=down_shift,
+        hex_vertices=hex_vertices,
+        extension_vertices=extension_vertices,
+        wing_polygons=wing_polygons,
+        offset_lines=offset_lines,
+        master_triangle=master_triangle,
+        triangle_rotation=angle,
+        triangle_alignment_residual=residual,
+        side_courtyard_right=side_courtyard_right,
+        side_courtyard_left=side_courtyard_left,
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+import shapely
+
+
+def as_points(points) -> np.ndarray:
+    """Shapely points for an ``(n, 2)`` (or ``(n, 3)``, z ignored) array of coordinates."""
+    coords = np.atleast_2d(np.asarray(points, dtype=np.float64))
+    return shapely.points(coords[:, :2])
+
+
+class PointPredicates:
+    """Point-array queries against one geometry, prepared once.
+
+    Each method takes an ``(n, 2)`` coordinate array and answers for every
+    point in a single vectorized Shapely call, instead of one Python -> GEOS
+    round trip per ``Point``.  ``shapely.prepare`` is applied to the geometry
+    in place, so later scalar queries on it are faster too.
+    """
+
+    __slots__ = ("geometry",)
+
+    def __init__(self, geometry) -> None:
+        self.geometry = geometry
+        shapely.prepare(geometry)
+
+    def covers(self, points) -> np.ndarray:
+        return shapely.covers(self.geometry, as_points(points))
+
+    def contains(self, points) -> np.ndarray:
+        return shapely.contains(self.geometry, as_points(points))
+
+    def distance(self, points) -> np.ndarray:
+        return shapely.distance(self.geometry, as_points(points))
+
+    def near(self, points, tolerance: float) -> np.ndarray:
+        """True where a point is strictly closer than ``tolerance``."""
+        return self.distance(points) < tolerance
+
+
+def outward_normals(start, end, interior: PointPredicates, probe: float = 0.05) -> np.ndarray:
+    """Unit normals of the edges ``start[i] -> end[i]`` pointing away from ``interior``.
+
+    The left normal is kept unless a probe ``probe`` ft along it from the edge
+    midpoint is covered by the interior, in which case it is flipped.
+    Zero-length edges get a zero normal.
+    """
+    start = np.asarray(start, dtype=np.float64).reshape(-1, 2)
+    end = np.asarray(end, dtype=np.float64).reshape(-1, 2)
+    delta = end - start
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    safe = np.where(length < 1e-9, np.inf, length)
+    normal = np.column_stack([-delta[:, 1] / safe, delta[:, 0] / safe])
+    inside = interior.covers((start + end) * 0.5 + normal * probe)
+    return np.where(inside[:, None], -normal, normal)
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import shutil
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+from .component_cache import ComponentCache
+from .export import write_glb, write_svg
+from .model import (
+    MODEL_COMPONENTS,
+    ComponentBuilder,
+    ComponentPool,
+    ModelBuffers,
+    ModelData,
+    build_component,
+    merge_buffers,
+    model_buffers,
+    model_workers,
+)
+from .plan import PlanGeometry, build_plan_cached
+from .render_blender import render_if_available
+from .validate import validate_geometry
+
+# Stands in for "key not present" in recorded reads.
+_MISSING = object()
+
+
+class TrackedConfig(dict):
+    """Config dict that records every key read through ``[]``, ``get`` and ``in``.
+
+    ``reads`` maps each key to the value seen (or ``_MISSING``), which is
+    exactly what a cached result depends on.
+    """
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        super().__init__(config)
+        self.reads: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.get(self, key, _MISSING)
+        self.reads[key] = value
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = dict.get(self, key, _MISSING)
+        self.reads[key] = value
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        value = dict.get(self, key, _MISSING)
+        self.reads[key] = value
+        return value is not _MISSING
+
+
+def reads_match(reads: Mapping[str, Any], config: Mapping[str, Any]) -> bool:
+    """True when ``config`` still holds the recorded values.
+
+    Every key is looked up even after a mismatch so an enclosing
+    ``TrackedConfig`` records the full dependency set.
+    """
+    matched = True
+    for key, value in reads.items():
+        if config.get(key, _MISSING) != value:
+            matched = False
+    return matched
+
+
+@dataclass
+class _Fragment:
+    plan_fingerprint: str
+    reads: Dict[str, Any]
+    buffers: ModelBuffers
+
+
+def _split_reads(reads: Mapping[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """``reads`` without ``_MISSING`` values, plus the keys that were missing (picklable/JSON form)."""
+    present = {key: value for key, value in reads.items() if value is not _MISSING}
+    return present, [key for key, value in reads.items() if value is _MISSING]
+
+
+def _join_reads(reads: Mapping[str, Any], missing: Sequence[str]) -> Dict[str, Any]:
+    joined = dict(reads)
+    joined.update((key, _MISSING) for key in missing)
+    return joined
+
+
+def _fragment_worker(
+    task: Tuple[ComponentBuilder, PlanGeometry, Dict[str, Any]],
+) -> Tuple[Dict[str, Any], List[str], ModelBuffers, float]:
+    """Build one component in a pool worker; ``_MISSING`` reads come back as a key list."""
+    builder, plan, config = task
+    tracked = TrackedConfig(config)
+    part, seconds = build_component(builder, plan, tracked)
+    reads, missing = _split_reads(tracked.reads)
+    return reads, missing, model_buffers(part), seconds
+
+
+class IncrementalModelBuilder:
+    """``build_model`` that keeps each component's triangles between calls.
+
+    A component is rebuilt only when the plan changed or one of the config
+    keys it read last time has a different value; the merged result has the
+    same triangle order as ``build_model``.  Stale components are looked up
+    in the on-disk ``ComponentCache`` first (``component_cache_dir``), and
+    with ``model_workers`` > 1 the rest are rebuilt on a process pool that
+    the builder owns until ``close``.
+    """
+
+    def __init__(self, components: Sequence[Tuple[str, ComponentBuilder]] = MODEL_COMPONENTS) -> None:
+        self.components = tuple(components)
+        self._fragments: Dict[str, _Fragment] = {}
+        self._pool: ComponentPool | None = None
+        self.last_rebuilt: List[str] = []
+        self.last_loaded: List[str] = []
+        self.last_timings: Dict[str, float] = {}
+
+    def build(self, plan: PlanGeometry, config: Mapping[str, Any]) -> ModelData:
+        stale: List[Tuple[str, ComponentBuilder]] = []
+        for name, builder in self.components:
+            fragment = self._fragments.get(name)
+            if (
+                fragment is None
+                or fragment.plan_fingerprint != plan.fingerprint
+                or not reads_match(fragment.reads, config)
+            ):
+                stale.append((name, builder))
+
+        cache = ComponentCache.from_config(config)
+        loaded: List[str] = []
+        if cache is not None:
+            for name, builder in stale:
+                hit = cache.load(
+                    name,
+                    builder,
+                    plan.fingerprint,
+                    lambda reads, missing: reads_match(_join_reads(reads, missing), config),
+                )
+                if hit is not None:
+                    reads, missing, buffers = hit
+                    self._fragments[name] = _Fragment(plan.fingerprint, _join_reads(reads, missing), buffers)
+                    loaded.append(name)
+        missed = [(name, builder) for name, builder in stale if name not in loaded]
+
+        timings: Dict[str, float] = {}
+        workers = model_workers(config)
+        if workers > 1 and len(missed) > 1:
+            if self._pool is not None and self._pool.workers != workers:
+                self._pool.close()
+                self._pool = None
+            if self._pool is None:
+                self._pool = ComponentPool(workers)
+            pool = self._pool
+            plain = dict(config)
+            futures = [(name, pool.submit(_fragment_worker, (builder, plan, plain))) for name, builder in missed]
+            for name, future in futures:
+                reads, missing, buffers, timings[name] = future.result()
+                self._fragments[name] = _Fragment(plan.fingerprint, _join_reads(reads, missing), buffers)
+        else:
+            for name, builder in missed:
+                tracked = TrackedConfig(config)
+                part, timings[name] = build_component(builder, plan, tracked)
+                self._fragments[name] = _Fragment(plan.fingerprint, tracked.reads, model_buffers(part))
+        if cache is not None and missed:
+            for name, builder in missed:
+                fragment = self._fragments[name]
+                cache.store(name, builder, plan.fingerprint, *_split_reads(fragment.reads), fragment.buffers)
+            cache.evict()
+
+        mesh = ModelData()
+        for name, _builder in self.components:
+            fragment = self._fragments[name]
+            if name in timings or name in loaded:
+                reads_match(fragment.reads, config)  # report reads to an outer tracker
+            merge_buffers(mesh, fragment.buffers)
+        self.last_rebuilt = [name for name, _builder in missed]
+        self.last_loaded = loaded
+        self.last_timings = timings
+        return mesh
+
+    def clear(self) -> None:
+        self._fragments.clear()
+
+    def close(self) -> None:
+        """Shut down the component pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+@dataclass
+class Stage:
+    """One node of a StageGraph.
+
+    ``run(config, context, *inputs)`` receives a TrackedConfig, the untracked
+    per-call ``context`` and the values of the ``inputs`` stages.  A cached
+    value is reused while its inputs are unchanged, its recorded config reads
+    still match and ``is_valid(value)`` (if given) holds.
+    """
+
+    name: str
+    run: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    is_valid: Callable[[Any], bool] | None = None
+
+
+@dataclass
+class _StageEntry:
+    value: Any
+    version: int
+    input_versions: Tuple[int, ...]
+    reads: Dict[str, Any] = field(default_factory=dict)
+
+
+class StageGraph:
+    """Memoized pipeline of stages listed in dependency order."""
+
+    def __init__(self, stages: Sequence[Stage]) -> None:
+        seen: set = set()
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in seen]
+            if missing:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown or later stages: {missing}")
+            seen.add(stage.name)
+        self.stages = tuple(stages)
+        self._entries: Dict[str, _StageEntry] = {}
+        self._counter = 0
+        self.last_ran: List[str] = []
+        self.last_reused: List[str] = []
+
+    def evaluate(self, config: Mapping[str, Any], context: Mapping[str, Any] | None = None) -> Dict[str, Any]:
+        context = context or {}
+        values: Dict[str, Any] = {}
+        self.last_ran, self.last_reused = [], []
+        for stage in self.stages:
+            input_versions = tuple(self._entries[name].version for name in stage.inputs)
+            entry = self._entries.get(stage.name)
+            if (
+                entry is not None
+                and entry.input_versions == input_versions
+                and reads_match(entry.reads, config)
+                and (stage.is_valid is None or stage.is_valid(entry.value))
+            ):
+                self.last_reused.append(stage.name)
+            else:
+                tracked = TrackedConfig(config)
+                value = stage.run(tracked, context, *(values[name] for name in stage.inputs))
+                self._counter += 1
+                entry = _StageEntry(value, self._counter, input_versions, tracked.reads)
+                self._entries[stage.name] = entry
+                self.last_ran.append(stage.name)
+            values[stage.name] = entry.value
+        return values
+
+    def invalidate(self, name: str | None = None) -> None:
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+
+def _files_exist(value: Any) -> bool:
+    return Path(value).exists()
+
+
+def _renders_exist(value: Tuple[bool, List[Path], str | None]) -> bool:
+    _available, render_paths, _error = value
+    return all(Path(path).exists() for path in render_paths)
+
+
+def generation_stages(model_builder: IncrementalModelBuilder) -> List[Stage]:
+    """plan -> metrics -> model -> svg -> glb -> render, as run by ``generate_once``."""
+
+    def run_plan(config, context):
+        return build_plan_cached(config)
+
+    def run_metrics(config, context, plan):
+        return validate_geometry(plan, config)
+
+    def run_model(config, context, plan):
+        return model_builder.build(plan, config)
+
+    def run_svg(config, context, plan, metrics):
+        path = context["paths"]["plan"]
+        write_svg(
+            plan,
+            path,
+            include_labels=bool(config.get("labels", True)),
+            include_courtyard=str(config.get("courtyard_module", "none")) != "none",
+            config=config,
+            metrics=metrics,
+        )
+        return path
+
+    def run_glb(config, context, model):
+        path = context["paths"]["glb"]
+        tolerance = config.get("glb_quantize_tolerance_ft", None)
+        context["glb_report"] = write_glb(
+            model,
+            path,
+            rotate_x_deg=float(config.get("glb_rotate_x_deg", 0.0)),
+            weld=bool(config.get("glb_weld_vertices", False)),
+            optimize_cache=bool(config.get("glb_vertex_cache", False)),
+            quantize=bool(config.get("glb_quantize", False)),
+            quantize_tolerance=None if tolerance is None else float(tolerance),
+            compress=bool(config.get("glb_meshopt", False)),
+        )
+        return path
+
+    def run_render(config, context, glb_path):
+        return render_if_available(
+            glb_path,
+            context["renders_dir"] / "latest",
+            blender_executable=context.get("blender_executable"),
+        )
+
+    return [
+        Stage("plan", run_plan),
+        Stage("metrics", run_metrics, ("plan",)),
+        Stage("model", run_model, ("plan",)),
+        Stage("svg", run_svg, ("plan", "metrics"), is_valid=_files_exist),
+        Stage("glb", run_glb, ("model",), is_valid=_files_exist),
+        Stage("render", run_render, ("glb",), is_valid=_renders_exist),
+    ]
+
+
+class GenerationSession:
+    """Keeps stage results between ``generate_once`` calls (auto mode, UI)."""
+
+    def __init__(self) -> None:
+        self.model_builder = IncrementalModelBuilder()
+        self.graph = StageGraph(generation_stages(self.model_builder))
+
+    def run(
+        self,
+        config: Mapping[str, Any],
+        paths: Mapping[str, Any],
+        renders_dir: Path,
+        blender_executable: str | None = None,
+    ) -> Dict[str, Any]:
+        context = {"paths": paths, "renders_dir": renders_dir, "blender_executable": blender_executable}
+        values = self.graph.evaluate(config, context)
+        # Export details (quantization errors) from this run's GLB stage, if it ran.
+        values["glb_report"] = context.get("glb_report", {})
+        # Reused SVG/GLB stages point at an earlier file; copy it to this run's name.
+        for stage, key in (("svg", "plan"), ("glb", "glb")):
+            target = Path(paths[key])
+            if Path(values[stage]) != target:
+                shutil.copyfile(values[stage], target)
+                values[stage] = target
+        return values
+
+    def clear(self) -> None:
+        self.graph.invalidate()
+        self.model_builder.clear()
+
+    def close(self) -> None:
+        """Release worker processes; cached stage results stay usable."""
+        self.model_builder.close()
+
+    def __enter__(self) -> "GenerationSession":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
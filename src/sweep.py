@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import itertools
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .export import MATERIALS
+from .model import build_model
+from .plan import build_plan_cached
+from .validate import validate_geometry
+
+AREA_COLUMNS: Tuple[str, ...] = ("atrium", "wing_A", "wing_B", "wing_C", "wings_total", "master_triangle", "courtyard")
+ROOM_COLUMNS: Tuple[str, ...] = ("room_A", "room_B", "room_C", "room_total")
+TIMING_COLUMNS: Tuple[str, ...] = ("plan_seconds", "validate_seconds", "model_seconds", "seconds")
+MODEL_COLUMNS: Tuple[str, ...] = ("triangles",) + tuple(f"triangles_{name}" for name in MATERIALS)
+# Streamed CSV rows are flushed in batches of this many, not one write per row.
+FLUSH_ROWS = 1024
+
+
+def _parse_value(text: str) -> Any:
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_axis(spec: str) -> Tuple[str, List[Any]]:
+    """Parse ``key=start:stop:count`` (inclusive linspace) or ``key=v1,v2,...``."""
+    key, sep, values = spec.partition("=")
+    key = key.strip()
+    if not sep or not key or not values.strip():
+        raise ValueError(f"Sweep axis must look like key=start:stop:count or key=v1,v2: {spec!r}")
+    if ":" in values:
+        parts = values.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Sweep range must be start:stop:count: {spec!r}")
+        start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+        if count < 1:
+            raise ValueError(f"Sweep range count must be >= 1: {spec!r}")
+        return key, [float(v) for v in np.linspace(start, stop, count)]
+    return key, [_parse_value(v) for v in values.split(",")]
+
+
+def read_list_file(path: Path) -> List[Dict[str, Any]]:
+    """Rows of config overrides from a CSV file with config keys as the header."""
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        return [
+            {key: _parse_value(value) for key, value in row.items() if value is not None and value.strip() != ""}
+            for row in csv.DictReader(fh)
+        ]
+
+
+def expand_points(
+    axes: Sequence[Tuple[str, Sequence[Any]]],
+    rows: Sequence[Dict[str, Any]] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Cartesian product of the list-file rows (if any) and every axis."""
+    keys = [key for key, _ in axes]
+    for row in rows if rows else [{}]:
+        for values in itertools.product(*(values for _, values in axes)):
+            point = dict(row)
+            point.update(zip(keys, values))
+            yield point
+
+
+def evaluate_point(task: Tuple[Dict[str, Any], Dict[str, Any], bool]) -> Dict[str, Any]:
+    """Plan + validation (and optionally the model) for one sweep point.
+
+    Failures are reported in the row (``ok`` = 0, ``error``) rather than raised,
+    so one bad point does not abort the sweep.
+    """
+    base_config, overrides, with_model = task
+    config = dict(base_config)
+    config.update(overrides)
+    row: Dict[str, Any] = {"ok": 0, "error": ""}
+    t_start = time.perf_counter()
+    try:
+        t0 = time.perf_counter()
+        plan = build_plan_cached(config)
+        t1 = time.perf_counter()
+        metrics = validate_geometry(plan, config)
+        t2 = time.perf_counter()
+        row["plan_seconds"] = t1 - t0
+        row["validate_seconds"] = t2 - t1
+        row.update({key: float(metrics["areas"][key]) for key in AREA_COLUMNS})
+        row.update({key: float(metrics["triangle_room_areas"][key]) for key in ROOM_COLUMNS})
+        row["triangle_alignment_residual"] = float(metrics["triangle_alignment_residual"])
+        row["courtyard_enabled"] = int(bool(metrics["courtyard_enabled"]))
+        if with_model:
+            # Sweep points already run in parallel; keep each model serial.
+            model = build_model(plan, config, workers=1)
+            row["model_seconds"] = time.perf_counter() - t2
+            counts = {name: len(tris) for name, tris in model.triangles_by_material.items()}
+            row["triangles"] = sum(counts.values())
+            for name in MATERIALS:
+                row[f"triangles_{name}"] = counts.get(name, 0)
+        row["ok"] = 1
+    except Exception as exc:  # noqa: BLE001 - recorded per row
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["seconds"] = time.perf_counter() - t_start
+    return row
+
+
+def sweep_columns(keys: Sequence[str], with_model: bool) -> List[str]:
+    columns = ["index", *keys, "ok", "error"]
+    columns += list(AREA_COLUMNS) + list(ROOM_COLUMNS) + ["triangle_alignment_residual", "courtyard_enabled"]
+    if with_model:
+        columns += list(MODEL_COLUMNS)
+    columns += [name for name in TIMING_COLUMNS if with_model or name != "model_seconds"]
+    return columns
+
+
+def _column_array(values: List[Any]) -> np.ndarray:
+    present = [value for value in values if value != ""]
+    if all(isinstance(value, (int, float, bool)) for value in present):
+        return np.array([np.nan if value == "" else value for value in values], dtype=np.float64)
+    return np.array([str(value) for value in values])
+
+
+def run_sweep(
+    base_config: Dict[str, Any],
+    points: Iterable[Dict[str, Any]],
+    csv_path: Path,
+    with_model: bool = False,
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> Dict[str, Any]:
+    """Evaluate every point over a process pool, streaming rows to ``csv_path``.
+
+    Rows are written in point order as results arrive (flushed every
+    ``FLUSH_ROWS`` rows); a columnar ``.npz`` with the same columns is written
+    next to the CSV once the sweep finishes.
+    """
+    points = list(points)
+    keys: List[str] = []
+    for point in points:
+        keys.extend(key for key in point if key not in keys)
+    columns = sweep_columns(keys, with_model)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    npz_path = csv_path.with_suffix(".npz")
+    table: Dict[str, List[Any]] = {name: [] for name in columns}
+    failed = 0
+
+    t_start = time.perf_counter()
+    tasks = ((base_config, point, with_model) for point in points)
+    workers = workers or os.cpu_count() or 1
+    with csv_path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns, restval="", extrasaction="ignore")
+        writer.writeheader()
+        if workers == 1:
+            results = map(evaluate_point, tasks)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(evaluate_point, tasks, chunksize=chunksize)
+        try:
+            for index, (point, result) in enumerate(zip(points, results)):
+                row = {"index": index, **{key: point.get(key, "") for key in keys}, **result}
+                failed += 0 if row["ok"] else 1
+                writer.writerow(row)
+                if (index + 1) % FLUSH_ROWS == 0:
+                    fh.flush()
+                for name in columns:
+                    table[name].append(row.get(name, ""))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    np.savez(npz_path, **{name: _column_array(values) for name, values in table.items()})
+    return {
+        "points": len(points),
+        "failed": failed,
+        "seconds": time.perf_counter() - t_start,
+        "csv": csv_path,
+        "npz": npz_path,
+    }
@@ -0,0 +1,606 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+from .triangulate import triangulate_polygons
+
+Point2D = Tuple[float, float]
+
+# Embankment grading: terrain slopes down to meet the extended driveway.
+EMBANKMENT_WIDTH = 20.0
+
+
+def profile_z(y: np.ndarray, y_break: float, y_low: float, z_high: float, z_low: float) -> np.ndarray:
+    """Array form of ``model._terrain_profile``: flat, then a linear drop from y_break to y_low."""
+    y = np.asarray(y, dtype=np.float64)
+    if abs(y_low - y_break) < 1e-9:
+        return np.where(y <= y_break, z_high, z_low)
+    t = (y - y_break) / (y_low - y_break)
+    z = z_high + (z_low - z_high) * t
+    return np.where(y <= y_break, z_high, np.where(y >= y_low, z_low, z))
+
+
+class SegmentIndex:
+    """Uniform grid over polyline segments for nearest-segment queries within ``radius``.
+
+    Each cell lists (in segment order) every segment whose bounding box grown
+    by ``radius`` touches it, so a query only measures those candidates.
+    Zero-length segments are ignored.
+    """
+
+    def __init__(self, polylines: Sequence[Sequence[Point2D]], radius: float, cell_size: float | None = None) -> None:
+        starts = [line[i] for line in polylines for i in range(len(line) - 1)]
+        ends = [line[i + 1] for line in polylines for i in range(len(line) - 1)]
+        p0 = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+        delta = np.asarray(ends, dtype=np.float64).reshape(-1, 2) - p0
+        seg_sq = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]
+        keep = seg_sq >= 1e-12
+        self.p0, self.delta, self.seg_sq = p0[keep], delta[keep], seg_sq[keep]
+        self.radius = float(radius)
+        self.cell = float(cell_size or radius / 4.0)
+
+        count = len(self.seg_sq)
+        if count == 0:
+            self.origin = np.zeros(2)
+            self.shape = (0, 0)
+            self.table = np.empty((0, 0), dtype=np.int64)
+            self.counts = np.empty(0, dtype=np.int64)
+            return
+        lo = np.minimum(self.p0, self.p0 + self.delta) - self.radius
+        hi = np.maximum(self.p0, self.p0 + self.delta) + self.radius
+        self.origin = lo.min(axis=0)
+        extent = hi.max(axis=0) - self.origin
+        nx = max(1, int(math.ceil(extent[0] / self.cell)))
+        ny = max(1, int(math.ceil(extent[1] / self.cell)))
+        self.shape = (nx, ny)
+
+        first = np.floor((lo - self.origin) / self.cell).astype(np.int64)
+        last = np.minimum(np.floor((hi - self.origin) / self.cell).astype(np.int64), (nx - 1, ny - 1))
+        buckets = [[] for _ in range(nx * ny)]
+        for k, ((ix0, iy0), (ix1, iy1)) in enumerate(zip(first.tolist(), last.tolist())):
+            for ix in range(ix0, ix1 + 1):
+                for iy in range(iy0, iy1 + 1):
+                    buckets[ix * ny + iy].append(k)
+        width = max(1, max(len(bucket) for bucket in buckets))
+        self.table = np.full((nx * ny, width), -1, dtype=np.int64)
+        for cell, bucket in enumerate(buckets):
+            self.table[cell, : len(bucket)] = bucket
+        self.counts = np.array([len(bucket) for bucket in buckets], dtype=np.int64)
+
+    def nearest(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(distance, px, py)`` to the closest segment point; distance is inf when
+        no segment is within ``radius``.  Ties go to the earlier segment."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        dist = np.full(x.shape, np.inf)
+        px = np.zeros(x.shape)
+        py = np.zeros(x.shape)
+        if not self.table.size or not x.size:
+            return dist, px, py
+        nx, ny = self.shape
+        ix = np.floor((x - self.origin[0]) / self.cell)
+        iy = np.floor((y - self.origin[1]) / self.cell)
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        if not inside.any():
+            return dist, px, py
+
+        cells = ix[inside].astype(np.int64) * ny + iy[inside].astype(np.int64)
+        qx, qy = x[inside], y[inside]
+        d_in = np.full(qx.shape, np.inf)
+        px_in = np.zeros(qx.shape)
+        py_in = np.zeros(qx.shape)
+        # Rows are grouped by their cell's candidate count (rounded up to a power
+        # of two) so dense cells near the curve don't pad every query.
+        counts = self.counts[cells]
+        width_class = np.where(counts > 0, 2 ** np.ceil(np.log2(np.maximum(counts, 1))), 0).astype(np.int64)
+        for width in np.unique(width_class).tolist():
+            if width == 0:
+                continue
+            rows = np.nonzero(width_class == width)[0]
+            width = min(width, self.table.shape[1])
+            d_in[rows], px_in[rows], py_in[rows] = self._closest(qx[rows], qy[rows], self.table[cells[rows], :width])
+        dist[inside] = np.where(d_in < self.radius, d_in, np.inf)
+        px[inside] = px_in
+        py[inside] = py_in
+        return dist, px, py
+
+    def _closest(self, x: np.ndarray, y: np.ndarray, cand: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        qx, qy = x[:, None], y[:, None]
+        valid = cand >= 0
+        cand = np.where(valid, cand, 0)
+        e0x, e0y = self.p0[cand, 0], self.p0[cand, 1]
+        edx, edy = self.delta[cand, 0], self.delta[cand, 1]
+        et = np.clip(((qx - e0x) * edx + (qy - e0y) * edy) / self.seg_sq[cand], 0.0, 1.0)
+        cx, cy = e0x + et * edx, e0y + et * edy
+        d = np.where(valid, np.hypot(qx - cx, qy - cy), np.inf)
+        best = np.argmin(d, axis=1)
+        rows = np.arange(len(best))
+        return d[rows, best], cx[rows, best], cy[rows, best]
+
+
+@dataclass(frozen=True)
+class TerrainField:
+    """Site terrain heights for whole arrays of plan points.
+
+    The base profile drops from ``upper_ground`` to ``lower_ground`` between
+    ``y_break`` and ``y_low``; within ``EMBANKMENT_WIDTH`` of the extended
+    driveway edges it is smoothstep-blended down to the driveway surface.
+    """
+
+    y_break: float
+    y_low: float
+    upper_ground: float
+    lower_ground: float
+    drive_end: Point2D
+    drive_ux: float
+    drive_uy: float
+    driveway_end_z: float
+    approach_slope: float
+    embankment: SegmentIndex | None = None
+
+    def base_z(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return profile_z(y, self.y_break, self.y_low, self.upper_ground, self.lower_ground)
+
+    def extra_drive_z(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        proj = (x - self.drive_end[0]) * self.drive_ux + (y - self.drive_end[1]) * self.drive_uy
+        return self.driveway_end_z - self.approach_slope * np.maximum(0.0, proj)
+
+    def z(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        base = self.base_z(x, y)
+        if self.embankment is None:
+            return base
+        dist, px, py = self.embankment.nearest(x, y)
+        near = np.isfinite(dist)
+        if not near.any():
+            return base
+        nearest_dz = self.extra_drive_z(px[near], py[near])
+        blend = dist[near] / EMBANKMENT_WIDTH
+        blend = blend * blend * (3.0 - 2.0 * blend)
+        out = base.copy()
+        out[near] = nearest_dz + blend * (base[near] - nearest_dz)
+        return out
+
+    def z_points(self, points) -> np.ndarray:
+        """Heights for an ``(n, 2)`` (or wider) array of plan points."""
+        points = np.asarray(points, dtype=np.float64).reshape(len(points), -1)
+        return self.z(points[:, 0], points[:, 1])
+
+
+# Quadtree depth cap for the terrain mesher (size / 2**20 is far below any edge length).
+_MAX_DEPTH = 20
+_CELL_IN, _CELL_CLIP, _CELL_OUT = 0, 1, 2
+# Clipped cell -> (its pieces of the terrain area, triangle bound, boundary positions).
+_ClipCells = Dict[Tuple[int, int, int], Tuple[List[Polygon], int, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class TerrainMeshSettings:
+    """Resolution knobs for ``mesh_terrain`` (config keys ``terrain_*``)."""
+
+    max_edge: float = 120.0
+    min_edge: float = 20.0
+    grading: float = 0.3
+    error_tol: float = 0.5
+    max_triangles: int = 600
+
+    @classmethod
+    def from_config(cls, config) -> "TerrainMeshSettings":
+        settings = cls(
+            max_edge=float(config.get("terrain_max_edge", cls.max_edge)),
+            min_edge=float(config.get("terrain_min_edge", cls.min_edge)),
+            grading=float(config.get("terrain_grading", cls.grading)),
+            error_tol=float(config.get("terrain_error_tol", cls.error_tol)),
+            max_triangles=int(config.get("terrain_max_triangles", cls.max_triangles)),
+        )
+        if not 0.0 < settings.min_edge <= settings.max_edge:
+            raise ValueError("terrain_min_edge must be > 0 and <= terrain_max_edge")
+        if settings.grading < 0.0 or settings.error_tol <= 0.0:
+            raise ValueError("terrain_grading must be >= 0 and terrain_error_tol > 0")
+        if settings.max_triangles < 2:
+            raise ValueError("terrain_max_triangles must be at least 2")
+        return settings
+
+
+@dataclass
+class TerrainMesh:
+    vertices: np.ndarray  # (n, 3)
+    faces: np.ndarray  # (m, 3), counter-clockwise in plan
+    outline: np.ndarray  # (k, 3) square boundary, counter-clockwise, every mesh vertex on it
+
+
+def _cell_bounds(keys: np.ndarray, origin: Point2D, size: float) -> Tuple[np.ndarray, ...]:
+    scale = 2.0 ** keys[:, 0]
+    x0 = origin[0] + size * (keys[:, 1] / scale)
+    x1 = origin[0] + size * ((keys[:, 1] + 1) / scale)
+    y0 = origin[1] + size * (keys[:, 2] / scale)
+    y1 = origin[1] + size * ((keys[:, 2] + 1) / scale)
+    return x0, y0, x1, y1
+
+
+def _classify(keys: np.ndarray, origin: Point2D, size: float, cuts, cut_edges) -> np.ndarray:
+    """IN (all terrain), CLIP (crosses a cut boundary) or OUT (inside a cut) per cell."""
+    boxes = shapely.box(*_cell_bounds(keys, origin, size))
+    status = np.full(len(keys), _CELL_IN, dtype=np.int64)
+    if cuts.is_empty:
+        return status
+    status[shapely.intersects(boxes, cut_edges)] = _CELL_CLIP
+    status[(status == _CELL_IN) & shapely.within(boxes, cuts)] = _CELL_OUT
+    return status
+
+
+def _split_priority(
+    keys: np.ndarray,
+    origin: Point2D,
+    size: float,
+    cuts,
+    height: Callable[[np.ndarray], np.ndarray],
+    settings: TerrainMeshSettings,
+) -> np.ndarray:
+    """> 1 where a cell is larger than the graded target size or fits the terrain worse than ``error_tol``."""
+    x0, y0, x1, y1 = _cell_bounds(keys, origin, size)
+    cell = size / 2.0 ** keys[:, 0]
+    xm, ym = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+    if cuts.is_empty:
+        dist = np.full(len(keys), np.inf)
+    else:
+        dist = shapely.distance(shapely.points(xm, ym), cuts)
+    target = np.minimum(settings.max_edge, settings.min_edge + settings.grading * np.maximum(0.0, dist - cell * 0.7072))
+    ratio = cell / target
+
+    # Corners, edge midpoints and centre: how far the two-triangle fit is off.
+    sx = np.stack([x0, x1, x1, x0, xm, x1, xm, x0, xm], axis=1)
+    sy = np.stack([y0, y0, y1, y1, y0, ym, y1, ym, ym], axis=1)
+    z = height(np.column_stack([sx.ravel(), sy.ravel()])).reshape(-1, 9)
+    edge_err = np.abs(z[:, 4:8] - (z[:, [0, 1, 2, 3]] + z[:, [1, 2, 3, 0]]) * 0.5).max(axis=1)
+    diag_err = np.minimum(np.abs(z[:, 8] - (z[:, 0] + z[:, 2]) * 0.5), np.abs(z[:, 8] - (z[:, 1] + z[:, 3]) * 0.5))
+    error = np.maximum(edge_err, diag_err) / settings.error_tol
+    priority = np.maximum(ratio, error)
+    return np.where(cell >= 2.0 * settings.min_edge, priority, 0.0)
+
+
+def _children(key: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
+    level, i, j = key
+    return [(level + 1, 2 * i + a, 2 * j + b) for b in (0, 1) for a in (0, 1)]
+
+
+def _parent(key: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    level, i, j = key
+    return (level - 1, i // 2, j // 2)
+
+
+def _classify_children(
+    keys: List[Tuple[int, int, int]],
+    status: Dict[Tuple[int, int, int], int],
+    origin: Point2D,
+    size: float,
+    cuts,
+    cut_edges,
+) -> List[Tuple[int, int, int]]:
+    """Children of ``keys``, with their status recorded in ``status`` (only clipped parents are re-tested)."""
+    children = [child for key in keys for child in _children(key)]
+    unknown = [child for child in children if child not in status]
+    clipped = []
+    for child in unknown:
+        status[child] = status[_parent(child)]
+        if status[child] == _CELL_CLIP:
+            clipped.append(child)
+    if clipped:
+        for child, value in zip(clipped, _classify(np.array(clipped), origin, size, cuts, cut_edges).tolist()):
+            status[child] = value
+    return children
+
+
+def _refine(
+    origin: Point2D,
+    size: float,
+    cuts,
+    cut_edges,
+    height: Callable[[np.ndarray], np.ndarray],
+    settings: TerrainMeshSettings,
+    max_leaves: int,
+) -> Tuple[Dict[Tuple[int, int, int], int], List[Tuple[int, int, int]]]:
+    """Refine the quadtree once: (status of every cell reached, splits in refinement order).
+
+    Each level splits its worst cells first and stops adding leaves once
+    ``max_leaves`` is reached.  Parents split before their children, so
+    every prefix of the splits is a tree, and dropping splits from the end
+    merges the finest, least needed cells first.
+    """
+    root = (0, 0, 0)
+    status = {root: int(_classify(np.array([root]), origin, size, cuts, cut_edges)[0])}
+    splits: List[Tuple[int, int, int]] = []
+    leaf_count = 1
+    frontier = [root] if status[root] != _CELL_OUT else []
+    for _level in range(_MAX_DEPTH):
+        if not frontier:
+            break
+        priority = _split_priority(np.array(frontier), origin, size, cuts, height, settings)
+        order = np.argsort(-priority, kind="stable")
+        wanted = int(np.count_nonzero(priority > 1.0))
+        allowed = max(0, (max_leaves - leaf_count) // 3)
+        chosen = [frontier[k] for k in order[: min(wanted, allowed)].tolist()]
+        splits.extend(chosen)
+        leaf_count += 3 * len(chosen)
+        children = _classify_children(chosen, status, origin, size, cuts, cut_edges)
+        frontier = [child for child in children if status[child] != _CELL_OUT]
+    return status, splits
+
+
+def _tree(
+    internal: set,
+    status: Dict[Tuple[int, int, int], int],
+    origin: Point2D,
+    size: float,
+    cuts,
+    cut_edges,
+) -> Dict[Tuple[int, int, int], int]:
+    """Leaves (key -> status) under the split cells ``internal``, clipped and 2:1 balanced in place."""
+    leaves = {(0, 0, 0): status[(0, 0, 0)]} if (0, 0, 0) not in internal else {}
+    for key in sorted(internal):
+        for child in _children(key):
+            if child not in internal:
+                leaves[child] = status[child]
+
+    def split(keys: List[Tuple[int, int, int]]) -> None:
+        for key in keys:
+            del leaves[key]
+            internal.add(key)
+        for child in _classify_children(keys, status, origin, size, cuts, cut_edges):
+            leaves[child] = status[child]
+
+    # Every clipped cell at the finest level: clipped pieces never get hanging nodes.
+    finest = max(key[0] for key in leaves)
+    while True:
+        coarse = [key for key, value in leaves.items() if value == _CELL_CLIP and key[0] < finest]
+        if not coarse:
+            break
+        split(coarse)
+
+    # 2:1 balance so each unclipped cell has at most one hanging node per edge.
+    changed = True
+    while changed:
+        changed = False
+        for key in [key for key, value in leaves.items() if value == _CELL_IN]:
+            level, i, j = key
+            for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                neighbour = (level, i + di, j + dj)
+                if neighbour in internal and any(child in internal for child in _children(neighbour)):
+                    split([key])
+                    changed = True
+                    break
+    return leaves
+
+
+def _perimeter(xy: np.ndarray, origin: Point2D, size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """(on the square's boundary, counter-clockwise distance along it from ``origin``) per point."""
+    x0, y0 = origin
+    x1, y1 = origin[0] + size, origin[1] + size
+    on_edge = (xy[:, 0] == x0) | (xy[:, 0] == x1) | (xy[:, 1] == y0) | (xy[:, 1] == y1)
+    along = np.select(
+        [xy[:, 1] == y0, xy[:, 0] == x1, xy[:, 1] == y1],
+        [xy[:, 0] - x0, size + xy[:, 1] - y0, 2 * size + x1 - xy[:, 0]],
+        3 * size + y1 - xy[:, 1],
+    )
+    return on_edge, along
+
+
+def _clip_cells(
+    keys: List[Tuple[int, int, int]],
+    cells: _ClipCells,
+    origin: Point2D,
+    size: float,
+    area,
+) -> None:
+    """Cache (pieces of ``area``, triangle bound, boundary positions) for each clipped cell in ``keys``."""
+    missing = [key for key in keys if key not in cells]
+    if not missing:
+        return
+    boxes = shapely.box(*_cell_bounds(np.array(missing), origin, size))
+    # Box/boundary crossings can land within rounding of a box corner.
+    pieces = shapely.remove_repeated_points(shapely.intersection(boxes, area), 1e-9)
+    for key, piece in zip(missing, pieces.tolist()):
+        polys = _polygons(piece)
+        # Triangulating n ring vertices around h holes gives n + 2h - 2 faces
+        # (rings are closed, so n = coordinates - 1 - h); slivers only remove some.
+        triangles = sum(max(0, int(shapely.get_num_coordinates(poly)) + len(poly.interiors) - 3) for poly in polys)
+        xy = shapely.get_coordinates(polys) if polys else np.empty((0, 2))
+        on_edge, along = _perimeter(xy, origin, size)
+        cells[key] = (polys, triangles, along[on_edge])
+
+
+def _cell_codes(level: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """One integer per cell key (neighbours just outside the square included), for ``np.isin``."""
+    return (level << 44) | ((i + 1) << 22) | (j + 1)
+
+
+def _estimate(
+    leaves: Dict[Tuple[int, int, int], int],
+    internal: set,
+    cells: _ClipCells,
+    origin: Point2D,
+    size: float,
+) -> int:
+    """Upper bound on the faces plus skirt triangles ``_emit`` makes for this tree.
+
+    Unclipped cells cost two triangles, or one per ring vertex when fanned
+    around hanging nodes; clipped cells cost their pieces' triangulation.
+    """
+    faces = 0
+    outline = [np.empty(0)]
+    unclipped = []
+    for key, value in leaves.items():
+        if value == _CELL_CLIP:
+            _polys, triangles, along = cells[key]
+            faces += triangles
+            outline.append(along)
+        elif value == _CELL_IN:
+            unclipped.append(key)
+    if unclipped:
+        keys = np.array(unclipped, dtype=np.int64)
+        level, i, j = keys[:, 0], keys[:, 1], keys[:, 2]
+        split = np.array(sorted(internal), dtype=np.int64).reshape(-1, 3)
+        split_codes = _cell_codes(split[:, 0], split[:, 1], split[:, 2])
+        neighbours = ((0, -1), (1, 0), (0, 1), (-1, 0))
+        mids = sum(np.isin(_cell_codes(level, i + di, j + dj), split_codes).astype(np.int64) for di, dj in neighbours)
+        faces += int(np.where(mids > 0, 4 + mids, 2).sum())
+        x0, y0, x1, y1 = _cell_bounds(keys, origin, size)
+        corners = np.column_stack([np.concatenate([x0, x1, x1, x0]), np.concatenate([y0, y0, y1, y1])])
+        on_edge, along = _perimeter(corners, origin, size)
+        outline.append(along[on_edge])
+    return faces + 2 * len(np.unique(np.concatenate(outline)))
+
+
+def _emit(
+    leaves: Dict[Tuple[int, int, int], int],
+    internal: set,
+    cells: _ClipCells,
+    origin: Point2D,
+    size: float,
+    height: Callable[[np.ndarray], np.ndarray],
+) -> TerrainMesh:
+    finest = max(key[0] for key in leaves)
+    grid_index: Dict[Tuple[int, int], int] = {}
+    points: List[Tuple[float, float]] = []
+    span = 2 ** finest
+
+    def grid_vertex(ix: int, iy: int) -> int:
+        index = grid_index.get((ix, iy))
+        if index is None:
+            index = grid_index[(ix, iy)] = len(points)
+            points.append((origin[0] + size * (ix / span), origin[1] + size * (iy / span)))
+        return index
+
+    faces: List[Tuple[int, int, int]] = []
+    quads: List[Tuple[int, int, int, int]] = []
+    clipped: List[Polygon] = []
+    for key, status in leaves.items():
+        if status == _CELL_CLIP:
+            clipped.extend(cells[key][0])
+            continue
+        if status == _CELL_OUT:
+            continue
+        level, i, j = key
+        step = 2 ** (finest - level)
+        ix, iy = i * step, j * step
+        corners = [grid_vertex(ix, iy), grid_vertex(ix + step, iy), grid_vertex(ix + step, iy + step), grid_vertex(ix, iy + step)]
+        # Edge midpoints exist where the neighbour across that edge is subdivided.
+        half = step // 2
+        edges = (
+            ((level, i, j - 1), (ix + half, iy)),
+            ((level, i + 1, j), (ix + step, iy + half)),
+            ((level, i, j + 1), (ix + half, iy + step)),
+            ((level, i - 1, j), (ix, iy + half)),
+        )
+        mids = [grid_vertex(*mid) if neighbour in internal else None for neighbour, mid in edges]
+        if all(mid is None for mid in mids):
+            quads.append(tuple(corners))
+            continue
+        ring = []
+        for corner, mid in zip(corners, mids):
+            ring.append(corner)
+            if mid is not None:
+                ring.append(mid)
+        centre = grid_vertex(ix + half, iy + half)
+        faces.extend((centre, ring[k], ring[(k + 1) % len(ring)]) for k in range(len(ring)))
+
+    for xy, tri in triangulate_polygons(clipped):
+        # Drop near-degenerate slivers along the clipped boundary.
+        a, b, c = xy[tri[:, 0]], xy[tri[:, 1]], xy[tri[:, 2]]
+        cross = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        tri = tri[cross > 1e-9]
+        base = len(points)
+        points.extend(map(tuple, xy.tolist()))
+        faces.extend((base + a, base + b, base + c) for a, b, c in tri.tolist())
+
+    xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    z = height(xy) if len(xy) else np.empty(0)
+    if quads:
+        # Split each quad along the diagonal whose ends differ least in height.
+        q = np.asarray(quads, dtype=np.int64)
+        along_02 = np.abs(z[q[:, 0]] - z[q[:, 2]]) <= np.abs(z[q[:, 1]] - z[q[:, 3]])
+        tri_a = np.where(along_02[:, None], q[:, [0, 1, 2]], q[:, [0, 1, 3]])
+        tri_b = np.where(along_02[:, None], q[:, [0, 2, 3]], q[:, [1, 2, 3]])
+        faces.extend(map(tuple, np.vstack([tri_a, tri_b]).tolist()))
+    vertices = np.column_stack([xy, z])
+
+    on_edge, along = _perimeter(xy, origin, size)
+    _, first = np.unique(along[on_edge], return_index=True)
+    return TerrainMesh(vertices, np.asarray(faces, dtype=np.int64).reshape(-1, 3), vertices[on_edge][first])
+
+
+def mesh_terrain(
+    origin: Point2D,
+    size: float,
+    area,
+    height: Callable[[np.ndarray], np.ndarray],
+    settings: TerrainMeshSettings,
+    reserved: int = 0,
+) -> TerrainMesh:
+    """Graded triangle mesh of ``area`` (the terrain inside the square at ``origin``).
+
+    A quadtree over the square is refined level by level wherever a cell is
+    larger than ``min_edge + grading * distance-to-cuts`` (capped at
+    ``max_edge``) or its two-triangle fit misses ``height`` by more than
+    ``error_tol``.  Cells crossing a cut are then brought to the finest level
+    and clipped exactly, the tree is 2:1 balanced, and cells next to finer
+    neighbours are fanned from their centre so the mesh has no T-junctions.
+
+    ``max_triangles`` bounds the faces plus two skirt triangles per
+    ``outline`` edge plus ``reserved`` (triangles the caller adds, such as
+    the underside).  The tree is refined once and each leaf's triangles are
+    estimated (clipped and fanned cells cost more than two); when the total
+    is over the cap, the last splits are merged back, bisecting on how many
+    to keep, and only the tree that fits is emitted.  Raises ``ValueError``
+    when even the unrefined mesh does not fit.
+    """
+    square = shapely.box(origin[0], origin[1], origin[0] + size, origin[1] + size)
+    cuts = square.difference(area)
+    cut_edges = cuts.boundary
+    shapely.prepare(cuts)
+    shapely.prepare(cut_edges)
+
+    budget = settings.max_triangles - reserved
+    status, splits = _refine(origin, size, cuts, cut_edges, height, settings, max(1, budget // 2))
+    cells: _ClipCells = {}
+
+    def tree(keep: int) -> Tuple[Dict[Tuple[int, int, int], int], set, int]:
+        internal = set(splits[:keep])
+        leaves = _tree(internal, status, origin, size, cuts, cut_edges)
+        _clip_cells([key for key, value in leaves.items() if value == _CELL_CLIP], cells, origin, size, area)
+        return leaves, internal, _estimate(leaves, internal, cells, origin, size)
+
+    leaves, internal, cost = tree(len(splits))
+    if cost > budget:
+        # Bisect for the longest prefix of splits that fits: ``high`` is over budget, ``low`` fits.
+        low, high, fit = -1, len(splits), None
+        while high - low > 1:
+            keep = (low + high) // 2
+            candidate = tree(keep)
+            if candidate[2] <= budget:
+                low, fit = keep, candidate
+            else:
+                high = keep
+        leaves, internal, cost = fit if fit is not None else tree(0)
+    mesh = _emit(leaves, internal, cells, origin, size, height)
+    count = mesh.faces.shape[0] + 2 * mesh.outline.shape[0] + reserved
+    if count > settings.max_triangles:
+        raise ValueError(
+            f"terrain_max_triangles={settings.max_triangles} is below the {count} triangles of the coarsest ground mesh"
+        )
+    return mesh
+
+
+def _polygons(geometry) -> List[Polygon]:
+    if geometry is None or geometry.is_empty:
+        return []
+    if isinstance(geometry, Polygon):
+        return [geometry]
+    return [geom for geom in getattr(geometry, "geoms", []) if isinstance(geom, Polygon) and not geom.is_empty]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+
+def _convex_fan(xy: np.ndarray) -> Optional[np.ndarray]:
+    """Counter-clockwise fan faces for a strictly convex ring (most caps and slabs), else None."""
+    edge = np.diff(xy, axis=0, append=xy[:1])
+    prev = np.concatenate([edge[-1:], edge[:-1]])
+    turn = prev[:, 0] * edge[:, 1] - prev[:, 1] * edge[:, 0]
+    if (turn > 0).all():
+        first, second = 1, 2
+    elif (turn < 0).all():
+        first, second = 2, 1
+    else:
+        return None
+    fan = np.zeros((len(xy) - 2, 3), dtype=np.int64)
+    fan[:, first] = np.arange(1, len(xy) - 1)
+    fan[:, second] = fan[:, first] + 1
+    return fan
+
+
+def _indexed(corners: np.ndarray, owner: np.ndarray, count: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Per-owner shared vertices and counter-clockwise faces for ``(m, 3, 2)`` triangle corners."""
+    a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+    cross = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    keep = cross != 0
+    corners = np.where((cross < 0)[:, None, None], corners[:, [0, 2, 1]], corners)[keep]
+    owner = owner[keep]
+    # One sort dedupes every owner's points: runs of equal (owner, x, y) share a vertex.
+    points = corners.reshape(-1, 2)
+    point_owner = np.repeat(owner, 3)
+    order = np.lexsort((points[:, 1], points[:, 0], point_owner))
+    ordered, ordered_owner = points[order], point_owner[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (ordered_owner[1:] != ordered_owner[:-1]) | np.any(ordered[1:] != ordered[:-1], axis=1)
+    inverse = np.empty(len(order), dtype=np.int64)
+    inverse[order] = np.cumsum(first) - 1
+    xy, xy_owner = ordered[first], ordered_owner[first]
+
+    bounds = np.arange(count + 1)
+    vertex_start = np.searchsorted(xy_owner, bounds)
+    face_start = np.searchsorted(owner, bounds)
+    faces = inverse.reshape(-1, 3)
+    return [
+        (xy[vertex_start[k] : vertex_start[k + 1]], faces[face_start[k] : face_start[k + 1]] - vertex_start[k])
+        for k in range(count)
+    ]
+
+
+def triangulate_polygons(polys: Sequence[Polygon]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """:func:`triangulate_polygon` for many polygons in one vectorized GEOS call.
+
+    Uses GEOS constrained Delaunay triangulation: triangles only use the
+    polygon's own vertices, respect every ring edge and cover the polygon
+    (holes excluded) exactly, so no point-in-polygon filtering is needed.
+    """
+    if not len(polys):
+        return []
+    geoms = np.empty(len(polys), dtype=object)
+    geoms[:] = list(polys)
+    # GEOS rejects zero-area rings ("Unable to find a convex corner").
+    flat = shapely.area(geoms) == 0
+    geoms[flat] = None
+    parts, owner = shapely.get_parts(shapely.constrained_delaunay_triangles(geoms), return_index=True)
+    # Each part is a closed 4-point triangle ring.
+    corners = shapely.get_coordinates(shapely.get_exterior_ring(parts)).reshape(-1, 4, 2)[:, :3]
+    return _indexed(corners, owner, len(polys))
+
+
+def triangulate_polygon(poly: Polygon) -> Tuple[np.ndarray, np.ndarray]:
+    """``(vertices (n, 2), faces (m, 3))`` for ``poly``, every face counter-clockwise."""
+    if not poly.interiors:
+        xy = shapely.get_coordinates(shapely.remove_repeated_points(poly.exterior))[:-1]
+        if len(xy) >= 3:
+            fan = _convex_fan(xy)
+            if fan is not None:
+                return xy, fan
+    return triangulate_polygons([poly])[0]
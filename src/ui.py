@@ -12,7 +12,8 @@ from typing import Any, Dict, List, Tuple
 
 from .blender_live_session import launch_live_reload
 from .main import DEFAULT_CONFIG_PATH, PROJECT_ROOT, _load_config, generate_once
-from .plan import build_plan
+from .plan import PlanGeometry, build_plan_cached
+from .stages import GenerationSession
 
 Point2D = Tuple[float, float]
 
@@ -65,6 +66,10 @@ class ParametricUI:
         self._src_scan_seconds = 1.0
 
         self._viewport_points: List[Point2D] = []
+        # Last plan drawn; pan/rotate/zoom redraws reuse it instead of rebuilding.
+        self._viewport_plan: PlanGeometry | None = None
+        # Stage cache shared by successive generations (only touched by the worker).
+        self._session = GenerationSession()
         self._vp_scale = 1.0
         self._vp_pan_x = 0.0
         self._vp_pan_y = 0.0
@@ -237,6 +242,7 @@ class ParametricUI:
                 self.renders_dir,
                 timestamped=bool(self.timestamped_var.get()),
                 blender_executable=(config.get("blender_executable") or None),
+                session=self._session,
             )
             self._queue.put(("ok", result, config))
         except Exception as exc:
@@ -319,15 +325,16 @@ class ParametricUI:
 
     def _update_viewport(self, config: Dict[str, Any], reset_view: bool) -> None:
         try:
-            plan = build_plan(config)
+            plan = build_plan_cached(config)
         except Exception:
             return
 
+        self._viewport_plan = plan
         self._viewport_points = (
-            plan.master_triangle
-            + plan.hex_vertices
-            + ([pt for wing in plan.wing_polygons.values() for pt in wing])
-            + (plan.courtyard_polygon if plan.courtyard_polygon else [])
+            list(plan.master_triangle)
+            + list(plan.hex_vertices)
+            + [pt for wing in plan.wing_polygons.values() for pt in wing]
+            + list(plan.courtyard_polygon)
         )
         if reset_view or self._vp_scale <= 0:
             self._vp_rotation = 0.0
@@ -391,10 +398,12 @@ class ParametricUI:
 
     def _draw_viewport(self, plan=None) -> None:
         self.view_canvas.delete("all")
+        if plan is None:
+            plan = self._viewport_plan
         if plan is None:
             cfg = self._try_config_from_inputs() or self.config
             try:
-                plan = build_plan(cfg)
+                plan = build_plan_cached(cfg)
             except Exception:
                 return
         self._draw_poly(plan.wing_polygons["A"], fill="#dbe6f4", outline="#304d6d", width=1)
@@ -523,7 +532,10 @@ def main() -> None:
     app = ParametricUI(root, config_path=config_path, out_dir=out_dir, renders_dir=renders_dir)
     if args.timestamped:
         app.timestamped_var.set(True)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app._session.close()
 
 
 if __name__ == "__main__":
@@ -59,11 +59,11 @@ def validate_geometry(plan: PlanGeometry, config: Dict[str, float]) -> Dict[str,
     if include_courtyard and not _polygon_has_edge(plan.courtyard_polygon, plan.atrium_front_edge, eps):
         raise AssertionError("Courtyard front edge must match atrium front edge.")
 
-    area_atrium = Polygon(plan.hex_vertices).area
-    area_wings = {wing: Polygon(poly).area for wing, poly in plan.wing_polygons.items()}
-    area_triangle = Polygon(plan.master_triangle).area
-    triangle_poly = Polygon(plan.master_triangle)
-    atrium_poly = Polygon(plan.hex_vertices)
+    area_atrium = plan.atrium_polygon.area
+    area_wings = {wing: plan.polygon(f"wing_{wing}").area for wing in plan.wing_polygons}
+    area_triangle = plan.polygon("master_triangle").area
+    triangle_poly = plan.polygon("master_triangle")
+    atrium_poly = plan.atrium_polygon
     triangle_usable = triangle_poly.difference(atrium_poly)
     center = (atrium_poly.centroid.x, atrium_poly.centroid.y)
     wing_angles: Dict[str, float] = {}
@@ -101,7 +101,7 @@ def validate_geometry(plan: PlanGeometry, config: Dict[str, float]) -> Dict[str,
         sector = Polygon([center, p0, p1])
         triangle_room_areas[wing_name] = triangle_usable.intersection(sector).area
 
-    area_courtyard = Polygon(plan.courtyard_polygon).area if include_courtyard else 0.0
+    area_courtyard = plan.polygon("courtyard").area if include_courtyard else 0.0
     reported_courtyard_area = area_courtyard if include_courtyard else 0.0
 
     if area_atrium <= 0 or area_triangle <= 0:
@@ -133,6 +133,7 @@ def validate_geometry(plan: PlanGeometry, config: Dict[str, float]) -> Dict[str,
             "room_C": triangle_room_areas["C"],
             "room_total": sum(triangle_room_areas.values()),
         },
+        "triangle_alignment_residual": plan.triangle_alignment_residual,
         "shared_edge_valid": include_courtyard,
         "courtyard_enabled": include_courtyard,
     }
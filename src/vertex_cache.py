@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+# Post-transform cache size assumed by ``tipsify`` (FIFO, typical of GPUs).
+DEFAULT_CACHE_SIZE = 16
+
+
+def tipsify(faces: np.ndarray, vertex_count: int, cache_size: int = DEFAULT_CACHE_SIZE) -> np.ndarray:
+    """Face order for ``(m, 3)`` ``faces`` that reuses a FIFO vertex cache of ``cache_size``.
+
+    Sander, Nehab and Barczak's "Tipsify": fan out every remaining face around
+    one vertex, then move to the emitted vertex that is still in the cache
+    and has the fewest remaining faces, falling back to recently emitted
+    vertices and then to the lowest unfinished index.  Linear time; returns
+    the permutation of face rows.
+    """
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if not faces.shape[0]:
+        return np.empty(0, dtype=np.int64)
+    corners = faces.ravel()
+    by_vertex = np.argsort(corners, kind="stable") // 3
+    starts = np.zeros(vertex_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(corners, minlength=vertex_count), out=starts[1:])
+    adjacency = by_vertex.tolist()
+    starts_list = starts.tolist()
+    live = np.diff(starts).tolist()
+    rows = faces.tolist()
+
+    stamp = [0] * vertex_count
+    emitted = [False] * faces.shape[0]
+    order: List[int] = []
+    dead_end: List[int] = []
+    clock = cache_size + 1
+    cursor = 1
+    vertex = 0
+    while vertex >= 0:
+        candidates = []
+        for face in adjacency[starts_list[vertex] : starts_list[vertex + 1]]:
+            if emitted[face]:
+                continue
+            emitted[face] = True
+            order.append(face)
+            for v in rows[face]:
+                dead_end.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if clock - stamp[v] > cache_size:
+                    stamp[v] = clock
+                    clock += 1
+
+        # Next fanning vertex: the cached candidate that stays cached longest.
+        vertex = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if clock - stamp[v] + 2 * live[v] <= cache_size:
+                    priority = clock - stamp[v]
+                if priority > best:
+                    best = priority
+                    vertex = v
+        if vertex < 0:
+            while dead_end:
+                v = dead_end.pop()
+                if live[v] > 0:
+                    vertex = v
+                    break
+        if vertex < 0:
+            while cursor < vertex_count:
+                if live[cursor] > 0:
+                    vertex = cursor
+                    break
+                cursor += 1
+    return np.asarray(order, dtype=np.int64)
+
+
+def acmr(faces: np.ndarray, cache_size: int = DEFAULT_CACHE_SIZE) -> float:
+    """Average cache misses per face of ``faces`` drawn through a FIFO cache of ``cache_size``."""
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if not faces.shape[0]:
+        return 0.0
+    cached: dict = {}
+    misses = 0
+    for v in faces.ravel().tolist():
+        # A vertex is cached while fewer than ``cache_size`` misses followed it.
+        if v not in cached or misses - cached[v] >= cache_size:
+            cached[v] = misses
+            misses += 1
+    return misses / faces.shape[0]
+
+
+def optimize_vertex_cache(
+    faces: np.ndarray, vertex_count: int, cache_size: int = DEFAULT_CACHE_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """``(faces, vertex_order)``: ``tipsify`` face order with vertices renumbered by first use.
+
+    ``vertex_order[i]`` is the old index of new vertex ``i``, so per-vertex
+    arrays are reordered with ``array[vertex_order]``.  Vertices no face uses
+    go last.
+    """
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    faces = faces[tipsify(faces, vertex_count, cache_size)]
+    first_use = np.full(vertex_count, faces.size, dtype=np.int64)
+    np.minimum.at(first_use, faces.ravel(), np.arange(faces.size))
+    vertex_order = np.argsort(first_use, kind="stable")
+    remap = np.empty(vertex_count, dtype=np.int64)
+    remap[vertex_order] = np.arange(vertex_count)
+    return remap[faces], vertex_order
@@ -0,0 +1,157 @@
+"""On-disk component cache: keys, invalidation, eviction and damaged entries."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src import component_cache
+from src.component_cache import ComponentCache, _package_modules, source_version
+from src.main import DEFAULT_CONFIG_PATH
+from src.model import MODEL_COMPONENTS, build_model, model_buffers
+from src.plan import build_plan
+from src.stages import IncrementalModelBuilder
+
+
+def _builder(plan, config):
+    return config["x"]
+
+
+def _other_builder(plan, config):
+    return config["y"]
+
+
+def _buffers(seed: int, size: int = 30):
+    rng = np.random.default_rng(seed)
+    vertices = rng.random((size, 3))
+    faces = rng.integers(0, size, (size, 3)).astype(np.int64)
+    return [("part", "concrete", vertices, faces)]
+
+
+def _always(_reads, _missing):
+    return True
+
+
+def _default_config(tmp_path):
+    config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    config["component_cache_dir"] = str(tmp_path / "cache")
+    config["model_workers"] = 1
+    return config
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    cache = ComponentCache(tmp_path, 1 << 20)
+    buffers = _buffers(0)
+    cache.store("part", _builder, "plan0", {"x": 1}, ["z"], buffers)
+    reads, missing, loaded = cache.load("part", _builder, "plan0", _always)
+    assert reads == {"x": 1} and missing == ["z"]
+    (component, material, vertices, faces), = loaded
+    assert (component, material) == ("part", "concrete")
+    assert isinstance(vertices, np.memmap) and isinstance(faces, np.memmap)
+    np.testing.assert_array_equal(vertices, buffers[0][2])
+    np.testing.assert_array_equal(faces, buffers[0][3])
+
+
+def test_key_covers_reads_plan_and_source(tmp_path, monkeypatch):
+    cache = ComponentCache(tmp_path, 1 << 20)
+    cache.store("part", _builder, "plan0", {"x": 1}, [], _buffers(0))
+    assert cache.load("part", _builder, "plan0", lambda reads, _missing: reads["x"] == 2) is None
+    assert cache.load("part", _builder, "plan1", _always) is None
+    assert cache.load("part", _other_builder, "plan0", _always) is None
+    # An edit to any source the builder depends on changes its version.
+    monkeypatch.setattr(component_cache, "source_version", lambda builder: "edited" + "0" * 58)
+    assert cache.load("part", _builder, "plan0", _always) is None
+
+
+def test_source_version_hashes_imported_modules():
+    modules = _package_modules("src.model")
+    for name in ("src.model", "src.plan", "src.predicates", "src.terrain", "src.triangulate"):
+        assert name in modules
+    assert source_version(_builder) != source_version(_other_builder)
+    assert source_version(_builder) == source_version(_builder)
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    cache = ComponentCache(tmp_path, 1 << 30)
+    for index in range(4):
+        cache.store("part", _builder, f"plan{index}", {"x": index}, [], _buffers(index, 400))
+    entries = sorted(path for path in tmp_path.iterdir())
+    sizes = {entry.name: sum(f.stat().st_size for f in entry.iterdir()) for entry in entries}
+    for age, entry in enumerate(entries):
+        os.utime(entry / "meta.json", (1000 + age, 1000 + age))
+    # A hit refreshes the entry, so the oldest-but-used one survives.
+    assert cache.load("part", _builder, "plan0", _always) is not None
+
+    cache.max_bytes = sum(sizes.values()) - 1
+    removed = cache.evict()
+    assert removed == [entries[1].name]
+    cache.max_bytes = sizes[entries[0].name]
+    cache.evict()
+    assert [path.name for path in tmp_path.iterdir()] == [entries[0].name]
+
+
+def test_damaged_entries_miss_and_are_rewritten(tmp_path):
+    cache = ComponentCache(tmp_path, 1 << 20)
+    cache.store("part", _builder, "plan0", {"x": 1}, [], _buffers(0, 400))
+    entry, = tmp_path.iterdir()
+    array = entry / "0.vertices.npy"
+    array.write_bytes(array.read_bytes()[:200])
+    assert cache.load("part", _builder, "plan0", _always) is None
+    assert not entry.exists()
+
+    cache.store("part", _builder, "plan0", {"x": 1}, [], _buffers(0, 400))
+    (entry / "meta.json").write_text("{not json", encoding="utf-8")
+    assert cache.load("part", _builder, "plan0", _always) is None
+    cache.store("part", _builder, "plan0", {"x": 1}, [], _buffers(0, 400))
+    assert cache.load("part", _builder, "plan0", _always) is not None
+
+
+def test_staging_directories_are_ignored(tmp_path):
+    cache = ComponentCache(tmp_path, 0)
+    (tmp_path / ".part-partial.123").mkdir()
+    (tmp_path / ".part-partial.123" / "0.vertices.npy").write_bytes(b"partial")
+    assert cache.load("part", _builder, "plan0", _always) is None
+    assert cache.evict() == []
+
+
+def test_from_config():
+    assert ComponentCache.from_config({"component_cache_dir": ""}) is None
+    assert ComponentCache.from_config({"component_cache_mb": 0}) is None
+    cache = ComponentCache.from_config({"component_cache_dir": "/tmp/x", "component_cache_mb": 2})
+    assert cache.max_bytes == 2 * 1024 * 1024
+
+
+def _arrays(model):
+    return [(c, m, np.asarray(v).tolist(), np.asarray(f).tolist()) for c, m, v, f in model_buffers(model)]
+
+
+def test_builder_reuses_disk_cache_and_invalidates_on_config(tmp_path):
+    config = _default_config(tmp_path)
+    plan = build_plan(config)
+    expected = _arrays(build_model(plan, config))
+    names = [name for name, _builder in MODEL_COMPONENTS]
+
+    first = IncrementalModelBuilder()
+    assert _arrays(first.build(plan, config)) == expected
+    assert first.last_rebuilt == names
+
+    second = IncrementalModelBuilder()
+    assert _arrays(second.build(plan, config)) == expected
+    assert second.last_loaded == names and second.last_rebuilt == []
+
+    edited = dict(config, upper_ground=config["upper_ground"] + 1.0)
+    third = IncrementalModelBuilder()
+    model = third.build(plan, edited)
+    assert third.last_rebuilt and set(third.last_rebuilt) < set(names)
+    assert _arrays(model) == _arrays(build_model(plan, edited))
+
+
+@pytest.mark.parametrize("size_mb", [0, 0.01])
+def test_builder_respects_cache_size(tmp_path, size_mb):
+    config = dict(_default_config(tmp_path), component_cache_mb=size_mb)
+    plan = build_plan(config)
+    IncrementalModelBuilder().build(plan, config)
+    root = tmp_path / "cache"
+    total = sum(f.stat().st_size for f in root.rglob("*") if f.is_file()) if root.exists() else 0
+    assert total <= size_mb * 1024 * 1024
@@ -0,0 +1,52 @@
+"""EdgeIndex: tolerant, direction-free membership for wall skip edges."""
+
+from src.model import SKIP_EDGE_TOLERANCE, EdgeIndex
+
+
+def test_membership_is_undirected_and_tolerant():
+    index = EdgeIndex([((0.0, 0.0), (10.0, 0.0))])
+    eps = SKIP_EDGE_TOLERANCE * 0.5
+    assert ((0.0, 0.0), (10.0, 0.0)) in index
+    assert ((10.0, 0.0), (0.0, 0.0)) in index
+    assert ((eps, -eps * 0.5), (10.0 - eps * 0.5, eps)) in index
+    assert ((0.0, 0.0), (10.0 + 2 * SKIP_EDGE_TOLERANCE, 0.0)) not in index
+    assert ((0.0, 0.0), (0.0, 10.0)) not in index
+    assert len(index) == 1
+
+
+def test_matches_across_cell_boundaries():
+    tol = SKIP_EDGE_TOLERANCE
+    # Endpoints just either side of a grid line still match.
+    index = EdgeIndex([((tol * 5 - 1e-9, 0.0), (1.0, 1.0))])
+    assert ((tol * 5 + 1e-9, 0.0), (1.0, 1.0)) in index
+
+
+def test_query_near_two_stored_points():
+    tol = SKIP_EDGE_TOLERANCE
+    a, b = (0.0, 0.0), (1.2 * tol, 0.0)
+    index = EdgeIndex([(a, (5.0, 0.0)), (b, (0.0, 5.0))])
+    # The query endpoint is within tolerance of both a and b (nearer to b),
+    # so both edges must still be found whatever the insertion order.
+    query = (0.7 * tol, 0.0)
+    assert (query, (5.0, 0.0)) in index
+    assert (query, (0.0, 5.0)) in index
+    reverse = EdgeIndex([(b, (0.0, 5.0)), (a, (5.0, 0.0))])
+    assert (query, (5.0, 0.0)) in reverse
+    assert (query, (0.0, 5.0)) in reverse
+
+
+def test_new_endpoint_joins_nearest_point():
+    tol = SKIP_EDGE_TOLERANCE
+    index = EdgeIndex([((0.0, 0.0), (5.0, 0.0)), ((1.2 * tol, 0.0), (0.0, 5.0))])
+    # (0.7 tol, 0) is nearer to the second stored point, so this edge reuses it.
+    index.add((0.7 * tol, 0.0), (9.0, 9.0))
+    assert ((1.2 * tol, 0.0), (9.0, 9.0)) in index
+    assert ((-0.5 * tol, 0.0), (9.0, 9.0)) not in index
+
+
+def test_coerce():
+    assert EdgeIndex.coerce(None) is None
+    assert EdgeIndex.coerce([]) is None
+    index = EdgeIndex([((0.0, 0.0), (1.0, 0.0))])
+    assert EdgeIndex.coerce(index) is index
+    assert ((1.0, 0.0), (0.0, 0.0)) in EdgeIndex.coerce([((0.0, 0.0), (1.0, 0.0))])
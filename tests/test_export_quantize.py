@@ -0,0 +1,66 @@
+"""KHR_mesh_quantization export must not ship faces turned inside out."""
+
+import json
+
+import numpy as np
+
+from src.export import reversed_faces, write_glb
+from src.glb_io import read_glb
+from src.main import DEFAULT_CONFIG_PATH
+from src.model import ModelData, build_model
+from src.plan import build_plan
+
+
+def test_reversed_faces_detects_fold():
+    quantized = np.array([[0, 0, 0, 0], [10, 0, 0, 0], [5, 1, 0, 0], [5, -1, 0, 0]], dtype=np.int16)
+    normals = np.tile([0.0, 0.0, 1.0], (4, 1))
+    faces = np.array([[0, 1, 2], [0, 1, 3]])
+    np.testing.assert_array_equal(reversed_faces(quantized, normals, faces), [False, True])
+
+
+def _shipped_faces(path):
+    """``{node name: (faces, quantized)}`` checked for reversed faces on the way."""
+    shipped = {}
+    with read_glb(path) as glb:
+        for node in glb.gltf["nodes"]:
+            faces = 0
+            quantized = False
+            for primitive in glb.gltf["meshes"][node["mesh"]]["primitives"]:
+                accessor = primitive["attributes"]["POSITION"]
+                quantized |= glb.gltf["accessors"][accessor]["componentType"] != 5126
+                positions = glb.accessor(accessor).astype(np.float64)
+                normals = glb.accessor_float(primitive["attributes"]["NORMAL"])
+                indices = glb.accessor(primitive["indices"]).astype(np.int64).reshape(-1, 3)
+                assert not reversed_faces(positions, normals, indices).any()
+                faces += indices.shape[0]
+            shipped[node["name"]] = (faces, quantized)
+    return shipped
+
+
+def test_flipped_component_falls_back_to_float32(tmp_path):
+    model = ModelData()
+    # Both components span 1310.68 ft, a 0.02 ft grid centred on the origin.
+    # Rounding moves the sliver's apex below its base edge (y 0.0095 -> 0,
+    # 0.0185 -> 0.02), so its winding reverses; "flat" has no slivers.
+    slab = [(-655.34, -100.0, 0.0), (655.34, -100.0, 0.0), (0.0, 100.0, 0.0)]
+    model.add_triangles("concrete", [slab], component="flat")
+    model.add_triangles("concrete", [slab, [(0.0, 0.0, 0.0), (2.0, 0.0185, 0.0), (1.0, 0.0095, 0.0)]], component="sliver")
+    path = tmp_path / "sliver.glb"
+    report = write_glb(model, path, feet_to_meters=False, quantize=True)
+    assert report["flipped"] == {"sliver": 1}
+    assert set(report["float32"]) == {"sliver"}
+    assert set(report["quantized"]) == {"flat"}
+    assert _shipped_faces(path) == {"flat": (1, True), "sliver": (2, False)}
+
+
+def test_default_quantized_export_keeps_every_face(tmp_path):
+    config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    model = build_model(build_plan(config), config)
+    path = tmp_path / "quantized.glb"
+    report = write_glb(model, path, quantize=True, quantize_tolerance=config["glb_quantize_tolerance_ft"])
+    assert report["quantized"]
+    assert set(report["flipped"]) <= set(report["float32"])
+
+    shipped = _shipped_faces(path)
+    assert sum(faces for faces, _quantized in shipped.values()) == model.triangle_count()
+    assert {name for name, (_faces, quantized) in shipped.items() if not quantized} == set(report["float32"])
@@ -0,0 +1,110 @@
+"""Reading exported GLBs back through src/glb_io.py."""
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from src.export import write_glb
+from src.glb_io import read_glb, read_model, validate_glb
+from src.main import DEFAULT_CONFIG_PATH
+from src.model import build_model
+from src.plan import build_plan
+
+ROTATE_X = -90.0
+
+
+@pytest.fixture(scope="module")
+def default_model():
+    config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    return build_model(build_plan(config), config)
+
+
+def _areas(tris: np.ndarray) -> np.ndarray:
+    return 0.5 * np.linalg.norm(np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0]), axis=1)
+
+
+@pytest.mark.parametrize(
+    "options, tolerance",
+    [
+        ({}, 1e-4),
+        ({"weld": True}, 1e-4),
+        ({"quantize": True}, None),
+        ({"weld": True, "quantize": True}, None),
+    ],
+    ids=["float32", "welded", "quantized", "welded-quantized"],
+)
+def test_read_model_round_trip(default_model, tmp_path, options, tolerance):
+    path = tmp_path / "model.glb"
+    report = write_glb(default_model, path, rotate_x_deg=ROTATE_X, **options)
+    if tolerance is None:
+        tolerance = report["max_error_ft"] + 1e-4
+
+    with read_glb(path) as glb:
+        assert validate_glb(glb) == []
+        back = read_model(glb, rotate_x_deg=ROTATE_X).triangles_by_component
+
+    expected = default_model.triangles_by_component
+    assert back.keys() == expected.keys()
+    for component, buckets in expected.items():
+        assert back[component].keys() == buckets.keys()
+        for material, buffer in buckets.items():
+            # Face order and corner order survive every export mode but the vertex cache.
+            np.testing.assert_allclose(back[component][material].array, buffer.array, rtol=0.0, atol=tolerance)
+
+
+def test_read_model_vertex_cache_order(default_model, tmp_path):
+    path = tmp_path / "cache.glb"
+    write_glb(default_model, path, rotate_x_deg=ROTATE_X, weld=True, optimize_cache=True)
+    with read_glb(path) as glb:
+        assert validate_glb(glb) == []
+        back = read_model(glb, rotate_x_deg=ROTATE_X).triangles_by_component
+    for component, buckets in default_model.triangles_by_component.items():
+        for material, buffer in buckets.items():
+            tris = back[component][material].array
+            assert tris.shape == buffer.array.shape
+            assert _areas(tris).sum() == pytest.approx(_areas(buffer.array).sum(), rel=1e-5)
+
+
+def test_accessors_are_zero_copy_views(default_model, tmp_path):
+    path = tmp_path / "model.glb"
+    write_glb(default_model, path, weld=True, quantize=True)
+    with read_glb(path) as glb:
+        gltf = glb.gltf
+        primitive = gltf["meshes"][0]["primitives"][0]
+        positions = glb.accessor(primitive["attributes"]["POSITION"])
+        indices = glb.accessor(primitive["indices"])
+        # int16 xyz in stride-8 rows, read in place from the mapped file.
+        assert positions.dtype == np.int16 and positions.strides == (8, 2)
+        assert not positions.flags.writeable and not positions.flags.owndata
+        assert indices.dtype == np.uint16
+        normals = glb.accessor_float(primitive["attributes"]["NORMAL"])
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, atol=0.02)
+        del positions, indices
+
+
+def test_validate_glb_reports_bad_indices(default_model, tmp_path):
+    path = tmp_path / "model.glb"
+    write_glb(default_model, path, weld=True)
+    with read_glb(path) as glb:
+        index_accessor = glb.gltf["accessors"][glb.gltf["meshes"][0]["primitives"][0]["indices"]]
+        view = glb.gltf["bufferViews"][index_accessor["bufferView"]]
+        offset = glb.bin_offset + view.get("byteOffset", 0) + index_accessor.get("byteOffset", 0)
+        width = 2 if index_accessor["componentType"] == 5123 else 4
+    data = bytearray(path.read_bytes())
+    data[offset : offset + width] = b"\xfe" * width
+    path.write_bytes(bytes(data))
+    with read_glb(path) as glb:
+        issues = validate_glb(glb)
+    assert any("out of range" in issue for issue in issues)
+
+
+def test_read_glb_rejects_non_glb(tmp_path):
+    path = tmp_path / "broken.glb"
+    path.write_bytes(b"not a glb file at all")
+    with pytest.raises(ValueError):
+        read_glb(path)
+    path.write_bytes(struct.pack("<4sII", b"glTF", 2, 1000) + b"\0" * 16)
+    with pytest.raises(ValueError):
+        read_glb(path)
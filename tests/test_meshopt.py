@@ -0,0 +1,156 @@
+"""Round trips through the EXT_meshopt_compression codecs in src/meshopt.py."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.export import write_glb
+from src.glb_io import read_glb, read_model, validate_glb
+from src.main import DEFAULT_CONFIG_PATH
+from src.meshopt import (
+    _vertex_block_size,
+    decode_filter_oct,
+    decode_index_buffer,
+    decode_vertex_buffer,
+    encode_filter_oct,
+    encode_index_buffer,
+    encode_vertex_buffer,
+)
+from src.model import build_model
+from src.plan import build_plan
+
+
+def _canonical(triangles: np.ndarray) -> np.ndarray:
+    """Rotate each triangle to start at its smallest index (winding kept)."""
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    start = np.argmin(triangles, axis=1)
+    order = (start[:, None] + np.arange(3)) % 3
+    return np.take_along_axis(triangles, order, axis=1)
+
+
+@pytest.mark.parametrize("stride", [4, 8, 12, 16, 64, 256])
+def test_vertex_buffer_round_trip(stride):
+    rng = np.random.default_rng(stride)
+    block = _vertex_block_size(stride)
+    for count in (0, 1, 15, 17, block, block + 5, 2 * block + 33):
+        # Mix smooth and noisy bytes so every group encoding gets used.
+        smooth = np.cumsum(rng.integers(-2, 3, size=(count, stride)), axis=0)
+        noisy = rng.integers(0, 256, size=(count, stride))
+        data = np.where(rng.random((count, stride)) < 0.7, smooth, noisy).astype(np.uint8)
+        packed = encode_vertex_buffer(data)
+        np.testing.assert_array_equal(decode_vertex_buffer(packed, count, stride), data)
+
+
+def test_vertex_buffer_rejects_bad_stride():
+    with pytest.raises(ValueError):
+        encode_vertex_buffer(np.zeros((4, 6), dtype=np.uint8))
+
+
+def _grid_triangles(width: int, height: int) -> np.ndarray:
+    rows, cols = np.meshgrid(np.arange(height - 1), np.arange(width - 1), indexing="ij")
+    a = (rows * width + cols).ravel()
+    b, c, d = a + 1, a + width + 1, a + width
+    return np.stack([np.stack([a, b, c], axis=1), np.stack([a, c, d], axis=1)], axis=1).reshape(-1, 3)
+
+
+def test_index_buffer_round_trip_grid():
+    triangles = _grid_triangles(20, 15)
+    decoded = decode_index_buffer(encode_index_buffer(triangles), triangles.size)
+    np.testing.assert_array_equal(_canonical(decoded), _canonical(triangles))
+
+
+def test_index_buffer_round_trip_repeated_and_rotated():
+    rng = np.random.default_rng(7)
+    base = _grid_triangles(6, 6)
+    picks = rng.integers(0, base.shape[0], size=300)
+    rotations = rng.integers(0, 3, size=300)
+    triangles = np.take_along_axis(base[picks], (rotations[:, None] + np.arange(3)) % 3, axis=1)
+    # Exact repeats, a restart at 0-1-2 and indices that need the free encoding.
+    triangles = np.concatenate([triangles, triangles[:10], [[0, 1, 2]], [[70000, 5, 123456]], triangles[-5:]])
+    decoded = decode_index_buffer(encode_index_buffer(triangles), triangles.size)
+    np.testing.assert_array_equal(_canonical(decoded), _canonical(triangles))
+
+
+def test_index_buffer_rejects_partial_triangle():
+    with pytest.raises(ValueError):
+        encode_index_buffer(np.arange(4))
+
+
+def test_filter_oct_round_trip():
+    rng = np.random.default_rng(3)
+    normals = rng.normal(size=(2000, 3))
+    normals = np.concatenate([normals, np.eye(3), -np.eye(3)])
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    decoded = decode_filter_oct(encode_filter_oct(normals))
+    assert np.all(decoded[:, 3] == 0)
+    restored = decoded[:, :3].astype(np.float64)
+    restored /= np.linalg.norm(restored, axis=1, keepdims=True)
+    # int8 octahedral coordinates are good to about a degree.
+    assert np.min(np.einsum("ij,ij->i", restored, normals)) > np.cos(np.radians(1.5))
+    np.testing.assert_array_equal(decoded[-6:, :3], np.round(np.concatenate([np.eye(3), -np.eye(3)]) * 127))
+
+
+@pytest.fixture(scope="module")
+def default_model():
+    config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    return build_model(build_plan(config), config)
+
+
+def _primitives(glb):
+    gltf = glb.gltf
+    for node in gltf["nodes"]:
+        if "mesh" not in node:
+            continue
+        for primitive in gltf["meshes"][node["mesh"]]["primitives"]:
+            yield node["name"], primitive
+
+
+def test_write_glb_compress_round_trip(default_model, tmp_path):
+    plain_path = tmp_path / "plain.glb"
+    packed_path = tmp_path / "packed.glb"
+    plain_report = write_glb(default_model, plain_path, quantize=True)
+    packed_report = write_glb(default_model, packed_path, compress=True)
+    assert packed_report["meshopt"]["bytes"] < plain_path.stat().st_size
+    assert packed_report["quantized"] == plain_report["quantized"]
+
+    with read_glb(plain_path) as plain, read_glb(packed_path) as packed:
+        assert "EXT_meshopt_compression" in packed.gltf["extensionsRequired"]
+        assert validate_glb(packed) == []
+        pairs = list(zip(_primitives(plain), _primitives(packed)))
+        assert len(pairs) == sum(1 for _ in _primitives(plain)) == sum(1 for _ in _primitives(packed))
+        for (name, expected), (packed_name, actual) in pairs:
+            assert packed_name == name
+            positions = expected["attributes"]["POSITION"]
+            np.testing.assert_array_equal(
+                packed.accessor(actual["attributes"]["POSITION"]), plain.accessor(positions)
+            )
+            normals_expected = plain.accessor_float(expected["attributes"]["NORMAL"])
+            normals_actual = packed.accessor_float(actual["attributes"]["NORMAL"])
+            np.testing.assert_allclose(normals_actual, normals_expected, atol=2.5 / 127.0)
+            if "indices" in expected:
+                np.testing.assert_array_equal(
+                    _canonical(packed.accessor(actual["indices"])),
+                    _canonical(plain.accessor(expected["indices"])),
+                )
+
+
+def test_write_glb_compress_matches_float_export(default_model, tmp_path):
+    float_path = tmp_path / "float.glb"
+    packed_path = tmp_path / "packed.glb"
+    write_glb(default_model, float_path)
+    report = write_glb(default_model, packed_path, compress=True)
+
+    with read_glb(float_path) as plain, read_glb(packed_path) as packed:
+        expected = read_model(plain).triangles_by_component
+        actual = read_model(packed).triangles_by_component
+    assert actual.keys() == expected.keys()
+    for component, buckets in expected.items():
+        assert actual[component].keys() == buckets.keys()
+        for material, buffer in buckets.items():
+            assert len(actual[component][material]) == len(buffer)
+            low, high = buffer.vertices.min(axis=0), buffer.vertices.max(axis=0)
+            packed_vertices = actual[component][material].vertices
+            bound = report["max_error_ft"] + 1e-4
+            np.testing.assert_allclose(packed_vertices.min(axis=0), low, rtol=0.0, atol=bound)
+            np.testing.assert_allclose(packed_vertices.max(axis=0), high, rtol=0.0, atol=bound)
@@ -0,0 +1,45 @@
+"""Parallel component builds must match the serial build byte for byte."""
+
+import json
+
+from src.export import write_glb
+from src.main import DEFAULT_CONFIG_PATH
+from src.model import ComponentPool, build_model
+from src.plan import build_plan
+from src.stages import IncrementalModelBuilder
+
+
+def _config():
+    return json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+
+
+def _glb_bytes(model, path):
+    write_glb(model, path, rotate_x_deg=-90.0)
+    return path.read_bytes()
+
+
+def test_parallel_build_is_byte_identical(tmp_path):
+    config = _config()
+    plan = build_plan(config)
+    serial = _glb_bytes(build_model(plan, config, workers=1), tmp_path / "serial.glb")
+    # A temporary pool, then one pool reused for two models.
+    assert _glb_bytes(build_model(plan, config, workers=2), tmp_path / "temporary.glb") == serial
+    with ComponentPool(2) as pool:
+        for run in range(2):
+            assert _glb_bytes(build_model(plan, config, workers=2, pool=pool), tmp_path / f"pool{run}.glb") == serial
+    assert pool._executor is None
+
+
+def test_incremental_builder_owns_its_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.model.os.cpu_count", lambda: 2)
+    config = dict(_config(), model_workers=2, component_cache_dir="")
+    plan = build_plan(config)
+    serial = _glb_bytes(build_model(plan, config, workers=1), tmp_path / "serial.glb")
+
+    builder = IncrementalModelBuilder()
+    try:
+        assert _glb_bytes(builder.build(plan, config), tmp_path / "parallel.glb") == serial
+        assert builder._pool is not None and builder._pool.workers == 2
+    finally:
+        builder.close()
+    assert builder._pool is None
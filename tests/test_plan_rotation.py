@@ -0,0 +1,50 @@
+"""The analytic and batch rotation solvers must land where the reference scan does."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.plan import build_plan
+from src.plan_batch import build_plans_batch
+
+# Scan refinement stops at ternary-search precision; a mirror-root pick is off
+# by tens of feet, so anything below this is agreement.
+VERTEX_TOLERANCE_FT = 1e-6
+
+
+def _configs():
+    rng = random.Random(20260)
+    configs = [(rng.uniform(10.0, 40.0), rng.uniform(2.0, 15.0), rng.uniform(0.0, 3.0)) for _ in range(60)]
+    configs += [(float(s), float(d), 1.0) for s in range(18, 31, 2) for d in range(2, 8)]
+    return configs
+
+
+CONFIGS = _configs()
+
+
+def _master_triangle(s, d, down_shift, solver):
+    plan = build_plan(
+        {
+            "s": s,
+            "d": d,
+            "triangle_plan_down_shift_ft": down_shift,
+            "triangle_rotation_solver": solver,
+        }
+    )
+    return np.array(plan.master_triangle)
+
+
+@pytest.mark.parametrize("s,d,down_shift", CONFIGS)
+def test_analytic_matches_scan(s, d, down_shift):
+    analytic = _master_triangle(s, d, down_shift, "analytic")
+    scan = _master_triangle(s, d, down_shift, "scan")
+    np.testing.assert_allclose(analytic, scan, rtol=0.0, atol=VERTEX_TOLERANCE_FT)
+
+
+def test_batch_matches_build_plan():
+    s, d, down_shift = (np.array(column) for column in zip(*CONFIGS))
+    batch = build_plans_batch(s, d, 0.0, down_shift)
+    for row, config in enumerate(CONFIGS):
+        expected = _master_triangle(*config, "analytic")
+        np.testing.assert_allclose(batch.master_triangle[row], expected, rtol=0.0, atol=1e-9)
@@ -0,0 +1,87 @@
+"""Adaptive terrain meshing in src/terrain.py: the triangle cap and exact clipping."""
+
+import json
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Polygon, box
+
+from src import terrain
+from src.main import DEFAULT_CONFIG_PATH
+from src.model import build_model
+from src.plan import build_plan
+from src.terrain import TerrainMeshSettings, mesh_terrain
+
+ORIGIN = (-200.0, -200.0)
+SIZE = 400.0
+HOLES = [
+    Polygon([(30 * np.cos(a), 30 * np.sin(a)) for a in np.radians(np.arange(0, 360, 60))]),
+    box(60, -150, 140, -90),
+    # Reaches the square's edge, so the outline follows the cut.
+    box(-200, 100, -120, 160),
+]
+AREA = box(-200, -200, 200, 200).difference(shapely.union_all(HOLES))
+
+
+def _height(points: np.ndarray) -> np.ndarray:
+    x, y = points[:, 0], points[:, 1]
+    return 0.02 * x + 4.0 * np.exp(-((x - 90) ** 2 + (y - 60) ** 2) / 900.0)
+
+
+def _signed_areas(tris: np.ndarray) -> np.ndarray:
+    a, b, c = tris[:, 0], tris[:, 1], tris[:, 2]
+    return 0.5 * ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+
+
+@pytest.mark.parametrize("max_triangles, reserved", [(150, 0), (400, 60), (800, 0), (3000, 200)])
+def test_mesh_respects_triangle_cap(max_triangles, reserved):
+    settings = TerrainMeshSettings(min_edge=8.0, max_edge=80.0, max_triangles=max_triangles)
+    mesh = mesh_terrain(ORIGIN, SIZE, AREA, _height, settings, reserved)
+    count = mesh.faces.shape[0] + 2 * mesh.outline.shape[0] + reserved
+    assert count <= max_triangles
+    # The cap is spent, not just respected: small caps are far from unrefined.
+    assert count > 0.5 * max_triangles
+
+
+def test_mesh_clips_holes_exactly():
+    settings = TerrainMeshSettings(min_edge=8.0, max_edge=80.0, max_triangles=1500)
+    mesh = mesh_terrain(ORIGIN, SIZE, AREA, _height, settings)
+    tris = mesh.vertices[:, :2][mesh.faces]
+    areas = _signed_areas(tris)
+    assert np.all(areas > 0)
+    assert areas.sum() == pytest.approx(AREA.area, rel=1e-9)
+    covered = shapely.union_all(shapely.polygons(tris))
+    assert covered.symmetric_difference(AREA).area == pytest.approx(0.0, abs=1e-6)
+    centroids = shapely.points(tris.mean(axis=1))
+    for hole in HOLES:
+        assert not shapely.within(centroids, hole).any()
+    np.testing.assert_allclose(mesh.vertices[:, 2], _height(mesh.vertices[:, :2]))
+
+
+def test_mesh_refines_once(monkeypatch):
+    calls = []
+    refine = terrain._refine
+
+    def counting(*args):
+        calls.append(args[-1])
+        return refine(*args)
+
+    monkeypatch.setattr(terrain, "_refine", counting)
+    settings = TerrainMeshSettings(min_edge=8.0, max_edge=80.0, max_triangles=300)
+    mesh_terrain(ORIGIN, SIZE, AREA, _height, settings)
+    assert len(calls) == 1
+
+
+def test_cap_below_coarsest_mesh_raises():
+    settings = TerrainMeshSettings(max_triangles=20)
+    with pytest.raises(ValueError, match="terrain_max_triangles=20"):
+        mesh_terrain(ORIGIN, SIZE, AREA, _height, settings)
+
+
+def test_default_ground_fits_cap():
+    config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+    config["model_workers"] = 1
+    model = build_model(build_plan(config), config)
+    ground = sum(len(buffer) for buffer in model.triangles_by_component["ground"].values())
+    assert ground <= config["terrain_max_triangles"]
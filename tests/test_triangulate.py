@@ -0,0 +1,71 @@
+"""Polygon triangulation in src/triangulate.py."""
+
+import numpy as np
+import pytest
+import shapely
+import shapely.affinity
+from shapely.geometry import Polygon, box
+
+from src.triangulate import triangulate_polygon, triangulate_polygons
+
+
+def _signed_areas(xy: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    a, b, c = xy[faces[:, 0]], xy[faces[:, 1]], xy[faces[:, 2]]
+    return 0.5 * ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+
+
+def _check(poly: Polygon, xy: np.ndarray, faces: np.ndarray) -> None:
+    areas = _signed_areas(xy, faces)
+    assert faces.dtype == np.int64 and np.all(areas > 0)
+    assert areas.sum() == pytest.approx(poly.area, rel=1e-12)
+    # Faces cover the polygon exactly: their union is the polygon, holes excluded.
+    union = shapely.union_all(shapely.polygons(xy[faces]))
+    assert union.symmetric_difference(poly).area == pytest.approx(0.0, abs=1e-9 * poly.area)
+    # No Steiner points: every vertex comes from one of the rings.
+    ring_points = {tuple(p) for p in shapely.get_coordinates(poly).tolist()}
+    assert {tuple(p) for p in xy.tolist()} <= ring_points
+
+
+HEX = Polygon([(np.cos(a), np.sin(a)) for a in np.radians(np.arange(0, 360, 60))])
+L_SHAPE = Polygon([(0, 0), (4, 0), (4, 1), (1, 1), (1, 3), (0, 3)])
+
+POLYGONS = {
+    "convex": HEX,
+    "clockwise": Polygon(list(HEX.exterior.coords)[::-1]),
+    "concave": L_SHAPE,
+    "collinear": Polygon([(0, 0), (1, 0), (2, 0), (3, 0), (3, 2), (3, 3), (0, 3), (0, 1.5)]),
+    "duplicate-points": Polygon([(0, 0), (2, 0), (2, 0), (2, 2), (1, 3), (1, 3), (0, 2)]),
+    "hole": box(0, 0, 10, 10).difference(box(3, 3, 6, 6)),
+    "holes": box(0, 0, 10, 10).difference(
+        shapely.union_all([box(1, 1, 3, 3), shapely.affinity.translate(HEX, 5, 4), box(6, 6, 9, 8)])
+    ),
+    "hole-touching-shell": Polygon([(0, 0), (6, 0), (6, 6), (0, 6)], [[(3, 0), (4, 2), (2, 2)]]),
+}
+
+
+@pytest.mark.parametrize("poly", POLYGONS.values(), ids=POLYGONS.keys())
+def test_triangulate_polygon_covers_polygon(poly):
+    _check(poly, *triangulate_polygon(poly))
+
+
+def test_convex_fan_uses_ring_vertices_in_order():
+    xy, faces = triangulate_polygon(HEX)
+    np.testing.assert_array_equal(xy, shapely.get_coordinates(HEX.exterior)[:-1])
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 5]]
+
+
+def test_triangulate_polygons_batches():
+    polys = list(POLYGONS.values())
+    flat = Polygon([(0, 0), (1, 1), (2, 2)])
+    batched = triangulate_polygons(polys[:3] + [flat] + polys[3:])
+    assert len(batched) == len(polys) + 1
+    assert batched.pop(3)[1].shape == (0, 3)
+    for poly, (xy, faces) in zip(polys, batched):
+        _check(poly, xy, faces)
+    assert triangulate_polygons([]) == []
+
+
+def test_degenerate_polygons_give_no_faces():
+    for poly in (Polygon(), Polygon([(0, 0), (1, 1), (2, 2)])):
+        xy, faces = triangulate_polygon(poly)
+        assert faces.shape == (0, 3)